@@ -1,7 +1,28 @@
 import sqlite3
 import os
+import calendar
+import zlib
 import bcrypt
-from datetime import datetime
+from datetime import datetime, timedelta
+from config.settings import AppSettings
+from services.sql_trace import SqlTrace
+from services.metrics import BCRYPT_SECONDS
+
+# Values indexed in users_fts for a users row; phone is indexed as typed and as bare digits
+USER_SEARCH_VALUES = """
+    {row}.username, {row}.email, {row}.first_name, {row}.last_name,
+    coalesce({row}.phone, '') || ' ' || replace(replace(replace(replace(replace(replace(
+        coalesce({row}.phone, ''), ' ', ''), '-', ''), '(', ''), ')', ''), '.', ''), '+', ''),
+    {row}.user_type
+"""
+
+def compress_text(text):
+    """Compress text for the notification archive (SQL function compress_text)"""
+    return zlib.compress(text.encode('utf-8')) if text is not None else None
+
+def decompress_text(data):
+    """Reverse compress_text"""
+    return zlib.decompress(data).decode('utf-8') if data is not None else None
 
 class DatabaseManager:
     def __init__(self, db_path="fitness_system.db"):
@@ -10,7 +31,7 @@ class DatabaseManager:
     
     def get_connection(self):
         if self.connection is None:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.connection = SqlTrace.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row
         return self.connection
     
@@ -18,6 +39,7 @@ class DatabaseManager:
         """Create all necessary tables"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        self.enable_incremental_vacuum(cursor)
         
         # Users table
         cursor.execute('''
@@ -37,6 +59,16 @@ class DatabaseManager:
             )
         ''')
         
+        # Admin user list browses by type and name
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_users_type_name
+            ON users (user_type, first_name, last_name)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_users_name
+            ON users (first_name, last_name)
+        ''')
+        
         # Member profiles
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS member_profiles (
@@ -84,6 +116,7 @@ class DatabaseManager:
                 FOREIGN KEY (trainer_id) REFERENCES users (id)
             )
         ''')
+        self.create_created_epoch_column(cursor, 'workouts', ['member_id', 'trainer_id'])
         
         # Sessions table
         cursor.execute('''
@@ -102,6 +135,11 @@ class DatabaseManager:
                 FOREIGN KEY (trainer_id) REFERENCES users (id)
             )
         ''')
+        self.create_session_time_index(cursor)
+        self.create_change_seq_column(cursor, 'sessions',
+                                      ['member_id', 'trainer_id', 'session_date', 'duration',
+                                       'session_type', 'status', 'price', 'notes'],
+                                      ['member_id', 'trainer_id'])
         
         # Classes table
         cursor.execute('''
@@ -118,6 +156,32 @@ class DatabaseManager:
                 FOREIGN KEY (trainer_id) REFERENCES users (id)
             )
         ''')
+        # Recurring schedules without a start date count their periods from here
+        if self.add_column_if_missing(cursor, 'classes', 'created_at', 'TIMESTAMP'):
+            cursor.execute("UPDATE classes SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+        
+        # Materialized class times for the upcoming weeks (see ClassOccurrence.refresh)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS class_occurrences (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                class_id INTEGER NOT NULL,
+                trainer_id INTEGER,
+                start_epoch INTEGER NOT NULL,
+                end_epoch INTEGER NOT NULL,
+                status TEXT DEFAULT 'scheduled',
+                UNIQUE (class_id, start_epoch),
+                FOREIGN KEY (class_id) REFERENCES classes (id),
+                FOREIGN KEY (trainer_id) REFERENCES users (id)
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_class_occurrences_time
+            ON class_occurrences (start_epoch, end_epoch, trainer_id, status)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_class_occurrences_trainer_time
+            ON class_occurrences (trainer_id, start_epoch, end_epoch, status)
+        ''')
         
         # Class enrollments
         cursor.execute('''
@@ -131,6 +195,7 @@ class DatabaseManager:
                 FOREIGN KEY (member_id) REFERENCES users (id)
             )
         ''')
+        self.create_enrollment_counters(cursor)
         
         # Notifications table
         cursor.execute('''
@@ -145,6 +210,15 @@ class DatabaseManager:
                 FOREIGN KEY (user_id) REFERENCES users (id)
             )
         ''')
+        self.create_created_epoch_column(cursor, 'notifications', ['user_id'])
+        self.create_notification_counters(cursor)
+        self.create_email_outbox(cursor)
+        
+        # Retention finds old read notifications by age (see Notification.archive_old)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_notifications_read_created
+            ON notifications (created_epoch) WHERE is_read = 1
+        ''')
         
         # Progress tracking
         cursor.execute('''
@@ -176,9 +250,454 @@ class DatabaseManager:
             )
         ''')
         
+        # Normalized muscle group tags (one row per exercise and muscle group)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS exercise_muscle_groups (
+                exercise_id INTEGER NOT NULL,
+                muscle_group TEXT NOT NULL,
+                PRIMARY KEY (exercise_id, muscle_group),
+                FOREIGN KEY (exercise_id) REFERENCES exercises (id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_exercise_muscle_groups_group
+            ON exercise_muscle_groups (muscle_group, exercise_id)
+        ''')
+        self.backfill_muscle_group_tags(cursor)
+        
+        # Full-text search over the exercise library
+        self.create_exercise_search_index(cursor)
+        
+        # Full-text search over users
+        self.create_user_search_index(cursor)
+        
         conn.commit()
         self.create_default_data()
     
+    def create_exercise_search_index(self, cursor):
+        """Create the exercises FTS5 index and the triggers that keep it in sync"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'exercises_fts'")
+        index_exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS exercises_fts USING fts5(
+                    name, category, muscle_groups, equipment, instructions,
+                    content='exercises', content_rowid='id',
+                    prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite was built without FTS5; Exercise.search falls back to LIKE
+            return
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS exercises_fts_insert AFTER INSERT ON exercises BEGIN
+                INSERT INTO exercises_fts (rowid, name, category, muscle_groups, equipment, instructions)
+                VALUES (new.id, new.name, new.category, new.muscle_groups, new.equipment, new.instructions);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS exercises_fts_delete AFTER DELETE ON exercises BEGIN
+                INSERT INTO exercises_fts (exercises_fts, rowid, name, category, muscle_groups, equipment, instructions)
+                VALUES ('delete', old.id, old.name, old.category, old.muscle_groups, old.equipment, old.instructions);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS exercises_fts_update
+            AFTER UPDATE OF name, category, muscle_groups, equipment, instructions ON exercises BEGIN
+                INSERT INTO exercises_fts (exercises_fts, rowid, name, category, muscle_groups, equipment, instructions)
+                VALUES ('delete', old.id, old.name, old.category, old.muscle_groups, old.equipment, old.instructions);
+                INSERT INTO exercises_fts (rowid, name, category, muscle_groups, equipment, instructions)
+                VALUES (new.id, new.name, new.category, new.muscle_groups, new.equipment, new.instructions);
+            END
+        ''')
+        
+        if not index_exists:
+            # Rank name and category matches above equipment and instruction matches
+            cursor.execute('''
+                INSERT INTO exercises_fts (exercises_fts, rank)
+                VALUES ('rank', 'bm25(10.0, 4.0, 4.0, 2.0, 1.0)')
+            ''')
+            # Index exercises that were created before the search index existed
+            cursor.execute("INSERT INTO exercises_fts (exercises_fts) VALUES ('rebuild')")
+    
+    @staticmethod
+    def to_epoch(value):
+        """Convert a datetime or stored 'YYYY-MM-DD HH:MM:SS' value to integer seconds like strftime('%s')"""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        return calendar.timegm(value.timetuple())
+    
+    @staticmethod
+    def from_epoch(epoch):
+        """Convert integer seconds back to a naive datetime"""
+        return datetime(1970, 1, 1) + timedelta(seconds=epoch)
+    
+    @staticmethod
+    def to_unix_epoch(value):
+        """Convert a local naive datetime to Unix seconds, as stored in created_epoch columns"""
+        return int(value.timestamp())
+    
+    @staticmethod
+    def from_unix_epoch(epoch):
+        """Convert Unix seconds back to a local naive datetime"""
+        return datetime.fromtimestamp(epoch)
+    
+    def enable_incremental_vacuum(self, cursor):
+        """Switch the database to incremental auto-vacuum so archived rows give their pages back"""
+        cursor.execute("PRAGMA auto_vacuum")
+        if cursor.fetchone()[0] != 2:
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # An existing file only changes mode after a full VACUUM; this runs once
+            cursor.execute("VACUUM")
+    
+    def attach_notification_archive(self, path=None):
+        """Attach the notification archive database as 'archive', creating its tables if needed"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA database_list")
+        if any(row['name'] == 'archive' for row in cursor.fetchall()):
+            return conn
+        
+        cursor.execute("ATTACH DATABASE ? AS archive", (path or AppSettings.NOTIFICATION_ARCHIVE_PATH,))
+        conn.create_function('compress_text', 1, compress_text, deterministic=True)
+        
+        # Messages are stored zlib-compressed; titles stay plain for listing
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS archive.archived_notifications (
+                id INTEGER PRIMARY KEY,
+                user_id INTEGER,
+                title TEXT NOT NULL,
+                message BLOB NOT NULL,
+                type TEXT,
+                created_at TIMESTAMP,
+                created_epoch INTEGER,
+                archived_epoch INTEGER
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS archive.idx_archived_notifications_user_created
+            ON archived_notifications (user_id, created_epoch)
+        ''')
+        
+        try:
+            # Contentless, so the archive holds only the index besides the compressed text
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS archive.archived_notifications_fts USING fts5(
+                    title, message, content='', tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite was built without FTS5; Notification.search_archive scans instead
+            pass
+        conn.commit()
+        return conn
+    
+    def add_column_if_missing(self, cursor, table, column, definition):
+        """Add a column to a table created by an older version of the app"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            return True
+        return False
+    
+    def create_session_time_index(self, cursor):
+        """Add integer start/end columns to sessions and the indexes used for overlap checks"""
+        # Wall-clock seconds (session_date is stored as naive local time), kept in sync by triggers
+        self.add_column_if_missing(cursor, 'sessions', 'start_epoch', 'INTEGER')
+        self.add_column_if_missing(cursor, 'sessions', 'end_epoch', 'INTEGER')
+        
+        start_epoch = "CAST(strftime('%s', {row}.session_date) AS INTEGER)"
+        duration_seconds = f"coalesce({{row}}.duration, {AppSettings.SESSION_DURATION_MINUTES}) * 60"
+        new_start = start_epoch.format(row='new')
+        new_end = f"{new_start} + {duration_seconds.format(row='new')}"
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS sessions_epoch_insert AFTER INSERT ON sessions BEGIN
+                UPDATE sessions SET start_epoch = {new_start}, end_epoch = {new_end} WHERE id = new.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS sessions_epoch_update
+            AFTER UPDATE OF session_date, duration ON sessions BEGIN
+                UPDATE sessions SET start_epoch = {new_start}, end_epoch = {new_end} WHERE id = new.id;
+            END
+        ''')
+        
+        # Backfill sessions created before the columns existed
+        cursor.execute(f'''
+            UPDATE sessions
+            SET start_epoch = {start_epoch.format(row='sessions')},
+                end_epoch = {start_epoch.format(row='sessions')} + {duration_seconds.format(row='sessions')}
+            WHERE start_epoch IS NULL AND session_date IS NOT NULL
+        ''')
+        
+        # Covering indexes: overlap checks never touch the table rows
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_trainer_time
+            ON sessions (trainer_id, start_epoch, end_epoch, status)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_member_time
+            ON sessions (member_id, start_epoch, end_epoch, status)
+        ''')
+        # Nightly closeout finds stale scheduled sessions by end time
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_status_end
+            ON sessions (status, end_epoch)
+        ''')
+        # Availability scans one time range across all trainers
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_time
+            ON sessions (start_epoch, end_epoch, trainer_id, status)
+        ''')
+    
+    def create_created_epoch_column(self, cursor, table, owner_columns):
+        """Add an integer created_epoch column mirroring created_at, indexed per owner column"""
+        # created_at defaults to CURRENT_TIMESTAMP (UTC), so this is plain Unix seconds
+        self.add_column_if_missing(cursor, table, 'created_epoch', 'INTEGER')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_created_epoch
+            AFTER INSERT ON {table} WHEN new.created_epoch IS NULL BEGIN
+                UPDATE {table}
+                SET created_epoch = CAST(strftime('%s', coalesce(new.created_at, CURRENT_TIMESTAMP)) AS INTEGER)
+                WHERE id = new.id;
+            END
+        ''')
+        
+        # Backfill rows created before the column existed
+        cursor.execute(f'''
+            UPDATE {table} SET created_epoch = CAST(strftime('%s', created_at) AS INTEGER)
+            WHERE created_epoch IS NULL AND created_at IS NOT NULL
+        ''')
+        
+        for column in owner_columns:
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_{table}_{column}_created
+                ON {table} ({column}, created_epoch)
+            ''')
+    
+    def create_change_seq_column(self, cursor, table, watched_columns, owner_columns):
+        """Add a change_seq column that triggers bump past every other row on insert or update"""
+        # Writes are serialized by SQLite, so change_seq increases in commit order and
+        # "change_seq > last seen" finds exactly the rows written since (see ChangeMonitor)
+        self.add_column_if_missing(cursor, table, 'change_seq', 'INTEGER')
+        cursor.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_{table}_change_seq ON {table} (change_seq)
+        ''')
+        
+        next_seq = f"(SELECT coalesce(max(change_seq), 0) + 1 FROM {table})"
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_change_seq_insert AFTER INSERT ON {table} BEGIN
+                UPDATE {table} SET change_seq = {next_seq} WHERE id = new.id;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_change_seq_update
+            AFTER UPDATE OF {", ".join(watched_columns)} ON {table} BEGIN
+                UPDATE {table} SET change_seq = {next_seq} WHERE id = new.id;
+            END
+        ''')
+        
+        # Rows written before the column existed count as already seen
+        cursor.execute(f"UPDATE {table} SET change_seq = id WHERE change_seq IS NULL")
+        
+        for column in owner_columns:
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS idx_{table}_{column}_change
+                ON {table} ({column}, change_seq)
+            ''')
+    
+    def create_enrollment_counters(self, cursor):
+        """Add per-occurrence seat counters and the enrollment/waitlist indexes"""
+        # Seats are taken with one conditional UPDATE on these counters (see ClassEnrollment.enroll)
+        self.add_column_if_missing(cursor, 'class_occurrences', 'capacity', 'INTEGER')
+        self.add_column_if_missing(cursor, 'class_occurrences', 'enrolled_count', 'INTEGER NOT NULL DEFAULT 0')
+        self.add_column_if_missing(cursor, 'class_occurrences', 'waitlist_count', 'INTEGER NOT NULL DEFAULT 0')
+        
+        # Enrollments are per occurrence; status is 'enrolled', 'waitlisted' or 'cancelled'
+        self.add_column_if_missing(cursor, 'class_enrollments', 'occurrence_id', 'INTEGER REFERENCES class_occurrences (id)')
+        cursor.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_class_enrollments_member
+            ON class_enrollments (occurrence_id, member_id)
+            WHERE status IN ('enrolled', 'waitlisted')
+        ''')
+        # Head of the FIFO waitlist is the first entry of this index
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_class_enrollments_waitlist
+            ON class_enrollments (occurrence_id, id)
+            WHERE status = 'waitlisted'
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_class_enrollments_by_member
+            ON class_enrollments (member_id, status, occurrence_id)
+        ''')
+    
+    def create_notification_counters(self, cursor):
+        """Create the per-user unread notification counters and the triggers that maintain them"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'notification_counters'")
+        counters_exist = cursor.fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS notification_counters (
+                user_id INTEGER PRIMARY KEY,
+                unread_count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        ''')
+        
+        # Every change to an unread row moves its owner's counter, so the badge is one key lookup
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS notifications_unread_insert
+            AFTER INSERT ON notifications WHEN new.user_id IS NOT NULL AND NOT coalesce(new.is_read, 0) BEGIN
+                INSERT INTO notification_counters (user_id, unread_count) VALUES (new.user_id, 1)
+                ON CONFLICT (user_id) DO UPDATE SET unread_count = unread_count + 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS notifications_unread_delete
+            AFTER DELETE ON notifications WHEN NOT coalesce(old.is_read, 0) BEGIN
+                UPDATE notification_counters SET unread_count = unread_count - 1 WHERE user_id = old.user_id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS notifications_unread_update
+            AFTER UPDATE OF user_id, is_read ON notifications
+            WHEN NOT coalesce(old.is_read, 0) OR NOT coalesce(new.is_read, 0) BEGIN
+                UPDATE notification_counters SET unread_count = unread_count - 1
+                WHERE user_id = old.user_id AND NOT coalesce(old.is_read, 0);
+                INSERT INTO notification_counters (user_id, unread_count)
+                SELECT new.user_id, 1 WHERE new.user_id IS NOT NULL AND NOT coalesce(new.is_read, 0)
+                ON CONFLICT (user_id) DO UPDATE SET unread_count = unread_count + 1;
+            END
+        ''')
+        
+        if not counters_exist:
+            # Count notifications that were created before the counters existed
+            cursor.execute('''
+                INSERT INTO notification_counters (user_id, unread_count)
+                SELECT user_id, COUNT(*) FROM notifications
+                WHERE user_id IS NOT NULL AND NOT coalesce(is_read, 0)
+                GROUP BY user_id
+            ''')
+    
+    def create_email_outbox(self, cursor):
+        """Create the email outbox and, when email is enabled, the trigger that queues notifications into it"""
+        # status is 'pending', 'sending' (claimed until next_attempt_epoch), 'sent' or 'dead'
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS email_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                notification_id INTEGER,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_epoch INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                last_error TEXT,
+                created_epoch INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                sent_epoch INTEGER
+            )
+        ''')
+        # Which outbox holds a 'sending' row, so a takeover after an expired claim is noticed
+        self.add_column_if_missing(cursor, 'email_outbox', 'claim_token', 'TEXT')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+            ON email_outbox (next_attempt_epoch) WHERE status IN ('pending', 'sending')
+        ''')
+        
+        # A trigger also catches notifications written in bulk with INSERT ... SELECT
+        if AppSettings.EMAIL_ENABLED:
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS notifications_email_outbox AFTER INSERT ON notifications BEGIN
+                    INSERT INTO email_outbox (notification_id, recipient, subject, body)
+                    SELECT new.id, email, new.title, new.message FROM users
+                    WHERE id = new.user_id AND coalesce(email, '') <> '';
+                END
+            ''')
+        else:
+            cursor.execute("DROP TRIGGER IF EXISTS notifications_email_outbox")
+    
+    def create_user_search_index(self, cursor):
+        """Create the users FTS5 index and the triggers that keep it in sync"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'users_fts'")
+        index_exists = cursor.fetchone() is not None
+        
+        try:
+            # Contentless, so phone can be indexed both as typed and as bare digits
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+                    username, email, first_name, last_name, phone, user_type,
+                    content='', prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite was built without FTS5; User.search falls back to LIKE
+            return
+        
+        new_values = USER_SEARCH_VALUES.format(row='new')
+        old_values = USER_SEARCH_VALUES.format(row='old')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name, phone, user_type)
+                VALUES (new.id, {new_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+                INSERT INTO users_fts (users_fts, rowid, username, email, first_name, last_name, phone, user_type)
+                VALUES ('delete', old.id, {old_values});
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS users_fts_update
+            AFTER UPDATE OF username, email, first_name, last_name, phone, user_type ON users BEGIN
+                INSERT INTO users_fts (users_fts, rowid, username, email, first_name, last_name, phone, user_type)
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name, phone, user_type)
+                VALUES (new.id, {new_values});
+            END
+        ''')
+        
+        if not index_exists:
+            # Rank name matches first; user_type is only there for filtering
+            cursor.execute('''
+                INSERT INTO users_fts (users_fts, rank)
+                VALUES ('rank', 'bm25(4.0, 2.0, 6.0, 6.0, 2.0, 0.0)')
+            ''')
+            # Index users that were created before the search index existed
+            cursor.execute(f'''
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name, phone, user_type)
+                SELECT id, {USER_SEARCH_VALUES.format(row='users')} FROM users
+            ''')
+    
+    @staticmethod
+    def split_muscle_groups(muscle_groups):
+        """Split comma-joined muscle groups into distinct, trimmed tags"""
+        tags = []
+        for part in (muscle_groups or "").split(","):
+            tag = " ".join(part.split())
+            if tag and tag not in tags:
+                tags.append(tag)
+        return tags
+    
+    def sync_muscle_group_tags(self, cursor, exercise_id, muscle_groups):
+        """Replace an exercise's muscle group tags"""
+        cursor.execute("DELETE FROM exercise_muscle_groups WHERE exercise_id = ?", (exercise_id,))
+        cursor.executemany('''
+            INSERT INTO exercise_muscle_groups (exercise_id, muscle_group)
+            VALUES (?, ?)
+        ''', [(exercise_id, tag) for tag in self.split_muscle_groups(muscle_groups)])
+    
+    def backfill_muscle_group_tags(self, cursor):
+        """Tag exercises that have muscle groups but no tag rows yet"""
+        cursor.execute('''
+            SELECT id, muscle_groups FROM exercises e
+            WHERE muscle_groups IS NOT NULL AND muscle_groups != ''
+              AND NOT EXISTS (SELECT 1 FROM exercise_muscle_groups t WHERE t.exercise_id = e.id)
+        ''')
+        for exercise_id, muscle_groups in cursor.fetchall():
+            self.sync_muscle_group_tags(cursor, exercise_id, muscle_groups)
+    
     def create_default_data(self):
         """Create default admin user and sample data"""
         conn = self.get_connection()
@@ -215,16 +734,19 @@ class DatabaseManager:
                     INSERT INTO exercises (name, category, muscle_groups, equipment, instructions, difficulty_level)
                     VALUES (?, ?, ?, ?, ?, ?)
                 ''', exercise)
+                self.sync_muscle_group_tags(cursor, cursor.lastrowid, exercise[2])
         
         conn.commit()
     
     def hash_password(self, password):
         """Hash a password for storing"""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+        with BCRYPT_SECONDS.time(operation="hash"):
+            return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
     
     def verify_password(self, password, hashed):
         """Verify a stored password against provided password"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed)
+        with BCRYPT_SECONDS.time(operation="verify"):
+            return bcrypt.checkpw(password.encode('utf-8'), hashed)
     
     def close_connection(self):
         if self.connection:
@@ -18,17 +18,86 @@ class AppSettings:
     ASSETS_DIR = "assets"
     ICONS_DIR = os.path.join(ASSETS_DIR, "icons")
     IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
+    THUMBNAILS_DIR = os.path.join(ASSETS_DIR, "thumbnails")
     EXPORTS_DIR = "exports"
     
+    # Background work (SQL, PDF building) kept off the Tk thread
+    TASK_WORKERS = 4
+    
+    # Dashboard sections kept built (hidden) per dashboard; the least recently shown is dropped beyond this
+    SECTION_CACHE_SIZE = 6
+    
+    # UI stall watchdog: an after() heartbeat measures how long the Tk loop is kept busy
+    WATCHDOG_ENABLED = True
+    WATCHDOG_HEARTBEAT_MS = 100
+    WATCHDOG_STALL_MS = 500  # Blocked this long, the main thread's stack is logged
+    WATCHDOG_SAMPLES = 2000  # Latencies kept per view for the percentiles
+    WATCHDOG_SUMMARY_SECONDS = 600
+    WATCHDOG_LOG_PATH = os.path.join("logs", "ui_stalls.log")
+    WATCHDOG_LOG_BYTES = 1024 * 1024
+    WATCHDOG_LOG_BACKUPS = 3
+    
+    # SQL tracing, switched on with the FMS_SQL_TRACE environment variable
+    SQL_TRACE_LOG_PATH = os.path.join("logs", "sql_trace.log")
+    SQL_TRACE_LOG_BYTES = 5 * 1024 * 1024
+    SQL_TRACE_LOG_BACKUPS = 3
+    SQL_TRACE_N_PLUS_ONE = 10  # Runs of one query shape within a UI action flagged as a likely N+1
+    SQL_TRACE_TOP_QUERIES = 5  # Slowest query shapes listed per action
+    
+    # --profile mode: one pstats and one collapsed-stack file per UI action
+    PROFILE_DIR = os.path.join("logs", "profiles")
+    PROFILE_SAMPLE_MS = 5  # Stack sampling interval for the flamegraph files
+    PROFILE_SUMMARY_TOP = 20  # Slowest actions listed in summary.txt
+    
+    # Metrics in Prometheus text format, for a local scraper watching every front desk
+    METRICS_ENABLED = False
+    METRICS_FILE = os.path.join("logs", "fms.prom")
+    METRICS_WRITE_SECONDS = 15
+    METRICS_HTTP_PORT = None  # e.g. 9464 to also serve http://127.0.0.1:9464/metrics
+    
+    # Image settings
+    THUMBNAIL_SIZE = (64, 64)
+    THUMBNAIL_WORKERS = 2
+    IMAGE_CACHE_MB = 32  # Decoded thumbnails kept in memory
+    
     # Session settings
     SESSION_DURATION_MINUTES = 60
+    MAX_SESSION_MINUTES = 240  # Bounds the overlap scan in Session.find_conflict
+    
+    # Nightly closeout of sessions nobody marked complete
+    SESSION_CLOSEOUT_HOUR = 3  # Local hour the job runs (it also runs at startup)
+    SESSION_CLOSEOUT_GRACE_HOURS = 24  # Trainers have this long after a session ends to close it themselves
+    SESSION_CLOSEOUT_STATUS = 'completed'  # Status given to stale sessions: 'completed' or 'no_show'
+    SESSION_CLOSEOUT_CHUNK = 500
+    
+    # Live refresh: how often dashboards check PRAGMA data_version for commits from other terminals
+    CHANGE_POLL_MS = 2000
+    
+    # Notification retention: read notifications older than this move to the archive database
+    NOTIFICATION_RETENTION_DAYS = 90
+    NOTIFICATION_ARCHIVE_PATH = "fitness_archive.db"
+    NOTIFICATION_ARCHIVE_HOUR = 4  # Local hour the nightly archival runs
+    NOTIFICATION_ARCHIVE_CHUNK = 500
+    
+    # Class schedule settings
+    CLASS_OCCURRENCE_WEEKS = 13  # Materialized ahead, covering the 90-day booking window
+    CLASS_OCCURRENCE_REFRESH_SECONDS = 3600
     
-    # Email settings (for notifications - would need SMTP setup)
+    # Email settings (notifications are queued in email_outbox and sent by EmailOutbox)
     EMAIL_ENABLED = False
     SMTP_SERVER = ""
     SMTP_PORT = 587
+    SMTP_USE_TLS = True  # STARTTLS before logging in
     EMAIL_USERNAME = ""
     EMAIL_PASSWORD = ""
+    EMAIL_FROM = ""  # Defaults to EMAIL_USERNAME
+    EMAIL_BATCH_SIZE = 50  # Messages claimed per pass, all sent over one connection
+    EMAIL_RATE_PER_MINUTE = 60
+    EMAIL_MAX_ATTEMPTS = 6  # Then the message is dead-lettered
+    EMAIL_RETRY_SECONDS = 60  # First retry delay, doubled per attempt
+    EMAIL_MAX_RETRY_SECONDS = 3600
+    EMAIL_POLL_SECONDS = 30  # Picks up messages queued by other terminals
+    EMAIL_IDLE_SECONDS = 60  # The SMTP connection is closed after this long without mail
     
     # PDF Export settings
     PDF_FONT = "Helvetica"
@@ -39,6 +108,6 @@ class AppSettings:
     @classmethod
     def create_directories(cls):
         """Create necessary directories if they don't exist"""
-        directories = [cls.ASSETS_DIR, cls.ICONS_DIR, cls.IMAGES_DIR, cls.EXPORTS_DIR]
+        directories = [cls.ASSETS_DIR, cls.ICONS_DIR, cls.IMAGES_DIR, cls.THUMBNAILS_DIR, cls.EXPORTS_DIR]
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
\ No newline at end of file
@@ -1,5 +1,8 @@
+import time
 from models.user import User, MemberProfile, TrainerProfile
 from config.database import DatabaseManager
+from services.name_search import NameSearch
+from services.metrics import LOGIN_SECONDS
 
 class AuthController:
     def __init__(self):
@@ -7,6 +10,7 @@ class AuthController:
     
     def authenticate_user(self, username, password):
         """Authenticate user login"""
+        started = time.perf_counter()
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
@@ -20,8 +24,9 @@ class AuthController:
         
         user_row = cursor.fetchone()
         
+        user = None
         if user_row and self.db.verify_password(password, user_row['password_hash']):
-            return {
+            user = {
                 'id': user_row['id'],
                 'username': user_row['username'],
                 'email': user_row['email'],
@@ -33,7 +38,8 @@ class AuthController:
                 'gender': user_row['gender']
             }
         
-        return None
+        LOGIN_SECONDS.observe(time.perf_counter() - started, result="success" if user else "failure")
+        return user
     
     def register_user(self, user_data):
         """Register new user"""
@@ -82,6 +88,11 @@ class AuthController:
                 ''', (user_id,))
             
             conn.commit()
+            NameSearch.user_changed(
+                user_id,
+                f"{user_data['first_name']} {user_data['last_name']}",
+                user_data['user_type']
+            )
             return True
             
         except Exception as e:
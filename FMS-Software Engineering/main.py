@@ -4,9 +4,21 @@ import os
 from views.login_view import LoginView
 from config.database import DatabaseManager
 from config.settings import AppSettings
+from models.session import Session, ClassOccurrence
+from models.notification import Notification
+from services.background_jobs import BackgroundJobs
+from services.email_outbox import EmailOutbox
+from services.ui_watchdog import UIWatchdog
+from services.action_profiler import ActionProfiler
+from services.metrics import Metrics
 
 class FitnessApp:
-    def __init__(self):
+    def __init__(self, profile=False):
+        # Profile each navigation and button action (run with --profile)
+        self.profile = profile
+        if profile:
+            ActionProfiler.instance().start()
+        
         # Set appearance mode and color theme
         ctk.set_appearance_mode("System")  # "System", "Dark", "Light"
         ctk.set_default_color_theme("blue")  # "blue", "green", "dark-blue"
@@ -15,6 +27,23 @@ class FitnessApp:
         self.db_manager = DatabaseManager()
         self.db_manager.initialize_database()
         
+        # Keep the upcoming weeks of class occurrences materialized, close out stale sessions
+        # and archive old notifications
+        jobs = BackgroundJobs.instance()
+        jobs.register("class_occurrences", AppSettings.CLASS_OCCURRENCE_REFRESH_SECONDS, ClassOccurrence.refresh)
+        jobs.register_daily("session_closeout", AppSettings.SESSION_CLOSEOUT_HOUR, Session.close_out_stale)
+        jobs.register_daily("notification_archive", AppSettings.NOTIFICATION_ARCHIVE_HOUR, Notification.archive_old)
+        if AppSettings.METRICS_ENABLED:
+            # Prometheus text file for a local scraper, and optionally a localhost endpoint
+            jobs.register("metrics_file", AppSettings.METRICS_WRITE_SECONDS, Metrics.instance().write_file)
+            if AppSettings.METRICS_HTTP_PORT:
+                Metrics.instance().start_http()
+        jobs.start()
+        
+        # Deliver notification emails queued in the outbox
+        if AppSettings.EMAIL_ENABLED:
+            EmailOutbox.instance().start()
+        
         # Create main window
         self.root = ctk.CTk()
         self.root.title("FitPro Management System")
@@ -24,7 +53,12 @@ class FitnessApp:
         # Center window on screen
         self.center_window()
         
+        # Log stalls of the event loop and its latency per view
+        if AppSettings.WATCHDOG_ENABLED:
+            UIWatchdog.instance().start(self.root)
+        
         # Initialize login view
+        UIWatchdog.instance().set_view("login")
         self.login_view = LoginView(self.root, self.on_login_success)
         
     def center_window(self):
@@ -62,11 +96,18 @@ class FitnessApp:
             self.dashboard.destroy()
         
         # Recreate login view
+        UIWatchdog.instance().set_view("login")
         self.login_view = LoginView(self.root, self.on_login_success)
     
     def run(self):
         self.root.mainloop()
+        UIWatchdog.instance().stop()
+        if AppSettings.METRICS_ENABLED:
+            Metrics.instance().write_file()
+            Metrics.instance().stop_http()
+        if self.profile:
+            ActionProfiler.instance().stop()
 
 if __name__ == "__main__":
-    app = FitnessApp()
+    app = FitnessApp(profile="--profile" in sys.argv[1:])
     app.run()
\ No newline at end of file
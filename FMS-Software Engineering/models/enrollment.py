@@ -0,0 +1,206 @@
+from datetime import datetime
+from config.database import DatabaseManager
+
+class EnrollmentError(Exception):
+    """Raised when a class occurrence can't be enrolled in (cancelled, already started or unknown)"""
+
+class ClassEnrollment:
+    def __init__(self, enrollment_id=None, class_id=None, occurrence_id=None, member_id=None,
+                 enrollment_date=None, status=None, class_name=None, start_time=None,
+                 occurrence_status=None):
+        self.id = enrollment_id
+        self.class_id = class_id
+        self.occurrence_id = occurrence_id
+        self.member_id = member_id
+        self.enrollment_date = enrollment_date
+        self.status = status  # enrolled, waitlisted, cancelled
+        self.class_name = class_name
+        self.start_time = start_time
+        self.occurrence_status = occurrence_status  # 'cancelled' when the class time was dropped
+        self.db = DatabaseManager()
+    
+    @classmethod
+    def enroll(cls, occurrence_id, member_id):
+        """Take a seat in a class occurrence, or join its waitlist when it is full"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        if conn.in_transaction:
+            conn.commit()
+        
+        # Writers queue on the database lock, so each seat is handed out exactly once
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute('''
+                SELECT * FROM class_enrollments
+                WHERE occurrence_id = ? AND member_id = ? AND status IN ('enrolled', 'waitlisted')
+            ''', (occurrence_id, member_id))
+            existing = cursor.fetchone()
+            if existing:
+                conn.rollback()
+                return cls.from_row(existing)
+            
+            # Take a seat only while the counter is below capacity
+            cursor.execute('''
+                UPDATE class_occurrences SET enrolled_count = enrolled_count + 1
+                WHERE id = ? AND status = 'scheduled' AND start_epoch > ?
+                  AND (capacity IS NULL OR enrolled_count < capacity)
+            ''', (occurrence_id, DatabaseManager.to_epoch(datetime.now())))
+            if cursor.rowcount == 1:
+                status = 'enrolled'
+            else:
+                cursor.execute('''
+                    UPDATE class_occurrences SET waitlist_count = waitlist_count + 1
+                    WHERE id = ? AND status = 'scheduled' AND start_epoch > ?
+                ''', (occurrence_id, DatabaseManager.to_epoch(datetime.now())))
+                if cursor.rowcount != 1:
+                    raise EnrollmentError("This class is no longer open for enrollment.")
+                status = 'waitlisted'
+            
+            cursor.execute('''
+                INSERT INTO class_enrollments (class_id, occurrence_id, member_id, status)
+                SELECT class_id, id, ?, ? FROM class_occurrences WHERE id = ?
+            ''', (member_id, status, occurrence_id))
+            enrollment_id = cursor.lastrowid
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        cursor.execute("SELECT * FROM class_enrollments WHERE id = ?", (enrollment_id,))
+        return cls.from_row(cursor.fetchone())
+    
+    def cancel(self):
+        """Cancel this enrollment; a freed seat goes to the head of the waitlist, who is notified and returned"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        if conn.in_transaction:
+            conn.commit()
+        
+        promoted = None
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read the status under the lock in case another terminal changed it
+            cursor.execute("SELECT status FROM class_enrollments WHERE id = ?", (self.id,))
+            row = cursor.fetchone()
+            status = row['status'] if row else None
+            if status not in ('enrolled', 'waitlisted'):
+                conn.rollback()
+                self.status = status
+                return None
+            
+            cursor.execute("UPDATE class_enrollments SET status = 'cancelled' WHERE id = ?", (self.id,))
+            if status == 'waitlisted':
+                cursor.execute('''
+                    UPDATE class_occurrences SET waitlist_count = waitlist_count - 1 WHERE id = ?
+                ''', (self.occurrence_id,))
+            else:
+                cursor.execute('''
+                    UPDATE class_occurrences SET enrolled_count = enrolled_count - 1 WHERE id = ?
+                ''', (self.occurrence_id,))
+                promoted = next(iter(self.promote_waitlist(cursor, self.occurrence_id)), None)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        self.status = 'cancelled'
+        return promoted
+    
+    @classmethod
+    def promote_waitlist(cls, cursor, occurrence_id):
+        """Give an occurrence's free seats to its longest-waiting members, within the caller's write transaction"""
+        # A cancelled or past occurrence has no seats to hand out
+        cursor.execute('''
+            SELECT capacity, enrolled_count, waitlist_count FROM class_occurrences
+            WHERE id = ? AND status = 'scheduled' AND start_epoch > ?
+        ''', (occurrence_id, DatabaseManager.to_epoch(datetime.now())))
+        occurrence = cursor.fetchone()
+        if occurrence is None or not occurrence['waitlist_count']:
+            return []
+        free_seats = occurrence['waitlist_count']
+        if occurrence['capacity'] is not None:
+            free_seats = min(free_seats, occurrence['capacity'] - occurrence['enrolled_count'])
+        if free_seats <= 0:
+            return []
+        
+        cursor.execute('''
+            SELECT e.*, c.name AS class_name, o.start_epoch FROM class_enrollments e
+            JOIN class_occurrences o ON o.id = e.occurrence_id
+            JOIN classes c ON c.id = e.class_id
+            WHERE e.occurrence_id = ? AND e.status = 'waitlisted'
+            ORDER BY e.id
+            LIMIT ?
+        ''', (occurrence_id, free_seats))
+        promoted = [cls.from_row(row) for row in cursor.fetchall()]
+        if not promoted:
+            return []
+        
+        cursor.executemany(
+            "UPDATE class_enrollments SET status = 'enrolled' WHERE id = ?",
+            [(enrollment.id,) for enrollment in promoted]
+        )
+        cursor.execute('''
+            UPDATE class_occurrences
+            SET enrolled_count = enrolled_count + ?, waitlist_count = waitlist_count - ?
+            WHERE id = ?
+        ''', (len(promoted), len(promoted), occurrence_id))
+        # Notified in the same transaction, so nobody is moved up silently
+        cursor.executemany('''
+            INSERT INTO notifications (user_id, title, message, type)
+            VALUES (?, 'Spot Opened', ?, 'success')
+        ''', [
+            (enrollment.member_id, f"A spot opened up in {enrollment.class_name} on "
+                                   f"{enrollment.start_time.strftime('%B %d, %Y at %I:%M %p')}. You are now enrolled.")
+            for enrollment in promoted
+        ])
+        for enrollment in promoted:
+            enrollment.status = 'enrolled'
+        return promoted
+    
+    def waitlist_position(self):
+        """Get this enrollment's 1-based place in the waitlist, or None if not waitlisted"""
+        if self.status != 'waitlisted':
+            return None
+        cursor = self.db.get_connection().cursor()
+        cursor.execute('''
+            SELECT COUNT(*) FROM class_enrollments
+            WHERE occurrence_id = ? AND status = 'waitlisted' AND id <= ?
+        ''', (self.occurrence_id, self.id))
+        return cursor.fetchone()[0]
+    
+    @classmethod
+    def get_by_member_id(cls, member_id, upcoming_only=True):
+        """Get a member's active enrollments and waitlist entries, soonest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        query = '''
+            SELECT e.*, c.name AS class_name, o.start_epoch, o.status AS occurrence_status FROM class_enrollments e
+            JOIN class_occurrences o ON o.id = e.occurrence_id
+            JOIN classes c ON c.id = e.class_id
+            WHERE e.member_id = ? AND e.status IN ('enrolled', 'waitlisted')
+        '''
+        params = [member_id]
+        if upcoming_only:
+            query += " AND o.start_epoch > ?"
+            params.append(DatabaseManager.to_epoch(datetime.now()))
+        cursor.execute(query + " ORDER BY o.start_epoch", params)
+        
+        return [cls.from_row(row) for row in cursor.fetchall()]
+    
+    @classmethod
+    def from_row(cls, row):
+        keys = row.keys()
+        return cls(
+            enrollment_id=row['id'],
+            class_id=row['class_id'],
+            occurrence_id=row['occurrence_id'],
+            member_id=row['member_id'],
+            enrollment_date=row['enrollment_date'],
+            status=row['status'],
+            class_name=row['class_name'] if 'class_name' in keys else None,
+            start_time=DatabaseManager.from_epoch(row['start_epoch']) if 'start_epoch' in keys else None,
+            occurrence_status=row['occurrence_status'] if 'occurrence_status' in keys else None
+        )
\ No newline at end of file
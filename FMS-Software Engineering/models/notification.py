@@ -1,5 +1,9 @@
-from datetime import datetime
-from config.database import DatabaseManager
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from config.database import DatabaseManager, decompress_text
+from config.settings import AppSettings
+from services.email_outbox import EmailOutbox
 
 class Notification:
     def __init__(self, notification_id=None, user_id=None, title=None, 
@@ -34,6 +38,9 @@ class Notification:
             self.id = cursor.lastrowid
         
         conn.commit()
+        if AppSettings.EMAIL_ENABLED:
+            # The insert trigger queued an email; have it sent now rather than at the next poll
+            EmailOutbox.notify()
         return self.id
     
     @classmethod
@@ -47,13 +54,13 @@ class Notification:
             cursor.execute('''
                 SELECT * FROM notifications 
                 WHERE user_id = ? AND is_read = 0 
-                ORDER BY created_at DESC
+                ORDER BY created_epoch DESC, id DESC
             ''', (user_id,))
         else:
             cursor.execute('''
                 SELECT * FROM notifications 
                 WHERE user_id = ? 
-                ORDER BY created_at DESC
+                ORDER BY created_epoch DESC, id DESC
             ''', (user_id,))
         
         rows = cursor.fetchall()
@@ -72,6 +79,158 @@ class Notification:
         
         return notifications
     
+    @classmethod
+    def unread_count(cls, user_id):
+        """Get the number of unread notifications of a user"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        # Maintained by triggers on notifications (see DatabaseManager.create_notification_counters)
+        cursor.execute("SELECT unread_count FROM notification_counters WHERE user_id = ?", (user_id,))
+        row = cursor.fetchone()
+        return row['unread_count'] if row else 0
+    
+    @classmethod
+    def between(cls, user_id, start, end):
+        """Get a user's notifications created in [start, end) (local datetimes), newest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM notifications
+            WHERE user_id = ? AND created_epoch >= ? AND created_epoch < ?
+            ORDER BY created_epoch DESC, id DESC
+        ''', (user_id, DatabaseManager.to_unix_epoch(start), DatabaseManager.to_unix_epoch(end)))
+        rows = cursor.fetchall()
+        
+        notifications = []
+        for row in rows:
+            notifications.append(cls(
+                notification_id=row['id'],
+                user_id=row['user_id'],
+                title=row['title'],
+                message=row['message'],
+                notification_type=row['type'],
+                is_read=row['is_read'],
+                created_at=row['created_at']
+            ))
+        
+        return notifications
+    
+    @classmethod
+    def archive_old(cls, now=None, days=None, chunk_size=None):
+        """Move read notifications older than `days` to the archive database and shrink the file; returns the count"""
+        now = now or datetime.now()
+        days = AppSettings.NOTIFICATION_RETENTION_DAYS if days is None else days
+        chunk_size = chunk_size or AppSettings.NOTIFICATION_ARCHIVE_CHUNK
+        cutoff = DatabaseManager.to_unix_epoch(now - timedelta(days=days))
+        
+        db = DatabaseManager()
+        conn = db.attach_notification_archive()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 FROM archive.sqlite_master WHERE name = 'archived_notifications_fts'")
+        searchable = cursor.fetchone() is not None
+        
+        archived = 0
+        while True:
+            # Copy and delete commit together, one short write transaction per chunk
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute('''
+                    SELECT id FROM main.notifications
+                    WHERE is_read = 1 AND created_epoch < ?
+                    LIMIT ?
+                ''', (cutoff, chunk_size))
+                ids = [row['id'] for row in cursor.fetchall()]
+                if not ids:
+                    conn.commit()
+                    break
+                
+                placeholders = ", ".join("?" * len(ids))
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO archive.archived_notifications
+                        (id, user_id, title, message, type, created_at, created_epoch, archived_epoch)
+                    SELECT id, user_id, title, compress_text(message), type, created_at, created_epoch, ?
+                    FROM main.notifications WHERE id IN ({placeholders})
+                ''', (DatabaseManager.to_unix_epoch(now), *ids))
+                if searchable:
+                    cursor.execute(f'''
+                        INSERT INTO archive.archived_notifications_fts (rowid, title, message)
+                        SELECT id, title, message FROM main.notifications WHERE id IN ({placeholders})
+                    ''', ids)
+                cursor.execute(f"DELETE FROM main.notifications WHERE id IN ({placeholders})", ids)
+                archived += cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        if archived:
+            # Hand the freed pages back to the file system. execute() would step the pragma
+            # once, freeing a single page; executescript runs it to completion
+            conn.executescript("PRAGMA main.incremental_vacuum;")
+        db.close_connection()
+        return archived
+    
+    @classmethod
+    def search_archive(cls, user_id, query, limit=50):
+        """Search a user's archived notifications by title and message, newest first"""
+        terms = re.findall(r"\w+", query or "")
+        db = DatabaseManager()
+        conn = db.attach_notification_archive()
+        cursor = conn.cursor()
+        
+        rows = None
+        if terms:
+            match_expression = " ".join(f'"{term}"*' for term in terms)
+            try:
+                cursor.execute('''
+                    SELECT * FROM archive.archived_notifications
+                    WHERE user_id = ? AND id IN (
+                        SELECT rowid FROM archive.archived_notifications_fts
+                        WHERE archived_notifications_fts MATCH ?
+                    )
+                    ORDER BY created_epoch DESC
+                    LIMIT ?
+                ''', (user_id, match_expression, limit))
+                rows = [(row, decompress_text(row['message'])) for row in cursor.fetchall()]
+            except sqlite3.OperationalError:
+                # No FTS5 index available, fall back to a plain scan
+                pass
+        
+        if rows is None:
+            # Decompress the user's archive and filter it
+            cursor.execute('''
+                SELECT * FROM archive.archived_notifications
+                WHERE user_id = ?
+                ORDER BY created_epoch DESC
+            ''', (user_id,))
+            rows = []
+            for row in cursor.fetchall():
+                message = decompress_text(row['message'])
+                text = f"{row['title']} {message}".lower()
+                if all(term.lower() in text for term in terms):
+                    rows.append((row, message))
+                    if len(rows) >= limit:
+                        break
+        db.close_connection()
+        
+        notifications = []
+        for row, message in rows:
+            notifications.append(cls(
+                notification_id=row['id'],
+                user_id=row['user_id'],
+                title=row['title'],
+                message=message,
+                notification_type=row['type'],
+                is_read=True,
+                created_at=row['created_at']
+            ))
+        
+        return notifications
+    
     @classmethod
     def create_notification(cls, user_id, title, message, notification_type="info"):
         """Create a new notification"""
@@ -84,6 +243,18 @@ class Notification:
         notification.save()
         return notification
     
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            notification_id=row['id'],
+            user_id=row['user_id'],
+            title=row['title'],
+            message=row['message'],
+            notification_type=row['type'],
+            is_read=row['is_read'],
+            created_at=row['created_at']
+        )
+    
     def mark_as_read(self):
         """Mark notification as read"""
         self.is_read = True
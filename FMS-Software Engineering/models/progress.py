@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+from config.database import DatabaseManager
+
+class ProgressRecord:
+    def __init__(self, record_id=None, member_id=None, record_date=None, weight=None,
+                 body_fat=None, muscle_mass=None, measurements=None, notes=None, photo_path=None):
+        self.id = record_id
+        self.member_id = member_id
+        self.record_date = record_date or datetime.now().strftime('%Y-%m-%d')
+        self.weight = weight
+        self.body_fat = body_fat
+        self.muscle_mass = muscle_mass
+        self.measurements = measurements or {}
+        self.notes = notes
+        self.photo_path = photo_path
+        self.db = DatabaseManager()
+    
+    def save(self):
+        """Save progress record to database"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        
+        measurements_json = json.dumps(self.measurements)
+        
+        if self.id:
+            # Update existing record
+            cursor.execute('''
+                UPDATE progress_records
+                SET member_id=?, record_date=?, weight=?, body_fat=?, muscle_mass=?,
+                    measurements=?, notes=?, photo_path=?
+                WHERE id=?
+            ''', (self.member_id, self.record_date, self.weight, self.body_fat, self.muscle_mass,
+                  measurements_json, self.notes, self.photo_path, self.id))
+        else:
+            # Insert new record
+            cursor.execute('''
+                INSERT INTO progress_records (member_id, record_date, weight, body_fat, muscle_mass,
+                                              measurements, notes, photo_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (self.member_id, self.record_date, self.weight, self.body_fat, self.muscle_mass,
+                  measurements_json, self.notes, self.photo_path))
+            self.id = cursor.lastrowid
+        
+        conn.commit()
+        return self.id
+    
+    @classmethod
+    def get_by_member_id(cls, member_id):
+        """Get a member's progress records, newest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT * FROM progress_records
+            WHERE member_id = ?
+            ORDER BY record_date DESC, id DESC
+        ''', (member_id,))
+        rows = cursor.fetchall()
+        
+        records = []
+        for row in rows:
+            measurements = json.loads(row['measurements']) if row['measurements'] else {}
+            records.append(cls(
+                record_id=row['id'],
+                member_id=row['member_id'],
+                record_date=row['record_date'],
+                weight=row['weight'],
+                body_fat=row['body_fat'],
+                muscle_mass=row['muscle_mass'],
+                measurements=measurements,
+                notes=row['notes'],
+                photo_path=row['photo_path']
+            ))
+        
+        return records
\ No newline at end of file
@@ -1,5 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from config.database import DatabaseManager
+from config.settings import AppSettings
+from services.availability_service import AvailabilityService
+from services.session_calendar import SessionCalendar
+from services.class_schedule import parse_rule, describe_rule, iter_occurrences
+from services.metrics import NOTIFICATION_FANOUT
+from models.enrollment import ClassEnrollment
+
+class SessionConflictError(Exception):
+    """Raised when a booking overlaps a scheduled session of the same trainer or member"""
+    def __init__(self, conflicting_session, conflict_with):
+        self.conflicting_session = conflicting_session
+        self.conflict_with = conflict_with  # 'trainer' or 'member'
+        super().__init__(f"The {conflict_with} already has a session at {conflicting_session.session_date}")
 
 class Session:
     def __init__(self, session_id=None, member_id=None, trainer_id=None, 
@@ -22,7 +35,13 @@ class Session:
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
+        previous_date = None
         if self.id:
+            # A rescheduled session also leaves the cached month and day it moved out of
+            cursor.execute("SELECT session_date FROM sessions WHERE id = ?", (self.id,))
+            row = cursor.fetchone()
+            previous_date = row['session_date'] if row else None
+            
             # Update existing session
             cursor.execute('''
                 UPDATE sessions 
@@ -42,8 +61,87 @@ class Session:
             self.id = cursor.lastrowid
         
         conn.commit()
+        for session_date in {previous_date, self.session_date} - {None}:
+            AvailabilityService.invalidate(session_date)
+            SessionCalendar.invalidate(session_date)
+        return self.id
+    
+    def book(self):
+        """Insert a new session unless it overlaps the trainer's or member's scheduled sessions"""
+        duration = self.duration or AppSettings.SESSION_DURATION_MINUTES
+        if duration > AppSettings.MAX_SESSION_MINUTES:
+            raise ValueError(f"Sessions can be at most {AppSettings.MAX_SESSION_MINUTES} minutes long")
+        
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        if conn.in_transaction:
+            conn.commit()
+        
+        # Take the write lock before checking, so another terminal can't book the slot in between
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            conflict = self.find_conflict(self.trainer_id, self.member_id, self.session_date, duration, cursor)
+            if conflict:
+                raise SessionConflictError(*conflict)
+            
+            cursor.execute('''
+                INSERT INTO sessions (member_id, trainer_id, session_date, duration, 
+                                    session_type, status, price, notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (self.member_id, self.trainer_id, self.session_date, duration,
+                  self.session_type, self.status, self.price, self.notes))
+            self.id = cursor.lastrowid
+            self.duration = duration
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        AvailabilityService.invalidate(self.session_date)
+        SessionCalendar.invalidate(self.session_date)
         return self.id
     
+    @classmethod
+    def find_conflict(cls, trainer_id, member_id, session_date, duration, cursor=None):
+        """Find a scheduled session overlapping [start, start + duration) as (session, 'trainer' or 'member')"""
+        if cursor is None:
+            cursor = DatabaseManager().get_connection().cursor()
+        
+        start = DatabaseManager.to_epoch(session_date)
+        end = start + duration * 60
+        # Only sessions starting in (start - longest session, end) can overlap, which keeps
+        # each lookup a short range scan of the covering index
+        earliest_start = start - AppSettings.MAX_SESSION_MINUTES * 60
+        
+        for column, conflict_with, person_id in (('trainer_id', 'trainer', trainer_id), ('member_id', 'member', member_id)):
+            if person_id is None:
+                continue
+            cursor.execute(f'''
+                SELECT id FROM sessions
+                WHERE {column} = ? AND start_epoch > ? AND start_epoch < ?
+                  AND end_epoch > ? AND status = 'scheduled'
+                ORDER BY start_epoch
+                LIMIT 1
+            ''', (person_id, earliest_start, end, start))
+            row = cursor.fetchone()
+            if row:
+                cursor.execute("SELECT * FROM sessions WHERE id = ?", (row['id'],))
+                row = cursor.fetchone()
+                return cls(
+                    session_id=row['id'],
+                    member_id=row['member_id'],
+                    trainer_id=row['trainer_id'],
+                    session_date=row['session_date'],
+                    duration=row['duration'],
+                    session_type=row['session_type'],
+                    status=row['status'],
+                    price=row['price'],
+                    notes=row['notes'],
+                    created_at=row['created_at']
+                ), conflict_with
+        
+        return None
+    
     @classmethod
     def get_by_id(cls, session_id):
         """Get session by ID"""
@@ -79,7 +177,7 @@ class Session:
         cursor.execute('''
             SELECT * FROM sessions 
             WHERE member_id = ? 
-            ORDER BY session_date DESC
+            ORDER BY start_epoch DESC
         ''', (member_id,))
         rows = cursor.fetchall()
         
@@ -110,7 +208,7 @@ class Session:
         cursor.execute('''
             SELECT * FROM sessions 
             WHERE trainer_id = ? 
-            ORDER BY session_date DESC
+            ORDER BY start_epoch DESC
         ''', (trainer_id,))
         rows = cursor.fetchall()
         
@@ -131,6 +229,19 @@ class Session:
         
         return sessions
     
+    @classmethod
+    def member_ids_for_trainer(cls, trainer_id):
+        """Get the ids of members who have had a session with a trainer"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT DISTINCT member_id FROM sessions
+            WHERE trainer_id = ? AND member_id IS NOT NULL
+        ''', (trainer_id,))
+        return {row[0] for row in cursor.fetchall()}
+    
     @classmethod
     def get_upcoming_sessions(cls, user_id, user_type):
         """Get upcoming sessions for a user"""
@@ -138,18 +249,20 @@ class Session:
         conn = db.get_connection()
         cursor = conn.cursor()
         
+        # session_date is local wall-clock time, so compare against local now rather than datetime('now')
+        now = DatabaseManager.to_epoch(datetime.now())
         if user_type == 'member':
             cursor.execute('''
                 SELECT * FROM sessions 
-                WHERE member_id = ? AND session_date > datetime('now') AND status = 'scheduled'
-                ORDER BY session_date ASC
-            ''', (user_id,))
+                WHERE member_id = ? AND start_epoch > ? AND status = 'scheduled'
+                ORDER BY start_epoch ASC
+            ''', (user_id, now))
         elif user_type == 'trainer':
             cursor.execute('''
                 SELECT * FROM sessions 
-                WHERE trainer_id = ? AND session_date > datetime('now') AND status = 'scheduled'
-                ORDER BY session_date ASC
-            ''', (user_id,))
+                WHERE trainer_id = ? AND start_epoch > ? AND status = 'scheduled'
+                ORDER BY start_epoch ASC
+            ''', (user_id, now))
         else:
             return []
         
@@ -172,6 +285,165 @@ class Session:
         
         return sessions
     
+    @classmethod
+    def between(cls, trainer_id, start, end, status=None, member_id=None):
+        """Get sessions starting in [start, end), for one trainer or member or all of them, earliest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        query = "SELECT * FROM sessions WHERE start_epoch >= ? AND start_epoch < ?"
+        params = [DatabaseManager.to_epoch(start), DatabaseManager.to_epoch(end)]
+        if trainer_id is not None:
+            query += " AND trainer_id = ?"
+            params.append(trainer_id)
+        if member_id is not None:
+            query += " AND member_id = ?"
+            params.append(member_id)
+        if status is not None:
+            query += " AND status = ?"
+            params.append(status)
+        cursor.execute(query + " ORDER BY start_epoch", params)
+        rows = cursor.fetchall()
+        
+        sessions = []
+        for row in rows:
+            sessions.append(cls(
+                session_id=row['id'],
+                member_id=row['member_id'],
+                trainer_id=row['trainer_id'],
+                session_date=row['session_date'],
+                duration=row['duration'],
+                session_type=row['session_type'],
+                status=row['status'],
+                price=row['price'],
+                notes=row['notes'],
+                created_at=row['created_at']
+            ))
+        
+        return sessions
+    
+    @classmethod
+    def day_counts(cls, start, end, trainer_id=None, member_id=None):
+        """Get {date: {status: count}} of sessions starting in [start, end), bucketed by day in SQL"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        # start_epoch is wall-clock seconds, so whole days divide evenly; with an owner
+        # filter this only reads the covering idx_sessions_trainer_time/member_time index
+        query = '''
+            SELECT start_epoch / 86400 AS day, status, COUNT(*) AS session_count
+            FROM sessions
+            WHERE start_epoch >= ? AND start_epoch < ?
+        '''
+        params = [DatabaseManager.to_epoch(start), DatabaseManager.to_epoch(end)]
+        if trainer_id is not None:
+            query += " AND trainer_id = ?"
+            params.append(trainer_id)
+        if member_id is not None:
+            query += " AND member_id = ?"
+            params.append(member_id)
+        cursor.execute(query + " GROUP BY day, status", params)
+        
+        counts = {}
+        for row in cursor.fetchall():
+            day = DatabaseManager.from_epoch(row['day'] * 86400).date()
+            counts.setdefault(day, {})[row['status']] = row['session_count']
+        db.close_connection()
+        return counts
+    
+    @classmethod
+    def close_out_stale(cls, now=None, status=None, grace_hours=None, chunk_size=None):
+        """Move scheduled sessions that ended more than grace_hours ago to status, notifying members; returns the count"""
+        now = now or datetime.now()
+        status = status or AppSettings.SESSION_CLOSEOUT_STATUS
+        grace_hours = AppSettings.SESSION_CLOSEOUT_GRACE_HOURS if grace_hours is None else grace_hours
+        chunk_size = chunk_size or AppSettings.SESSION_CLOSEOUT_CHUNK
+        cutoff = DatabaseManager.to_epoch(now - timedelta(hours=grace_hours))
+        
+        if status == 'completed':
+            title, verb, notification_type = "Session Completed", "was marked as completed.", "success"
+        else:
+            title, verb, notification_type = "Session Missed", "was marked as missed.", "warning"
+        
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        closed = 0
+        while True:
+            # Each chunk is its own short write transaction, so bookings aren't blocked for long
+            # and an interrupted run simply resumes where it stopped
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute('''
+                    SELECT id FROM sessions
+                    WHERE status = 'scheduled' AND end_epoch <= ?
+                    LIMIT ?
+                ''', (cutoff, chunk_size))
+                ids = [row['id'] for row in cursor.fetchall()]
+                if not ids:
+                    conn.commit()
+                    break
+                
+                placeholders = ", ".join("?" * len(ids))
+                # Notifications first, while the chunk is still 'scheduled'; both commit together
+                cursor.execute(f'''
+                    INSERT INTO notifications (user_id, title, message, type)
+                    SELECT member_id, ?, 'Your ' || coalesce(session_type, 'training') || ' session on '
+                                         || substr(session_date, 1, 16) || ' ' || ?,
+                           ?
+                    FROM sessions
+                    WHERE id IN ({placeholders}) AND status = 'scheduled' AND member_id IS NOT NULL
+                ''', (title, verb, notification_type, *ids))
+                NOTIFICATION_FANOUT.observe(cursor.rowcount, source="session_closeout")
+                cursor.execute(f'''
+                    UPDATE sessions SET status = ?
+                    WHERE id IN ({placeholders}) AND status = 'scheduled'
+                ''', (status, *ids))
+                closed += cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        db.close_connection()
+        if closed:
+            AvailabilityService.invalidate()
+            SessionCalendar.invalidate()
+        return closed
+    
+    @classmethod
+    def totals_by_status(cls):
+        """Get {status: (session count, total price)} across all sessions"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT status, COUNT(*) AS session_count, coalesce(SUM(price), 0) AS total_price
+            FROM sessions
+            GROUP BY status
+        ''')
+        
+        return {row['status']: (row['session_count'], row['total_price']) for row in cursor.fetchall()}
+    
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            session_id=row['id'],
+            member_id=row['member_id'],
+            trainer_id=row['trainer_id'],
+            session_date=row['session_date'],
+            duration=row['duration'],
+            session_type=row['session_type'],
+            status=row['status'],
+            price=row['price'],
+            notes=row['notes'],
+            created_at=row['created_at']
+        )
+    
     def cancel(self):
         """Cancel session"""
         self.status = 'cancelled'
@@ -184,16 +456,17 @@ class Session:
 
 class FitnessClass:
     def __init__(self, class_id=None, name=None, description=None, trainer_id=None,
-                 schedule=None, capacity=None, price=None, duration=None, is_active=True):
+                 schedule=None, capacity=None, price=None, duration=None, is_active=True, created_at=None):
         self.id = class_id
         self.name = name
         self.description = description
         self.trainer_id = trainer_id
-        self.schedule = schedule  # JSON formatted for recurring classes
+        self.schedule = schedule  # JSON recurrence rule (see services.class_schedule)
         self.capacity = capacity
         self.price = price
         self.duration = duration  # in minutes
         self.is_active = is_active
+        self.created_at = created_at
         self.db = DatabaseManager()
     
     def save(self):
@@ -214,15 +487,28 @@ class FitnessClass:
             # Insert new class
             cursor.execute('''
                 INSERT INTO classes (name, description, trainer_id, schedule, 
-                                   capacity, price, duration, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                                   capacity, price, duration, is_active, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
             ''', (self.name, self.description, self.trainer_id, self.schedule,
                   self.capacity, self.price, self.duration, self.is_active))
             self.id = cursor.lastrowid
         
         conn.commit()
+        ClassOccurrence.refresh(self.id)
         return self.id
     
+    @property
+    def schedule_rule(self):
+        return parse_rule(self.schedule)
+    
+    @property
+    def schedule_description(self):
+        return describe_rule(self.schedule_rule)
+    
+    def occurrences(self, window_start, window_end=None):
+        """Lazily yield the start times of this class in [window_start, window_end)"""
+        return iter_occurrences(self.schedule_rule, window_start, window_end, self.created_at)
+    
     @classmethod
     def get_all_active(cls):
         """Get all active classes"""
@@ -244,7 +530,141 @@ class FitnessClass:
                 capacity=row['capacity'],
                 price=row['price'],
                 duration=row['duration'],
-                is_active=row['is_active']
+                is_active=row['is_active'],
+                created_at=row['created_at']
             ))
         
-        return classes
\ No newline at end of file
+        return classes
+
+class ClassOccurrence:
+    def __init__(self, occurrence_id=None, class_id=None, trainer_id=None, start_time=None,
+                 end_time=None, status='scheduled', class_name=None, capacity=None,
+                 enrolled_count=0, waitlist_count=0):
+        self.id = occurrence_id
+        self.class_id = class_id
+        self.trainer_id = trainer_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.status = status  # scheduled, cancelled
+        self.class_name = class_name
+        self.capacity = capacity  # None for unlimited
+        self.enrolled_count = enrolled_count
+        self.waitlist_count = waitlist_count
+    
+    @property
+    def seats_left(self):
+        if self.capacity is None:
+            return None
+        return max(0, self.capacity - self.enrolled_count)
+    
+    @classmethod
+    def refresh(cls, class_id=None, weeks=None):
+        """Materialize class occurrences from now to `weeks` ahead, for one class or all of them"""
+        weeks = weeks or AppSettings.CLASS_OCCURRENCE_WEEKS
+        window_start = datetime.now().replace(second=0, microsecond=0)
+        window_end = datetime.combine(window_start.date() + timedelta(weeks=weeks), datetime.min.time())
+        now_epoch = DatabaseManager.to_epoch(window_start)
+        
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        if class_id is None:
+            cursor.execute("SELECT * FROM classes")
+        else:
+            cursor.execute("SELECT * FROM classes WHERE id = ?", (class_id,))
+        classes = cursor.fetchall()
+        
+        for row in classes:
+            rule = parse_rule(row['schedule']) if row['is_active'] else None
+            duration_seconds = (row['duration'] or AppSettings.SESSION_DURATION_MINUTES) * 60
+            starts = {
+                DatabaseManager.to_epoch(start_time)
+                for start_time in iter_occurrences(rule, window_start, window_end, row['created_at'])
+            }
+            
+            # Upcoming occurrences the schedule no longer produces; past ones are history
+            cursor.execute('''
+                SELECT id, start_epoch FROM class_occurrences
+                WHERE class_id = ? AND start_epoch >= ?
+            ''', (row['id'], now_epoch))
+            stale = [(occurrence_id,) for occurrence_id, start in cursor.fetchall() if start not in starts]
+            # Occurrences members signed up for are cancelled rather than deleted
+            cursor.executemany('''
+                DELETE FROM class_occurrences
+                WHERE id = ? AND enrolled_count = 0 AND waitlist_count = 0
+            ''', stale)
+            cursor.executemany("UPDATE class_occurrences SET status = 'cancelled' WHERE id = ?", stale)
+            
+            # Existing rows keep their ids and seat counters (enrollments refer to them)
+            cursor.executemany('''
+                INSERT INTO class_occurrences (class_id, trainer_id, start_epoch, end_epoch, capacity)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (class_id, start_epoch) DO UPDATE
+                SET trainer_id = excluded.trainer_id, end_epoch = excluded.end_epoch,
+                    capacity = excluded.capacity, status = 'scheduled'
+            ''', [(row['id'], row['trainer_id'], start, start + duration_seconds, row['capacity']) for start in sorted(starts)])
+            
+            # A raised capacity frees seats for the waitlist
+            cursor.execute('''
+                SELECT id FROM class_occurrences
+                WHERE class_id = ? AND start_epoch >= ? AND status = 'scheduled' AND waitlist_count > 0
+                  AND (capacity IS NULL OR enrolled_count < capacity)
+            ''', (row['id'], now_epoch))
+            for (occurrence_id,) in cursor.fetchall():
+                ClassEnrollment.promote_waitlist(cursor, occurrence_id)
+        
+        conn.commit()
+        db.close_connection()
+        AvailabilityService.invalidate()
+    
+    @classmethod
+    def between(cls, start, end, trainer_id=None):
+        """Get scheduled class occurrences starting in [start, end), earliest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        query = '''
+            SELECT o.*, c.name AS class_name FROM class_occurrences o
+            JOIN classes c ON c.id = o.class_id
+            WHERE o.start_epoch >= ? AND o.start_epoch < ? AND o.status = 'scheduled'
+        '''
+        params = [DatabaseManager.to_epoch(start), DatabaseManager.to_epoch(end)]
+        if trainer_id is not None:
+            query += " AND o.trainer_id = ?"
+            params.append(trainer_id)
+        cursor.execute(query + " ORDER BY o.start_epoch", params)
+        rows = cursor.fetchall()
+        
+        occurrences = []
+        for row in rows:
+            occurrences.append(cls(
+                occurrence_id=row['id'],
+                class_id=row['class_id'],
+                trainer_id=row['trainer_id'],
+                start_time=DatabaseManager.from_epoch(row['start_epoch']),
+                end_time=DatabaseManager.from_epoch(row['end_epoch']),
+                status=row['status'],
+                class_name=row['class_name'],
+                capacity=row['capacity'],
+                enrolled_count=row['enrolled_count'],
+                waitlist_count=row['waitlist_count']
+            ))
+        
+        return occurrences
+    
+    @classmethod
+    def next_by_class(cls):
+        """Get {class_id: start time} of each class's next scheduled occurrence"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT class_id, MIN(start_epoch) AS next_start FROM class_occurrences
+            WHERE start_epoch >= ? AND status = 'scheduled'
+            GROUP BY class_id
+        ''', (DatabaseManager.to_epoch(datetime.now()),))
+        
+        return {row['class_id']: DatabaseManager.from_epoch(row['next_start']) for row in cursor.fetchall()}
\ No newline at end of file
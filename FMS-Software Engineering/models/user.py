@@ -1,7 +1,16 @@
+import re
+import sqlite3
 from datetime import datetime
 from config.database import DatabaseManager
+from services.name_search import NameSearch
 
 class User:
+    # Most full-text hits ranked per search
+    SEARCH_CANDIDATES = 2000
+    
+    # Ids bound per IN (...) query, below SQLite's variable limit
+    IDS_PER_QUERY = 500
+    
     def __init__(self, user_id=None, username=None, email=None, user_type=None, 
                  first_name=None, last_name=None, phone=None, date_of_birth=None, 
                  gender=None, created_at=None, is_active=True):
@@ -47,6 +56,7 @@ class User:
             self.id = cursor.lastrowid
         
         conn.commit()
+        NameSearch.user_changed(self.id, self.full_name, self.user_type, self.is_active)
         return self.id
     
     @classmethod
@@ -75,6 +85,40 @@ class User:
             )
         return None
     
+    @classmethod
+    def get_by_ids(cls, user_ids):
+        """Get the users with the given IDs, ordered by name"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        user_ids = list(user_ids)
+        rows = []
+        for start in range(0, len(user_ids), cls.IDS_PER_QUERY):
+            chunk = user_ids[start:start + cls.IDS_PER_QUERY]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT * FROM users WHERE id IN ({placeholders})", chunk)
+            rows.extend(cursor.fetchall())
+        
+        users = []
+        for row in rows:
+            users.append(cls(
+                user_id=row['id'],
+                username=row['username'],
+                email=row['email'],
+                user_type=row['user_type'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                phone=row['phone'],
+                date_of_birth=row['date_of_birth'],
+                gender=row['gender'],
+                created_at=row['created_at'],
+                is_active=row['is_active']
+            ))
+        
+        users.sort(key=lambda user: (user.first_name or "", user.last_name or "", user.id))
+        return users
+    
     @classmethod
     def get_by_username(cls, username):
         """Get user by username"""
@@ -129,6 +173,84 @@ class User:
         
         return users
     
+    @classmethod
+    def search(cls, query=None, user_type=None, limit=100):
+        """Search users by username, email, name or phone (active and inactive), best matches first"""
+        # Every word must match, either whole or as a prefix (as-you-type)
+        terms = re.findall(r"\w+", query or "")
+        
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        if not terms:
+            # Nothing typed yet: browse by name using idx_users_type_name / idx_users_name
+            if user_type:
+                cursor.execute('''
+                    SELECT * FROM users WHERE user_type = ?
+                    ORDER BY first_name, last_name
+                    LIMIT ?
+                ''', (user_type, limit))
+            else:
+                cursor.execute("SELECT * FROM users ORDER BY first_name, last_name LIMIT ?", (limit,))
+        else:
+            match_expression = "{username email first_name last_name phone} : (%s)" % " ".join(
+                f'"{term}"*' for term in terms
+            )
+            if user_type:
+                match_expression = f'user_type : "{user_type}" AND {match_expression}'
+            
+            try:
+                # rank is BM25 with per-column weights (see create_user_search_index). The hits
+                # are ranked inside the index, so for terms almost everyone matches (e.g. an email
+                # domain) the best SEARCH_CANDIDATES survive and only those are joined to users
+                cursor.execute('''
+                    SELECT u.* FROM (
+                        SELECT rowid, rank FROM users_fts
+                        WHERE users_fts MATCH ?
+                        ORDER BY rank
+                        LIMIT ?
+                    ) AS hits
+                    JOIN users u ON u.id = hits.rowid
+                    ORDER BY hits.rank
+                    LIMIT ?
+                ''', (match_expression, cls.SEARCH_CANDIDATES, limit))
+            except sqlite3.OperationalError:
+                # No FTS5 index available, fall back to a plain scan
+                conditions = []
+                params = []
+                for term in terms:
+                    conditions.append("(username LIKE ? OR email LIKE ? OR first_name LIKE ? OR last_name LIKE ? OR phone LIKE ?)")
+                    params.extend([f"%{term}%"] * 5)
+                if user_type:
+                    conditions.append("user_type = ?")
+                    params.append(user_type)
+                cursor.execute(f'''
+                    SELECT * FROM users
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY first_name, last_name
+                    LIMIT ?
+                ''', (*params, limit))
+        rows = cursor.fetchall()
+        
+        users = []
+        for row in rows:
+            users.append(cls(
+                user_id=row['id'],
+                username=row['username'],
+                email=row['email'],
+                user_type=row['user_type'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                phone=row['phone'],
+                date_of_birth=row['date_of_birth'],
+                gender=row['gender'],
+                created_at=row['created_at'],
+                is_active=row['is_active']
+            ))
+        
+        return users
+    
     def delete(self):
         """Soft delete user (set is_active to False)"""
         self.is_active = False
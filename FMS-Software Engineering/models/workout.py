@@ -1,6 +1,10 @@
 import json
+import re
+import sqlite3
 from datetime import datetime
 from config.database import DatabaseManager
+from services.exercise_catalog import ExerciseCatalog
+from services.name_search import NameSearch
 
 class Workout:
     def __init__(self, workout_id=None, member_id=None, trainer_id=None, 
@@ -76,7 +80,7 @@ class Workout:
         cursor.execute('''
             SELECT * FROM workouts 
             WHERE member_id = ? AND is_active = 1 
-            ORDER BY created_at DESC
+            ORDER BY created_epoch DESC, id DESC
         ''', (member_id,))
         rows = cursor.fetchall()
         
@@ -106,7 +110,7 @@ class Workout:
         cursor.execute('''
             SELECT * FROM workouts 
             WHERE trainer_id = ? AND is_active = 1 
-            ORDER BY created_at DESC
+            ORDER BY created_epoch DESC, id DESC
         ''', (trainer_id,))
         rows = cursor.fetchall()
         
@@ -126,6 +130,37 @@ class Workout:
         
         return workouts
     
+    @classmethod
+    def between(cls, start, end, member_id=None, trainer_id=None):
+        """Get active workouts created in [start, end) (local datetimes) for a member or trainer, newest first"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        owner_column, owner_id = ('member_id', member_id) if member_id is not None else ('trainer_id', trainer_id)
+        cursor.execute(f'''
+            SELECT * FROM workouts
+            WHERE {owner_column} = ? AND created_epoch >= ? AND created_epoch < ? AND is_active = 1
+            ORDER BY created_epoch DESC, id DESC
+        ''', (owner_id, DatabaseManager.to_unix_epoch(start), DatabaseManager.to_unix_epoch(end)))
+        rows = cursor.fetchall()
+        
+        workouts = []
+        for row in rows:
+            exercises = json.loads(row['exercises']) if row['exercises'] else []
+            workouts.append(cls(
+                workout_id=row['id'],
+                member_id=row['member_id'],
+                trainer_id=row['trainer_id'],
+                name=row['name'],
+                description=row['description'],
+                exercises=exercises,
+                created_at=row['created_at'],
+                is_active=row['is_active']
+            ))
+        
+        return workouts
+    
     def add_exercise(self, exercise):
         """Add an exercise to the workout"""
         self.exercises.append(exercise)
@@ -177,9 +212,25 @@ class Exercise:
                   self.instructions, self.difficulty_level, self.image_path))
             self.id = cursor.lastrowid
         
+        self.db.sync_muscle_group_tags(cursor, self.id, self.muscle_groups)
+        
         conn.commit()
+        ExerciseCatalog.invalidate()
+        NameSearch.exercise_changed(self.id, self.name)
         return self.id
     
+    def delete(self):
+        """Delete exercise and its muscle group tags"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("DELETE FROM exercise_muscle_groups WHERE exercise_id = ?", (self.id,))
+        cursor.execute("DELETE FROM exercises WHERE id = ?", (self.id,))
+        
+        conn.commit()
+        ExerciseCatalog.invalidate()
+        NameSearch.exercise_removed(self.id)
+    
     @classmethod
     def get_all(cls):
         """Get all exercises"""
@@ -215,6 +266,57 @@ class Exercise:
         cursor.execute("SELECT * FROM exercises WHERE category LIKE ? ORDER BY name", (f"%{category}%",))
         rows = cursor.fetchall()
         
+        exercises = []
+        for row in rows:
+            exercises.append(cls(
+                exercise_id=row['id'],
+                name=row['name'],
+                category=row['category'],
+                muscle_groups=row['muscle_groups'],
+                equipment=row['equipment'],
+                instructions=row['instructions'],
+                difficulty_level=row['difficulty_level'],
+                image_path=row['image_path']
+            ))
+        
+        return exercises
+    
+    @classmethod
+    def search(cls, query, limit=50):
+        """Full-text search over the exercise library, best matches first"""
+        # Every word must match, either whole or as a prefix (as-you-type)
+        terms = re.findall(r"\w+", query or "")
+        if not terms:
+            return []
+        match_expression = " ".join(f'"{term}"*' for term in terms)
+        
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # rank is BM25 with per-column weights (see create_exercise_search_index)
+            cursor.execute('''
+                SELECT e.* FROM (
+                    SELECT rowid, rank FROM exercises_fts
+                    WHERE exercises_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) AS hits
+                JOIN exercises e ON e.id = hits.rowid
+                ORDER BY hits.rank
+            ''', (match_expression, limit))
+        except sqlite3.OperationalError:
+            # No FTS5 index available, fall back to a plain scan
+            pattern = f"%{query.strip()}%"
+            cursor.execute('''
+                SELECT * FROM exercises
+                WHERE name LIKE ? OR category LIKE ? OR muscle_groups LIKE ? OR equipment LIKE ?
+                ORDER BY name
+                LIMIT ?
+            ''', (pattern, pattern, pattern, pattern, limit))
+        rows = cursor.fetchall()
+        
         exercises = []
         for row in rows:
             exercises.append(cls(
@@ -0,0 +1,178 @@
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from config.settings import AppSettings
+from services.ui_actions import UIActions
+
+class ActionProfile:
+    """Profiles gathered for one UI action, from every thread that worked on it"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = []  # One cProfile.Profile per stretch of work on one thread
+        self.samples = Counter()  # Collapsed stack -> sample count
+
+class ActionProfiler:
+    """--profile mode: profiles every UI action with cProfile and a stack sampler, and writes the results per action"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self, output_dir=None, sample_ms=None):
+        session = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.output_dir = os.path.join(output_dir or AppSettings.PROFILE_DIR, session)
+        self.sample_interval = (sample_ms or AppSettings.PROFILE_SAMPLE_MS) / 1000
+        self.state_lock = threading.Lock()
+        self.actions = {}  # UIAction -> ActionProfile
+        self.working = {}  # thread id -> ActionProfile being worked on
+        self.local = threading.local()
+        self.finished = []  # (seconds, action name, file stem)
+        self.thread = None
+        self.running = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared profiler"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def start(self):
+        """Profile the actions of buttons created from now on"""
+        if self.running:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.running = True
+        UIActions.add_listener(self)
+        UIActions.add_work_wrapper(self.profile_work)
+        self.thread = threading.Thread(target=self.sample, name="action-profiler", daemon=True)
+        self.thread.start()
+        print(f"Profiling UI actions into {self.output_dir}")
+    
+    def stop(self):
+        """Stop sampling and write the summary of the slowest actions"""
+        if not self.running:
+            return
+        self.running = False
+        UIActions.remove_listener(self)
+        UIActions.remove_work_wrapper(self.profile_work)
+        path = self.write_summary()
+        if path:
+            print(f"Profile summary written to {path}")
+    
+    def action_started(self, action):
+        with self.state_lock:
+            self.actions[action] = ActionProfile()
+    
+    def profile_work(self, action, func, *args):
+        with self.state_lock:
+            profile = self.actions.get(action)
+        if profile is None or getattr(self.local, 'profiling', False):
+            return func(*args)
+        
+        ident = threading.get_ident()
+        profiler = cProfile.Profile()
+        self.local.profiling = True
+        with self.state_lock:
+            self.working[ident] = profile
+        try:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+ allows one active profiler per process; the sampler still covers this work
+                profiler = None
+            try:
+                return func(*args)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                    with profile.lock:
+                        profile.profiles.append(profiler)
+        finally:
+            with self.state_lock:
+                self.working.pop(ident, None)
+            self.local.profiling = False
+    
+    def sample(self):
+        # cProfile can't follow one action across threads into a call tree; periodic stack samples can
+        while self.running:
+            time.sleep(self.sample_interval)
+            with self.state_lock:
+                working = list(self.working.items())
+            if not working:
+                continue
+            
+            frames = sys._current_frames()
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, profile in working:
+                frame = frames.get(ident)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)})")
+                    frame = frame.f_back
+                if stack:
+                    stack.append(thread_names.get(ident, "thread"))
+                    with profile.lock:
+                        profile.samples[";".join(reversed(stack))] += 1
+            del frames
+    
+    def action_finished(self, action):
+        with self.state_lock:
+            profile = self.actions.pop(action, None)
+        if profile is None or not (profile.profiles or profile.samples):
+            return
+        
+        file_name = re.sub(r"[^\w.-]+", "_", action.name)[:80]
+        stem = f"{len(self.finished) + 1:04d}_{file_name}"
+        self.finished.append((action.elapsed, action.name, stem))
+        path = os.path.join(self.output_dir, stem)
+        try:
+            with profile.lock:
+                profilers = list(profile.profiles)
+                samples = list(profile.samples.items())
+            if profilers:
+                stats = pstats.Stats(profilers[0])
+                for profiler in profilers[1:]:
+                    stats.add(profiler)
+                stats.dump_stats(path + ".pstats")
+            
+            # One "frame;frame;frame count" line per stack, as flamegraph.pl and speedscope read it
+            with open(path + ".folded", "w", encoding="utf-8") as folded:
+                for stack, count in samples:
+                    folded.write(f"{stack} {count}\n")
+        except Exception as e:
+            print(f"Could not write profile for {action.name}: {e}")
+    
+    def write_summary(self):
+        """Write the slowest actions of the session, by instance and by action name"""
+        if not self.finished:
+            return None
+        
+        by_name = {}
+        for seconds, name, _ in self.finished:
+            totals = by_name.setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] = max(totals[2], seconds)
+        
+        lines = [f"Slowest actions ({len(self.finished)} profiled)", ""]
+        lines.append(f"{'seconds':>9}  {'action':<50}  profile")
+        for seconds, name, stem in sorted(self.finished, reverse=True)[:AppSettings.PROFILE_SUMMARY_TOP]:
+            lines.append(f"{seconds:9.3f}  {name:<50}  {stem}")
+        
+        lines += ["", f"{'runs':>5}  {'total':>9}  {'mean':>9}  {'max':>9}  action"]
+        for name, (count, total, worst) in sorted(by_name.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{count:5}  {total:9.3f}  {total / count:9.3f}  {worst:9.3f}  {name}")
+        
+        path = os.path.join(self.output_dir, "summary.txt")
+        with open(path, "w", encoding="utf-8") as summary:
+            summary.write("\n".join(lines) + "\n")
+        return path
\ No newline at end of file
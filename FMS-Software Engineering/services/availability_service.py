@@ -0,0 +1,221 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from config.database import DatabaseManager
+from config.settings import AppSettings
+from services.metrics import CACHE_REQUESTS
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+def slot_mask(start_minute, end_minute):
+    """Bitmap of the slots touched by [start_minute, end_minute) within one day"""
+    first = max(0, start_minute // SLOT_MINUTES)
+    last = min(SLOTS_PER_DAY, -(-end_minute // SLOT_MINUTES))
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+def split_by_day(start, end, range_start, days):
+    """Yield (day index, start minute, end minute) for each day an epoch interval touches"""
+    while start < end:
+        day_index = (start - range_start) // 86400
+        day_start = range_start + day_index * 86400
+        part_end = min(end, day_start + 86400)
+        if 0 <= day_index < days:
+            yield day_index, (start - day_start) // 60, (part_end - day_start) // 60
+        start = part_end
+
+def bit_positions(bits):
+    """List the set bit positions of a small int bitmap in ascending order"""
+    positions = []
+    while bits:
+        lowest = bits & -bits
+        positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return positions
+
+class AvailabilityService:
+    """Per-trainer, per-day 15-minute occupancy bitmaps for finding open session slots"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # Bookings made from other terminals show up after at most this long
+    CACHE_SECONDS = 60
+    
+    def __init__(self):
+        self.days = {}  # date -> (loaded_at, {trainer_id: bitmap})
+        self.generation = 0  # Bumped by invalidate, so a load that raced it is not cached
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared availability service"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def invalidate(cls, session_date=None):
+        """Drop cached occupancy for the day of a session, or for every day"""
+        with cls._lock:
+            if cls._instance is None:
+                return
+            cls._instance.generation += 1
+            if session_date is None:
+                cls._instance.days = {}
+            else:
+                if isinstance(session_date, str):
+                    session_date = datetime.fromisoformat(session_date)
+                # A late session can run past midnight into the next day
+                for day in (session_date.date(), session_date.date() + timedelta(days=1)):
+                    cls._instance.days.pop(day, None)
+    
+    def occupancy(self, start_date, days):
+        """Get {date: {trainer_id: bitmap}} for a date range, loading stale or missing days"""
+        now = time.monotonic()
+        dates = [start_date + timedelta(days=i) for i in range(days)]
+        # ClassOccurrence.refresh invalidates from the background jobs thread, so read a snapshot
+        with self._lock:
+            cached = {d: self.days[d][1] for d in dates if d in self.days and now - self.days[d][0] <= self.CACHE_SECONDS}
+        missing = [d for d in dates if d not in cached]
+        CACHE_REQUESTS.inc(len(dates) - len(missing), cache="availability", result="hit")
+        CACHE_REQUESTS.inc(len(missing), cache="availability", result="miss")
+        if missing:
+            cached.update(self.load(min(missing), (max(missing) - min(missing)).days + 1))
+        return {d: cached[d] for d in dates}
+    
+    def load(self, start_date, days):
+        """Build and cache occupancy bitmaps for every trainer from sessions and class occurrences"""
+        with self._lock:
+            generation = self.generation
+        db = DatabaseManager()
+        cursor = db.get_connection().cursor()
+        
+        dates = [start_date + timedelta(days=i) for i in range(days)]
+        range_start = DatabaseManager.to_epoch(datetime.combine(start_date, datetime.min.time()))
+        range_end = range_start + days * 86400
+        
+        cursor.execute("SELECT id FROM users WHERE user_type = 'trainer' AND is_active = 1")
+        trainer_ids = [row['id'] for row in cursor.fetchall()]
+        bitmaps = {d: dict.fromkeys(trainer_ids, 0) for d in dates}
+        
+        # One range scan of idx_sessions_time covers every trainer
+        cursor.execute('''
+            SELECT trainer_id, start_epoch, end_epoch FROM sessions
+            WHERE start_epoch > ? AND start_epoch < ? AND end_epoch > ? AND status = 'scheduled'
+        ''', (range_start - AppSettings.MAX_SESSION_MINUTES * 60, range_end, range_start))
+        busy = [tuple(row) for row in cursor.fetchall()]
+        
+        # Class times are materialized in class_occurrences (see ClassOccurrence.refresh)
+        cursor.execute('''
+            SELECT trainer_id, start_epoch, end_epoch FROM class_occurrences
+            WHERE start_epoch > ? AND start_epoch < ? AND end_epoch > ?
+              AND status = 'scheduled' AND trainer_id IS NOT NULL
+        ''', (range_start - AppSettings.MAX_SESSION_MINUTES * 60, range_end, range_start))
+        busy.extend(tuple(row) for row in cursor.fetchall())
+        db.close_connection()
+        
+        for trainer_id, start, end in busy:
+            for day_index, start_minute, end_minute in split_by_day(start, end, range_start, days):
+                day_bitmaps = bitmaps[dates[day_index]]
+                day_bitmaps[trainer_id] = day_bitmaps.get(trainer_id, 0) | slot_mask(start_minute, end_minute)
+        
+        loaded_at = time.monotonic()
+        with self._lock:
+            # An invalidation while loading may mean these rows are already out of date
+            if self.generation == generation:
+                for d in dates:
+                    self.days[d] = (loaded_at, bitmaps[d])
+        return bitmaps
+    
+    def member_busy(self, member_id, start_date, days):
+        """Get {date: bitmap} of a member's own scheduled sessions"""
+        db = DatabaseManager()
+        cursor = db.get_connection().cursor()
+        range_start = DatabaseManager.to_epoch(datetime.combine(start_date, datetime.min.time()))
+        cursor.execute('''
+            SELECT start_epoch, end_epoch FROM sessions
+            WHERE member_id = ? AND start_epoch > ? AND start_epoch < ? AND end_epoch > ? AND status = 'scheduled'
+        ''', (member_id, range_start - AppSettings.MAX_SESSION_MINUTES * 60, range_start + days * 86400, range_start))
+        rows = cursor.fetchall()
+        db.close_connection()
+        
+        busy = {}
+        for start, end in rows:
+            for day_index, start_minute, end_minute in split_by_day(start, end, range_start, days):
+                d = start_date + timedelta(days=day_index)
+                busy[d] = busy.get(d, 0) | slot_mask(start_minute, end_minute)
+        return busy
+    
+    @staticmethod
+    def open_starts(bitmap, duration, first_slot, last_slot):
+        """Get slot indexes in [first_slot, last_slot) where a session of duration minutes fits"""
+        needed = -(-duration // SLOT_MINUTES)
+        free = ~bitmap & slot_mask(first_slot * SLOT_MINUTES, last_slot * SLOT_MINUTES)
+        # A start is open when it and the next needed - 1 slots are all free
+        fits = free
+        for shift in range(1, needed):
+            fits &= free >> shift
+        return bit_positions(fits)
+    
+    def slot_window(self, day, earliest, day_start_hour, day_end_hour):
+        """Get the bookable [first_slot, last_slot) of a day, skipping times already past"""
+        first_slot = day_start_hour * 60 // SLOT_MINUTES
+        last_slot = day_end_hour * 60 // SLOT_MINUTES
+        if day < earliest.date():
+            return first_slot, first_slot
+        if day == earliest.date():
+            # Round up to the next slot boundary
+            minutes_now = earliest.hour * 60 + earliest.minute + 1
+            first_slot = max(first_slot, -(-minutes_now // SLOT_MINUTES))
+        return first_slot, last_slot
+    
+    def open_slots(self, trainer_id, day, duration, member_id=None,
+                   day_start_hour=6, day_end_hour=22, earliest=None):
+        """Get the open start times of one trainer on one day"""
+        bitmap = self.occupancy(day, 1)[day].get(trainer_id, 0)
+        if member_id:
+            bitmap |= self.member_busy(member_id, day, 1).get(day, 0)
+        
+        first_slot, last_slot = self.slot_window(day, earliest or datetime.now(), day_start_hour, day_end_hour)
+        day_midnight = datetime.combine(day, datetime.min.time())
+        return [
+            day_midnight + timedelta(minutes=slot * SLOT_MINUTES)
+            for slot in self.open_starts(bitmap, duration, first_slot, last_slot)
+        ]
+    
+    def find_slots(self, start_date, days, duration, trainer_ids=None, member_id=None,
+                   day_start_hour=6, day_end_hour=22, earliest=None, limit=None):
+        """Get open (start datetime, trainer_id) pairs across trainers, earliest first"""
+        earliest = earliest or datetime.now()
+        occupancy = self.occupancy(start_date, days)
+        member_busy = self.member_busy(member_id, start_date, days) if member_id else {}
+        
+        slots = []
+        for day in sorted(occupancy):
+            first_slot, last_slot = self.slot_window(day, earliest, day_start_hour, day_end_hour)
+            if first_slot >= last_slot:
+                continue
+            
+            day_slots = []
+            for trainer_id, bitmap in occupancy[day].items():
+                if trainer_ids is not None and trainer_id not in trainer_ids:
+                    continue
+                for slot in self.open_starts(bitmap | member_busy.get(day, 0), duration, first_slot, last_slot):
+                    day_slots.append((slot, trainer_id))
+            day_slots.sort()
+            
+            # Only build datetimes for slots that are returned
+            if limit is not None:
+                day_slots = day_slots[:limit - len(slots)]
+            day_midnight = datetime.combine(day, datetime.min.time())
+            slots.extend(
+                (day_midnight + timedelta(minutes=slot * SLOT_MINUTES), trainer_id)
+                for slot, trainer_id in day_slots
+            )
+            if limit is not None and len(slots) >= limit:
+                break
+        
+        return slots
\ No newline at end of file
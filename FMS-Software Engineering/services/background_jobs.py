@@ -0,0 +1,84 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+class BackgroundJobs:
+    """Runs registered maintenance jobs periodically on one daemon thread"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.jobs = {}  # name -> [next_delay(), func, next_run]
+        self.jobs_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.running = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared background job runner"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def register(self, name, interval_seconds, func, run_now=True):
+        """Run func every interval_seconds, first right away unless run_now is False"""
+        self.add_job(name, lambda: interval_seconds, func, run_now)
+    
+    def register_daily(self, name, hour, func, run_now=True):
+        """Run func every night at the given local hour, and right away unless run_now is False"""
+        def seconds_until_hour():
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            return (next_run - now).total_seconds()
+        
+        self.add_job(name, seconds_until_hour, func, run_now)
+    
+    def add_job(self, name, next_delay, func, run_now):
+        with self.jobs_lock:
+            next_run = time.monotonic() if run_now else time.monotonic() + next_delay()
+            self.jobs[name] = [next_delay, func, next_run]
+        self.wakeup.set()
+    
+    def run_soon(self, name):
+        """Run a registered job at the next opportunity"""
+        with self.jobs_lock:
+            if name in self.jobs:
+                self.jobs[name][2] = time.monotonic()
+        self.wakeup.set()
+    
+    def start(self):
+        """Start the job thread"""
+        if self.thread is None or not self.thread.is_alive():
+            self.running = True
+            self.thread = threading.Thread(target=self.run, name="background-jobs", daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        """Stop the job thread after the current job finishes"""
+        self.running = False
+        self.wakeup.set()
+    
+    def run(self):
+        while self.running:
+            now = time.monotonic()
+            with self.jobs_lock:
+                due = [(name, job[1]) for name, job in self.jobs.items() if job[2] <= now]
+                for name, _ in due:
+                    self.jobs[name][2] = now + self.jobs[name][0]()
+            
+            for name, func in due:
+                try:
+                    func()
+                except Exception as e:
+                    # A failing job is retried at its next interval
+                    print(f"Background job {name} failed: {e}")
+            
+            with self.jobs_lock:
+                next_run = min((job[2] for job in self.jobs.values()), default=now + 60)
+            self.wakeup.wait(max(0, next_run - time.monotonic()))
+            self.wakeup.clear()
\ No newline at end of file
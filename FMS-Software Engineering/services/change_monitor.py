@@ -0,0 +1,77 @@
+from config.database import DatabaseManager
+from config.settings import AppSettings
+
+class ChangeMonitor:
+    """Polls the database from the Tk loop and hands watchers only the rows written since the last check"""
+    
+    def __init__(self, widget, interval_ms=None):
+        self.widget = widget
+        self.interval_ms = interval_ms or AppSettings.CHANGE_POLL_MS
+        self.db = DatabaseManager()
+        self.watches = []  # [table, column, owner_column, owner_id, callback, high-water mark]
+        self.change_callbacks = []
+        self.data_version = None
+        self.job = None
+    
+    def watch(self, table, column, owner_column, owner_id, callback):
+        """Call callback(rows) with an owner's rows whose column rises past its current maximum"""
+        # column must only ever grow: an AUTOINCREMENT id, or a change_seq kept by triggers
+        cursor = self.db.get_connection().cursor()
+        cursor.execute(f"SELECT max({column}) FROM {table} WHERE {owner_column} = ?", (owner_id,))
+        high_water = cursor.fetchone()[0] or 0
+        self.watches.append([table, column, owner_column, owner_id, callback, high_water])
+    
+    def on_change(self, callback):
+        """Call callback() after any commit to the database"""
+        self.change_callbacks.append(callback)
+    
+    def start(self):
+        """Start polling"""
+        self.data_version = self.read_data_version()
+        self.schedule()
+    
+    def stop(self):
+        """Stop polling and release the connection"""
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        self.db.close_connection()
+    
+    def schedule(self):
+        self.job = self.widget.after(self.interval_ms, self.poll)
+    
+    def read_data_version(self):
+        # Changes whenever another connection (this process or another terminal) commits
+        cursor = self.db.get_connection().cursor()
+        cursor.execute("PRAGMA data_version")
+        return cursor.fetchone()[0]
+    
+    def poll(self):
+        """Check for commits and pass on what changed; a quiet database costs one pragma"""
+        self.job = None
+        try:
+            data_version = self.read_data_version()
+            if data_version != self.data_version:
+                self.data_version = data_version
+                self.dispatch()
+        except Exception as e:
+            # A busy or locked database is simply checked again next time
+            print(f"Change monitor poll failed: {e}")
+        self.schedule()
+    
+    def dispatch(self):
+        cursor = self.db.get_connection().cursor()
+        for watch in list(self.watches):
+            table, column, owner_column, owner_id, callback, high_water = watch
+            cursor.execute(f'''
+                SELECT * FROM {table}
+                WHERE {owner_column} = ? AND {column} > ?
+                ORDER BY {column}
+            ''', (owner_id, high_water))
+            rows = cursor.fetchall()
+            if rows:
+                watch[5] = rows[-1][column]
+                callback(rows)
+        
+        for callback in list(self.change_callbacks):
+            callback()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import json
+import re
+from datetime import date, datetime, timedelta
+
+# Schedules are stored in classes.schedule as JSON, e.g.
+#   {"freq": "weekly", "interval": 1, "byday": ["MO", "WE"], "at": "18:00",
+#    "start": "2026-01-05", "until": "2026-06-29"}
+# freq is "daily" or "weekly"; interval, byday (weekly only), start, until and count are optional.
+# Without a start, every-n-days/weeks rules count their periods from the class's creation date.
+WEEKDAY_CODES = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+FREQUENCIES = ['daily', 'weekly']
+
+def parse_rule(schedule):
+    """Get the recurrence rule dict of a stored schedule, or None if it has no usable times"""
+    if not schedule:
+        return None
+    try:
+        rule = json.loads(schedule)
+    except ValueError:
+        # Classes created before structured schedules hold free text
+        return parse_legacy_schedule(schedule)
+    if not isinstance(rule, dict) or rule.get('freq') not in FREQUENCIES or not rule.get('at'):
+        return None
+    if rule['freq'] == 'weekly' and not rule.get('byday'):
+        return None
+    return rule
+
+def parse_legacy_schedule(text):
+    """Convert free text such as 'Mondays and Wednesdays at 6:00 PM' into a weekly rule"""
+    text = text.lower()
+    if 'daily' in text or 'every day' in text:
+        weekdays = list(range(7))
+    else:
+        weekdays = [i for i, name in enumerate(WEEKDAY_NAMES) if name.lower() in text]
+        if 'weekday' in text:
+            weekdays = sorted(set(weekdays) | {0, 1, 2, 3, 4})
+        if 'weekend' in text:
+            weekdays = sorted(set(weekdays) | {5, 6})
+    
+    match = re.search(r'(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\b', text) or re.search(r'\b(\d{1,2}):(\d{2})()', text)
+    if not weekdays or not match:
+        return None
+    
+    hour = int(match.group(1)) % 12 if match.group(3) else int(match.group(1))
+    if match.group(3) == 'p':
+        hour += 12
+    minute = int(match.group(2) or 0)
+    if hour > 23 or minute > 59:
+        return None
+    return {
+        'freq': 'weekly',
+        'byday': [WEEKDAY_CODES[i] for i in weekdays],
+        'at': f"{hour:02d}:{minute:02d}"
+    }
+
+def dump_rule(rule):
+    """Serialize a recurrence rule for classes.schedule"""
+    return json.dumps(rule, sort_keys=True)
+
+def describe_rule(rule):
+    """Describe a recurrence rule for display, e.g. 'Every Mon, Wed at 06:00 PM'"""
+    if rule is None:
+        return "No schedule"
+    
+    interval = rule.get('interval', 1)
+    at = datetime.strptime(rule['at'], '%H:%M').strftime('%I:%M %p')
+    if rule['freq'] == 'daily':
+        repeat = "Every day" if interval == 1 else f"Every {interval} days"
+    else:
+        days = ", ".join(WEEKDAY_NAMES[WEEKDAY_CODES.index(code)] for code in rule['byday'])
+        repeat = f"Every {days}" if interval == 1 else f"Every {interval} weeks on {days}"
+    
+    text = f"{repeat} at {at}"
+    if rule.get('until'):
+        text += f" until {date.fromisoformat(rule['until']).strftime('%b %d, %Y')}"
+    elif rule.get('count'):
+        text += f" ({rule['count']} times)"
+    return text
+
+def to_day(value):
+    """Get the date of a date, datetime or stored timestamp string, or None"""
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value)[:10])
+
+def iter_occurrences(rule, window_start, window_end=None, created_at=None):
+    """Lazily yield the start datetimes of a rule in [window_start, window_end), in order"""
+    if rule is None:
+        return
+    
+    hour, minute = (int(part) for part in rule['at'].split(':'))
+    interval = max(1, int(rule.get('interval', 1)))
+    first_day = date.fromisoformat(rule['start']) if rule.get('start') else None
+    last_day = date.fromisoformat(rule['until']) if rule.get('until') else None
+    count = rule.get('count')
+    # With no start, anchoring on the window would shift which weeks an every-2-weeks rule hits
+    period_anchor = first_day or to_day(created_at) or window_start.date()
+    
+    if rule['freq'] == 'daily':
+        step = timedelta(days=interval)
+        offsets = [timedelta(0)]
+        anchor = period_anchor
+    else:
+        # Walk week by week from the Monday of the anchor week
+        step = timedelta(weeks=interval)
+        offsets = [timedelta(days=WEEKDAY_CODES.index(code)) for code in sorted(rule['byday'], key=WEEKDAY_CODES.index)]
+        anchor = period_anchor - timedelta(days=period_anchor.weekday())
+    
+    # A count limit is measured from the first occurrence, so counting must start there
+    period_start = anchor
+    if count is None and window_start.date() > anchor:
+        periods_skipped = (window_start.date() - anchor).days // step.days
+        period_start = anchor + step * max(0, periods_skipped - 1)
+    
+    produced = 0
+    while True:
+        for offset in offsets:
+            day = period_start + offset
+            if first_day and day < first_day:
+                continue
+            if (last_day and day > last_day) or (count is not None and produced >= count):
+                return
+            start_time = datetime.combine(day, datetime.min.time()).replace(hour=hour, minute=minute)
+            if window_end is not None and start_time >= window_end:
+                return
+            produced += 1
+            if start_time >= window_start:
+                yield start_time
+        period_start += step
\ No newline at end of file
@@ -0,0 +1,254 @@
+import asyncio
+import smtplib
+import threading
+import time
+import uuid
+from email.message import EmailMessage
+from config.database import DatabaseManager
+from config.settings import AppSettings
+
+class EmailOutbox:
+    """Sends queued notification emails from an asyncio loop on a daemon thread, over one reused SMTP connection"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # Slack on a claim beyond the rate-capped send time, covering a slow SMTP server
+    CLAIM_MARGIN_SECONDS = 300
+    
+    def __init__(self, db_path=None, smtp_server=None, smtp_port=None, use_tls=None,
+                 username=None, password=None, sender=None, rate_per_minute=None):
+        self.db = DatabaseManager(db_path) if db_path else DatabaseManager()
+        self.smtp_server = smtp_server or AppSettings.SMTP_SERVER
+        self.smtp_port = smtp_port or AppSettings.SMTP_PORT
+        self.use_tls = AppSettings.SMTP_USE_TLS if use_tls is None else use_tls
+        self.username = AppSettings.EMAIL_USERNAME if username is None else username
+        self.password = AppSettings.EMAIL_PASSWORD if password is None else password
+        self.sender = sender or AppSettings.EMAIL_FROM or self.username
+        self.send_interval = 60.0 / (rate_per_minute or AppSettings.EMAIL_RATE_PER_MINUTE)
+        self.claim_token = uuid.uuid4().hex  # Marks the rows this outbox has claimed
+        
+        self.smtp = None
+        self.last_send = 0.0
+        self.last_activity = 0.0
+        self.loop = None
+        self.wakeup = None
+        self.thread = None
+        self.running = False
+        self.stopping = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared outbox"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def notify(cls):
+        """Wake the delivery loop after queueing mail, instead of waiting for its next poll"""
+        outbox = cls._instance
+        if outbox is not None and outbox.loop is not None and outbox.running:
+            outbox.loop.call_soon_threadsafe(outbox.wakeup.set)
+    
+    def start(self):
+        """Start delivering on a background thread"""
+        if self.thread is None or not self.thread.is_alive():
+            self.running = True
+            self.stopping = False
+            self.thread = threading.Thread(target=lambda: asyncio.run(self.run()), name="email-outbox", daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        """Stop delivering after the message being sent"""
+        self.running = False
+        self.stopping = True
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+    
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+        while self.running:
+            try:
+                await self.deliver_due()
+            except Exception as e:
+                # The database may be busy; the messages stay queued for the next pass
+                print(f"Email delivery failed: {e}")
+            
+            if self.smtp is not None and time.monotonic() - self.last_activity > AppSettings.EMAIL_IDLE_SECONDS:
+                await asyncio.to_thread(self.disconnect)
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), AppSettings.EMAIL_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+        await asyncio.to_thread(self.disconnect)
+    
+    async def deliver_due(self):
+        """Send every message that is due, batch by batch; returns how many were sent"""
+        sent = 0
+        while not self.stopping:
+            batch = await asyncio.to_thread(self.claim_batch)
+            if not batch:
+                return sent
+            batch_sent, finished = await self.deliver_batch(batch)
+            sent += batch_sent
+            if not finished:
+                return sent
+        return sent
+    
+    async def deliver_batch(self, batch):
+        """Send a claimed batch; returns (messages sent, whether the connection held up)"""
+        sent = 0
+        for index, message in enumerate(batch):
+            # Rate cap: space sends out evenly
+            delay = self.last_send + self.send_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            # The batch may have outlasted its claim and been taken over by another terminal
+            if not await asyncio.to_thread(self.renew_claim, batch[index:]):
+                continue
+            self.last_send = self.last_activity = time.monotonic()
+            
+            try:
+                await asyncio.to_thread(self.send, message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                # The server answered but won't take this message; 4xx replies are worth retrying
+                if isinstance(e, smtplib.SMTPRecipientsRefused):
+                    codes = [code for code, _ in e.recipients.values()]
+                else:
+                    codes = [e.smtp_code]
+                permanent = min(codes) >= 500
+                await asyncio.to_thread(self.mark_failed, message, e, permanent)
+            except (OSError, smtplib.SMTPException) as e:
+                # Connection trouble: drop the connection and retry the rest of the batch later
+                await asyncio.to_thread(self.disconnect)
+                await asyncio.to_thread(self.mark_failed, message, e, False)
+                await asyncio.to_thread(self.release, batch[index + 1:])
+                return sent, False
+            except Exception as e:
+                # The message itself can't be sent (e.g. a malformed address)
+                await asyncio.to_thread(self.mark_failed, message, e, True)
+            else:
+                await asyncio.to_thread(self.mark_sent, message)
+                sent += 1
+        return sent, True
+    
+    def claim_batch(self):
+        """Claim due messages so no other terminal sends them too"""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        now = int(time.time())
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # 'sending' rows whose claim expired were left by a terminal that stopped mid-batch
+            cursor.execute('''
+                SELECT * FROM email_outbox
+                WHERE status IN ('pending', 'sending') AND next_attempt_epoch <= ?
+                ORDER BY next_attempt_epoch, id
+                LIMIT ?
+            ''', (now, AppSettings.EMAIL_BATCH_SIZE))
+            batch = cursor.fetchall()
+            if batch:
+                # Long enough to send the whole batch at the rate cap; renewed as it goes
+                claimed_until = now + int(len(batch) * self.send_interval) + self.CLAIM_MARGIN_SECONDS
+                placeholders = ", ".join("?" * len(batch))
+                cursor.execute(f'''
+                    UPDATE email_outbox SET status = 'sending', next_attempt_epoch = ?, claim_token = ?
+                    WHERE id IN ({placeholders})
+                ''', (claimed_until, self.claim_token, *[message['id'] for message in batch]))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return batch
+    
+    def renew_claim(self, remaining):
+        """Extend the claim on the rest of a batch; False if its next message was taken over meanwhile"""
+        conn = self.db.get_connection()
+        claimed_until = int(time.time() + len(remaining) * self.send_interval) + self.CLAIM_MARGIN_SECONDS
+        cursor = conn.execute('''
+            UPDATE email_outbox SET next_attempt_epoch = ?
+            WHERE id = ? AND status = 'sending' AND claim_token = ?
+        ''', (claimed_until, remaining[0]['id'], self.claim_token))
+        owned = cursor.rowcount == 1
+        if owned and len(remaining) > 1:
+            placeholders = ", ".join("?" * (len(remaining) - 1))
+            conn.execute(f'''
+                UPDATE email_outbox SET next_attempt_epoch = ?
+                WHERE id IN ({placeholders}) AND status = 'sending' AND claim_token = ?
+            ''', (claimed_until, *[message['id'] for message in remaining[1:]], self.claim_token))
+        conn.commit()
+        return owned
+    
+    def mark_sent(self, message):
+        conn = self.db.get_connection()
+        conn.execute('''
+            UPDATE email_outbox SET status = 'sent', attempts = attempts + 1, sent_epoch = ?, last_error = NULL
+            WHERE id = ?
+        ''', (int(time.time()), message['id']))
+        conn.commit()
+    
+    def mark_failed(self, message, error, permanent):
+        """Schedule a retry with exponential backoff, or dead-letter the message"""
+        attempts = message['attempts'] + 1
+        if permanent or attempts >= AppSettings.EMAIL_MAX_ATTEMPTS:
+            status, next_attempt = 'dead', int(time.time())
+        else:
+            delay = min(AppSettings.EMAIL_RETRY_SECONDS * 2 ** (attempts - 1), AppSettings.EMAIL_MAX_RETRY_SECONDS)
+            status, next_attempt = 'pending', int(time.time() + delay)
+        
+        conn = self.db.get_connection()
+        conn.execute('''
+            UPDATE email_outbox SET status = ?, attempts = ?, next_attempt_epoch = ?, last_error = ?
+            WHERE id = ?
+        ''', (status, attempts, next_attempt, str(error)[:500], message['id']))
+        conn.commit()
+    
+    def release(self, batch):
+        """Hand claimed but unsent messages back, retried after the first backoff step"""
+        if not batch:
+            return
+        conn = self.db.get_connection()
+        placeholders = ", ".join("?" * len(batch))
+        conn.execute(f'''
+            UPDATE email_outbox SET status = 'pending', next_attempt_epoch = ?
+            WHERE id IN ({placeholders}) AND status = 'sending' AND claim_token = ?
+        ''', (int(time.time()) + AppSettings.EMAIL_RETRY_SECONDS, *[message['id'] for message in batch], self.claim_token))
+        conn.commit()
+    
+    def connect(self):
+        if self.smtp is not None:
+            return self.smtp
+        smtp = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.smtp = smtp
+        return smtp
+    
+    def disconnect(self):
+        if self.smtp is None:
+            return
+        try:
+            self.smtp.quit()
+        except (OSError, smtplib.SMTPException):
+            self.smtp.close()
+        self.smtp = None
+    
+    def send(self, message):
+        email = EmailMessage()
+        email['From'] = self.sender
+        email['To'] = message['recipient']
+        email['Subject'] = message['subject']
+        email.set_content(message['body'])
+        self.connect().send_message(email)
\ No newline at end of file
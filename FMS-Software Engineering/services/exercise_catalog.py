@@ -0,0 +1,213 @@
+import threading
+from collections import namedtuple
+from config.database import DatabaseManager
+from services.metrics import CACHE_REQUESTS
+
+# Compact, read-only row used by pickers and library views
+ExerciseRecord = namedtuple('ExerciseRecord', [
+    'id', 'name', 'category', 'muscle_groups', 'equipment',
+    'instructions', 'difficulty_level', 'image_path'
+])
+
+# Facets the library can be filtered by; muscle_group comes from the tag table
+FACETS = ('category', 'equipment', 'difficulty_level', 'muscle_group')
+
+def make_bitset(positions, size):
+    """Build an int bitset with the given bit positions set"""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, 'little')
+
+def bitset_count(bits):
+    """Count the set bits in an int bitset"""
+    return bin(bits).count("1")
+
+def bitset_positions(bits, limit=None):
+    """List the set bit positions of an int bitset in ascending order"""
+    positions = []
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    for byte_index, byte in enumerate(data):
+        if not byte:
+            continue
+        for bit in range(8):
+            if byte >> bit & 1:
+                positions.append(byte_index * 8 + bit)
+                if limit is not None and len(positions) >= limit:
+                    return positions
+    return positions
+
+class ExerciseCatalog:
+    """Process-wide in-memory exercise library, invalidated by Exercise.save"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.records = []
+        self.by_id = {}
+        self.by_name = {}
+        self.by_category = {}
+        self.by_equipment = {}
+        self.muscle_groups_by_id = {}
+        self.position_by_id = {}
+        self.facet_bits = {facet: {} for facet in FACETS}
+        self.all_bits = 0
+        self.is_loaded = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared catalog, loading it if needed"""
+        catalog = cls._instance
+        if catalog is None or not catalog.is_loaded:
+            CACHE_REQUESTS.inc(cache="exercise_catalog", result="miss")
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                catalog = cls._instance
+                if not catalog.is_loaded:
+                    catalog.load()
+        else:
+            CACHE_REQUESTS.inc(cache="exercise_catalog", result="hit")
+        return catalog
+    
+    @classmethod
+    def invalidate(cls):
+        """Drop the cached library so the next read reloads it"""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.is_loaded = False
+    
+    def load(self):
+        """Load every exercise and rebuild the indexes"""
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT id, name, category, muscle_groups, equipment,
+                   instructions, difficulty_level, image_path
+            FROM exercises
+            ORDER BY name, id
+        ''')
+        records = [ExerciseRecord(*tuple(row)) for row in cursor.fetchall()]
+        
+        cursor.execute("SELECT exercise_id, muscle_group FROM exercise_muscle_groups ORDER BY muscle_group")
+        muscle_groups_by_id = {}
+        for exercise_id, muscle_group in cursor.fetchall():
+            muscle_groups_by_id.setdefault(exercise_id, []).append(muscle_group)
+        db.close_connection()
+        
+        by_id = {}
+        by_name = {}
+        by_category = {}
+        by_equipment = {}
+        position_by_id = {}
+        facet_positions = {facet: {} for facet in FACETS}
+        for position, record in enumerate(records):
+            by_id[record.id] = record
+            position_by_id[record.id] = position
+            # Pickers show names, so the first exercise with a given name wins
+            by_name.setdefault(record.name, record)
+            by_category.setdefault(record.category, []).append(record)
+            by_equipment.setdefault(record.equipment, []).append(record)
+            
+            # Inverted index: facet value -> catalog positions
+            for facet in ('category', 'equipment', 'difficulty_level'):
+                value = getattr(record, facet)
+                if value:
+                    facet_positions[facet].setdefault(value, []).append(position)
+            for muscle_group in muscle_groups_by_id.get(record.id, []):
+                facet_positions['muscle_group'].setdefault(muscle_group, []).append(position)
+        
+        size = len(records)
+        facet_bits = {
+            facet: {value: make_bitset(positions, size) for value, positions in values.items()}
+            for facet, values in facet_positions.items()
+        }
+        
+        # Swap everything in at once so readers never see a half-built catalog
+        self.records = records
+        self.by_id = by_id
+        self.by_name = by_name
+        self.by_category = by_category
+        self.by_equipment = by_equipment
+        self.muscle_groups_by_id = muscle_groups_by_id
+        self.position_by_id = position_by_id
+        self.facet_bits = facet_bits
+        self.all_bits = (1 << size) - 1
+        self.is_loaded = True
+    
+    def all(self):
+        """Get all exercises ordered by name"""
+        return list(self.records)
+    
+    def names(self):
+        """Get the distinct exercise names in display order"""
+        return list(self.by_name)
+    
+    def get_by_id(self, exercise_id):
+        """Get an exercise by ID"""
+        return self.by_id.get(exercise_id)
+    
+    def get_by_name(self, name):
+        """Get an exercise by its exact name"""
+        return self.by_name.get(name)
+    
+    def get_by_category(self, category):
+        """Get exercises in a category"""
+        return list(self.by_category.get(category, []))
+    
+    def get_by_equipment(self, equipment):
+        """Get exercises that use a piece of equipment"""
+        return list(self.by_equipment.get(equipment, []))
+    
+    def get_muscle_groups(self, exercise_id):
+        """Get the normalized muscle group tags of an exercise"""
+        return list(self.muscle_groups_by_id.get(exercise_id, []))
+    
+    def bits_for_ids(self, exercise_ids):
+        """Build a bitset covering the given exercise IDs"""
+        positions = [self.position_by_id[i] for i in exercise_ids if i in self.position_by_id]
+        return make_bitset(positions, len(self.records))
+    
+    def selection_bits(self, filters, exercise_ids=None, skip_facet=None):
+        """Intersect the bitsets of every selected facet value"""
+        bits = self.all_bits if exercise_ids is None else self.bits_for_ids(exercise_ids)
+        for facet, value in (filters or {}).items():
+            if value is None or facet == skip_facet:
+                continue
+            bits &= self.facet_bits[facet].get(value, 0)
+            if not bits:
+                break
+        return bits
+    
+    def filter(self, filters=None, exercise_ids=None, limit=None):
+        """Get exercises matching every selected facet value (filters maps facet -> value or None)"""
+        bits = self.selection_bits(filters, exercise_ids)
+        if exercise_ids is not None:
+            # Search hits keep their relevance order
+            records = [
+                self.by_id[i] for i in exercise_ids
+                if i in self.position_by_id and bits >> self.position_by_id[i] & 1
+            ]
+            return records[:limit] if limit is not None else records
+        
+        return [self.records[position] for position in bitset_positions(bits, limit)]
+    
+    def count(self, filters=None, exercise_ids=None):
+        """Count exercises matching every selected facet value"""
+        return bitset_count(self.selection_bits(filters, exercise_ids))
+    
+    def facet_counts(self, filters=None, exercise_ids=None):
+        """Count matches per facet value given the other selected facets"""
+        # Each facet ignores its own selection, so counts show what picking a value would return
+        counts = {}
+        for facet in FACETS:
+            bits = self.selection_bits(filters, exercise_ids, skip_facet=facet)
+            values = {}
+            for value, value_bits in self.facet_bits[facet].items():
+                count = bitset_count(value_bits & bits)
+                if count:
+                    values[value] = count
+            counts[facet] = dict(sorted(values.items()))
+        return counts
\ No newline at end of file
@@ -0,0 +1,175 @@
+import hashlib
+import os
+import queue
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import customtkinter as ctk
+from PIL import Image, ImageOps
+from config.settings import AppSettings
+from services.metrics import CACHE_REQUESTS, queued
+
+class ImageService:
+    """Thumbnail pipeline: worker pool, on-disk cache and an in-memory LRU of CTkImages"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # How often the Tk thread picks up finished thumbnails
+    DRAIN_INTERVAL_MS = 30
+    
+    def __init__(self, max_workers=None, cache_mb=None):
+        AppSettings.create_directories()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or AppSettings.THUMBNAIL_WORKERS,
+            thread_name_prefix="thumbnails"
+        )
+        self.max_cache_bytes = (cache_mb or AppSettings.IMAGE_CACHE_MB) * 1024 * 1024
+        self.cache = OrderedDict()  # (path, size) -> (CTkImage, bytes), oldest first
+        self.cache_bytes = 0
+        self.pending = {}  # (path, size) -> callbacks waiting on the Tk thread
+        self.completed = queue.Queue()
+        self.content_hashes = {}
+        self.blanks = {}  # size -> transparent CTkImage
+        self.drain_scheduled = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared image service"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    @staticmethod
+    def store_image(source_path, prefix):
+        """Copy a picked image into the app's images folder and return its new path"""
+        AppSettings.create_directories()
+        extension = os.path.splitext(source_path)[1].lower()
+        # Two uploads can land in the same second
+        file_name = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{extension}"
+        image_path = os.path.join(AppSettings.IMAGES_DIR, file_name)
+        shutil.copy2(source_path, image_path)
+        return image_path
+    
+    def blank(self, size=None):
+        """Get a shared transparent CTkImage, for clearing a label's image (call on the Tk thread)"""
+        size = tuple(size or AppSettings.THUMBNAIL_SIZE)
+        image = self.blanks.get(size)
+        if image is None:
+            pil_image = Image.new("RGBA", size, (0, 0, 0, 0))
+            image = self.blanks[size] = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=size)
+        return image
+    
+    def request(self, widget, image_path, callback, size=None):
+        """Call back on the Tk thread with a CTkImage thumbnail, or None if it can't be loaded"""
+        size = tuple(size or AppSettings.THUMBNAIL_SIZE)
+        key = (image_path, size)
+        
+        cached = self.cache.get(key)
+        if cached is not None:
+            CACHE_REQUESTS.inc(cache="thumbnails", result="hit")
+            self.cache.move_to_end(key)
+            callback(cached[0])
+            return
+        CACHE_REQUESTS.inc(cache="thumbnails", result="miss")
+        
+        # Several cards can show the same image; decode it once
+        if key in self.pending:
+            self.pending[key].append(callback)
+            return
+        
+        self.pending[key] = [callback]
+        future = self.executor.submit(queued("thumbnails", self.load_thumbnail), image_path, size)
+        future.add_done_callback(lambda f: self.completed.put((key, f)))
+        self.schedule_drain(widget)
+    
+    def schedule_drain(self, widget):
+        if not self.drain_scheduled:
+            self.drain_scheduled = True
+            # Poll from the root window so closing the requesting view doesn't stop the loop
+            root = widget.nametowidget('.')
+            root.after(self.DRAIN_INTERVAL_MS, lambda: self.drain(root))
+    
+    def drain(self, root):
+        """Turn finished thumbnails into CTkImages and run their callbacks"""
+        self.drain_scheduled = False
+        while True:
+            try:
+                key, future = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                pil_image = future.result()
+            except Exception as e:
+                print(f"Thumbnail error for {key[0]}: {e}")
+                pil_image = None
+            
+            image = None
+            if pil_image is not None:
+                # Tk images must be created on the Tk thread
+                image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=pil_image.size)
+                self.remember(key, image, pil_image.width * pil_image.height * 4)
+            
+            for callback in self.pending.pop(key, []):
+                callback(image)
+        
+        if self.pending:
+            self.schedule_drain(root)
+    
+    def remember(self, key, image, size_bytes):
+        """Add an image to the LRU, evicting the least recently used over the budget"""
+        self.cache[key] = (image, size_bytes)
+        self.cache_bytes += size_bytes
+        while self.cache_bytes > self.max_cache_bytes and len(self.cache) > 1:
+            _, (_, evicted_bytes) = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted_bytes
+    
+    def content_hash(self, image_path):
+        """Hash a file's contents, reusing the result while the file is unchanged"""
+        stat = os.stat(image_path)
+        stamp = (image_path, stat.st_mtime_ns, stat.st_size)
+        digest = self.content_hashes.get(stamp)
+        if digest is None:
+            hasher = hashlib.sha1()
+            with open(image_path, 'rb') as image_file:
+                for chunk in iter(lambda: image_file.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self.content_hashes[stamp] = digest
+        return digest
+    
+    def thumbnail_path(self, image_path, size):
+        """Get the disk cache path of a thumbnail"""
+        digest = self.content_hash(image_path)
+        return os.path.join(AppSettings.THUMBNAILS_DIR, f"{digest}_{size[0]}x{size[1]}.png")
+    
+    def load_thumbnail(self, image_path, size):
+        """Decode a thumbnail, generating and caching it on disk if needed (worker thread)"""
+        if not image_path or not os.path.isfile(image_path):
+            return None
+        
+        thumbnail_path = self.thumbnail_path(image_path, size)
+        thumbnail_exists = os.path.exists(thumbnail_path)
+        CACHE_REQUESTS.inc(cache="thumbnail_files", result="hit" if thumbnail_exists else "miss")
+        if not thumbnail_exists:
+            with Image.open(image_path) as source:
+                # Let JPEG decode at a reduced scale instead of full resolution
+                source.draft('RGB', (size[0] * 2, size[1] * 2))
+                image = ImageOps.exif_transpose(source)
+                image.thumbnail(size)
+                if image.mode not in ('RGB', 'RGBA'):
+                    image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+                
+                # Write then rename so other workers never read a partial file
+                temp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+                image.save(temp_path, 'PNG')
+                os.replace(temp_path, thumbnail_path)
+        
+        with Image.open(thumbnail_path) as thumbnail:
+            thumbnail.load()
+            return thumbnail.copy()
\ No newline at end of file
@@ -0,0 +1,258 @@
+import bisect
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.settings import AppSettings
+
+# Latency buckets in seconds, from a cached SELECT up to a bcrypt check on a slow till
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+def format_value(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in pairs) + "}"
+
+class Metric:
+    """Base for metrics whose updates go to a per-thread shard, so recording never takes a lock"""
+    kind = None
+    
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self.local = threading.local()
+        self.shards = []  # Every thread's {label values: data}, merged when exported
+        self.shards_lock = threading.Lock()
+    
+    def shard(self):
+        shard = getattr(self.local, 'shard', None)
+        if shard is None:
+            shard = self.local.shard = {}
+            with self.shards_lock:
+                self.shards.append(shard)
+        return shard
+    
+    def label_values(self, labels):
+        return tuple(labels.get(name, "") for name in self.label_names)
+    
+    def collect(self):
+        """Merge the shards into {label values: data}"""
+        raise NotImplementedError
+    
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.render_samples(self.collect()))
+        return lines
+
+class Counter(Metric):
+    kind = "counter"
+    
+    def inc(self, amount=1, **labels):
+        shard = self.shard()
+        key = self.label_values(labels)
+        shard[key] = shard.get(key, 0) + amount
+    
+    def collect(self):
+        totals = {}
+        with self.shards_lock:
+            shards = list(self.shards)
+        for shard in shards:
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+        return totals
+    
+    def render_samples(self, totals):
+        for key, value in sorted(totals.items()):
+            yield f"{self.name}{format_labels(self.label_names, key)} {format_value(value)}"
+
+class Histogram(Metric):
+    kind = "histogram"
+    
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+    
+    def observe(self, value, **labels):
+        shard = self.shard()
+        key = self.label_values(labels)
+        entry = shard.get(key)
+        if entry is None:
+            # Per-bucket counts (the last is over the top bucket), then the sum
+            entry = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+    
+    def time(self, **labels):
+        """Context manager observing the seconds its block takes"""
+        return Timer(self, labels)
+    
+    def timed(self, **labels):
+        """Decorator observing the seconds each call takes"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with Timer(self, labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def collect(self):
+        totals = {}
+        with self.shards_lock:
+            shards = list(self.shards)
+        for shard in shards:
+            for key, entry in list(shard.items()):
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = list(entry)
+                else:
+                    for index, value in enumerate(entry):
+                        total[index] += value
+        return totals
+    
+    def render_samples(self, totals):
+        for key, entry in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                yield f"{self.name}_bucket{format_labels(self.label_names, key, ('le', format_value(bound)))} {cumulative}"
+            count = cumulative + entry[len(self.buckets)]
+            yield f"{self.name}_bucket{format_labels(self.label_names, key, ('le', '+Inf'))} {count}"
+            yield f"{self.name}_sum{format_labels(self.label_names, key)} {format_value(entry[-1])}"
+            yield f"{self.name}_count{format_labels(self.label_names, key)} {count}"
+
+class Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+        self.started = None
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = Metrics.instance().render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood the console
+        pass
+
+class Metrics:
+    """In-process metrics registry, exported in Prometheus text format to a file and an optional localhost endpoint"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        self.metrics = {}  # name -> Metric, in registration order
+        self.server = None
+        self.started = time.time()
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared registry"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def register(self, metric):
+        with self._lock:
+            return self.metrics.setdefault(metric.name, metric)
+    
+    def counter(self, name, help_text, labels=()):
+        """Get or create a counter"""
+        return self.metrics.get(name) or self.register(Counter(name, help_text, labels))
+    
+    def histogram(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        """Get or create a histogram"""
+        return self.metrics.get(name) or self.register(Histogram(name, help_text, labels, buckets))
+    
+    def render(self):
+        """Render every metric in Prometheus text exposition format"""
+        lines = [
+            "# HELP fms_process_start_time_seconds Start time of the process since the Unix epoch.",
+            "# TYPE fms_process_start_time_seconds gauge",
+            f"fms_process_start_time_seconds {self.started:.0f}"
+        ]
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+    
+    def write_file(self, path=None):
+        """Write the metrics file, replacing it atomically so a scraper never reads half of it"""
+        path = path or AppSettings.METRICS_FILE
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(temp_path, path)
+    
+    def start_http(self, port=None):
+        """Serve /metrics on localhost from a daemon thread"""
+        if self.server is not None:
+            return
+        self.server = ThreadingHTTPServer(("127.0.0.1", port or AppSettings.METRICS_HTTP_PORT), MetricsRequestHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+    
+    def stop_http(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+def queued(pool, func):
+    """Wrap func, about to be submitted to a pool, to record how long it waits for a worker"""
+    submitted = time.perf_counter()
+    
+    def run(*args):
+        POOL_WAIT_SECONDS.observe(time.perf_counter() - submitted, pool=pool)
+        return func(*args)
+    return run
+
+registry = Metrics.instance()
+
+QUERY_SECONDS = registry.histogram(
+    "fms_query_seconds", "SQL statement latency by the model method that ran it.", ("method",)
+)
+LOGIN_SECONDS = registry.histogram("fms_login_seconds", "Time to authenticate a login attempt.", ("result",))
+BCRYPT_SECONDS = registry.histogram("fms_bcrypt_seconds", "Time spent hashing or checking a password.", ("operation",))
+PDF_RENDER_SECONDS = registry.histogram("fms_pdf_render_seconds", "Time to build a PDF export.", ("report",))
+NOTIFICATION_FANOUT = registry.histogram(
+    "fms_notification_fanout_recipients", "Notifications created by one broadcast or batch.", ("source",), SIZE_BUCKETS
+)
+POOL_WAIT_SECONDS = registry.histogram(
+    "fms_pool_wait_seconds", "Time work waited in a thread pool queue before a worker picked it up.", ("pool",)
+)
+CACHE_REQUESTS = registry.counter(
+    "fms_cache_requests_total", "Cache lookups by cache and result (hit or miss).", ("cache", "result")
+)
\ No newline at end of file
@@ -0,0 +1,173 @@
+import heapq
+import threading
+from collections import Counter
+from config.database import DatabaseManager
+
+class TrigramIndex:
+    """Typo-tolerant name lookup using a trigram inverted index"""
+    
+    # Candidates re-scored precisely after the cheap shared-trigram count
+    RESCORE_CANDIDATES = 200
+    
+    def __init__(self):
+        self.postings = {}
+        self.texts = {}
+        self.payloads = {}
+        self.gram_counts = {}
+    
+    @staticmethod
+    def normalize(text):
+        return " ".join((text or "").lower().split())
+    
+    @classmethod
+    def trigrams(cls, text):
+        """Get the set of padded trigrams of a string"""
+        padded = f"  {cls.normalize(text)} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def __len__(self):
+        return len(self.texts)
+    
+    def add(self, key, text, payload=None):
+        """Add or replace an entry"""
+        if key in self.texts:
+            self.remove(key)
+        
+        grams = self.trigrams(text)
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(key)
+        self.texts[key] = text
+        self.payloads[key] = payload
+        self.gram_counts[key] = len(grams)
+    
+    def remove(self, key):
+        """Remove an entry if present"""
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self.trigrams(text):
+            keys = self.postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+        self.payloads.pop(key, None)
+        self.gram_counts.pop(key, None)
+    
+    def search(self, query, limit=10, predicate=None, allowed=None):
+        """Get the best (key, text, score) matches, best first, optionally only among the allowed keys"""
+        normalized = self.normalize(query)
+        if not normalized:
+            return []
+        
+        query_grams = self.trigrams(normalized)
+        posting_lists = sorted(
+            (self.postings[gram] for gram in query_grams if gram in self.postings),
+            key=len
+        )
+        
+        # Anything sharing at least a third of the query's trigrams must appear in one of the
+        # rarer lists, so only those seed candidates and the common lists just add to the counts
+        min_shared = max(1, len(query_grams) // 3)
+        seed_count = len(posting_lists) - min_shared + 1
+        shared = Counter()
+        for keys in posting_lists[:seed_count]:
+            shared.update(keys)
+        for keys in posting_lists[seed_count:]:
+            shared.update(keys.intersection(shared))
+        
+        if allowed is not None:
+            shared = Counter({key: count for key, count in shared.items() if key in allowed})
+        if predicate is not None:
+            shared = Counter({key: count for key, count in shared.items() if predicate(self.payloads[key])})
+        candidates = shared.most_common(self.RESCORE_CANDIDATES)
+        
+        results = []
+        for key, count in candidates:
+            text = self.texts[key]
+            # Jaccard similarity of the trigram sets
+            score = count / (len(query_grams) + self.gram_counts[key] - count)
+            # Reward what the user has typed so far matching the start of the name or a word
+            normalized_text = self.normalize(text)
+            if normalized_text.startswith(normalized):
+                score += 1.0
+            elif f" {normalized}" in normalized_text:
+                score += 0.5
+            results.append((key, text, score))
+        
+        return heapq.nlargest(limit, results, key=lambda item: item[2])
+
+class NameSearch:
+    """Shared trigram indexes over exercise names and user full names"""
+    _exercises = None
+    _users = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def exercises(cls):
+        """Get the exercise name index, building it on first use"""
+        if cls._exercises is None:
+            with cls._lock:
+                if cls._exercises is None:
+                    index = TrigramIndex()
+                    for exercise_id, name in cls._fetch("SELECT id, name FROM exercises"):
+                        index.add(exercise_id, name)
+                    cls._exercises = index
+        return cls._exercises
+    
+    @classmethod
+    def users(cls):
+        """Get the user full name index, building it on first use"""
+        if cls._users is None:
+            with cls._lock:
+                if cls._users is None:
+                    index = TrigramIndex()
+                    rows = cls._fetch("SELECT id, first_name, last_name, user_type, is_active FROM users")
+                    for user_id, first_name, last_name, user_type, is_active in rows:
+                        index.add(user_id, f"{first_name} {last_name}", (user_type, bool(is_active)))
+                    cls._users = index
+        return cls._users
+    
+    @classmethod
+    def exercise_changed(cls, exercise_id, name):
+        """Update the exercise index after a row is saved"""
+        with cls._lock:
+            if cls._exercises is not None:
+                cls._exercises.add(exercise_id, name)
+    
+    @classmethod
+    def exercise_removed(cls, exercise_id):
+        """Drop an exercise from the index after its row is deleted"""
+        with cls._lock:
+            if cls._exercises is not None:
+                cls._exercises.remove(exercise_id)
+    
+    @classmethod
+    def user_changed(cls, user_id, full_name, user_type, is_active=True):
+        """Update the user index after a row is saved"""
+        with cls._lock:
+            if cls._users is not None:
+                cls._users.add(user_id, full_name, (user_type, bool(is_active)))
+    
+    @classmethod
+    def search_exercises(cls, query, limit=10):
+        """Get (exercise_id, name) matches, best first"""
+        return [(key, text) for key, text, _ in cls.exercises().search(query, limit)]
+    
+    @classmethod
+    def search_users(cls, query, limit=10, user_type=None, active_only=True, user_ids=None):
+        """Get (user_id, full_name) matches, best first, optionally only among user_ids"""
+        def predicate(payload):
+            payload_type, is_active = payload
+            return (user_type is None or payload_type == user_type) and (is_active or not active_only)
+        
+        return [(key, text) for key, text, _ in cls.users().search(query, limit, predicate, user_ids)]
+    
+    @staticmethod
+    def _fetch(query):
+        db = DatabaseManager()
+        cursor = db.get_connection().cursor()
+        cursor.execute(query)
+        rows = [tuple(row) for row in cursor.fetchall()]
+        db.close_connection()
+        return rows
\ No newline at end of file
@@ -7,6 +7,7 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from config.settings import AppSettings
+from services.metrics import PDF_RENDER_SECONDS
 
 class PDFService:
     def __init__(self):
@@ -42,6 +43,7 @@ class PDFService:
             )
         }
     
+    @PDF_RENDER_SECONDS.timed(report="workouts")
     def export_workouts_pdf(self, user, workouts):
         """Export member's workouts to PDF"""
         filename = f"workouts_{user.username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
@@ -129,6 +131,7 @@ class PDFService:
         doc.build(story)
         return filepath
     
+    @PDF_RENDER_SECONDS.timed(report="member_progress")
     def export_member_progress_pdf(self, user, progress_records):
         """Export member's progress to PDF"""
         filename = f"progress_{user.username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
@@ -178,6 +181,7 @@ class PDFService:
         doc.build(story)
         return filepath
     
+    @PDF_RENDER_SECONDS.timed(report="trainer_report")
     def export_trainer_report_pdf(self, trainer, members, sessions):
         """Export trainer's client report to PDF"""
         filename = f"trainer_report_{trainer.username}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
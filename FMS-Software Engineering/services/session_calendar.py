@@ -0,0 +1,104 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from services.metrics import CACHE_REQUESTS, queued
+
+def month_range(year, month):
+    """Get the [first day, first day of next month) datetimes of a month"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+def shift_month(year, month, offset):
+    """Get (year, month) offset months away"""
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+class SessionCalendar:
+    """Per-day session counts by month, cached with the adjacent months prefetched in the background"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # Months kept in memory across all users
+    MAX_MONTHS = 36
+    
+    def __init__(self):
+        self.months = OrderedDict()  # (role, user_id, year, month) -> {date: {status: count}}, oldest first
+        self.pending = {}  # key -> Future of a prefetch
+        self.generation = 0  # Bumped on invalidation so in-flight loads of stale data are dropped
+        self.months_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar")
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared session calendar"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def invalidate(cls, session_date=None):
+        """Drop cached counts for the month of a session, or for every month"""
+        if cls._instance is None:
+            return
+        calendar = cls._instance
+        with calendar.months_lock:
+            calendar.generation += 1
+            if session_date is None:
+                calendar.months.clear()
+                return
+            if isinstance(session_date, str):
+                session_date = datetime.fromisoformat(session_date)
+            for key in [key for key in calendar.months if key[2:] == (session_date.year, session_date.month)]:
+                del calendar.months[key]
+    
+    def month_counts(self, role, user_id, year, month):
+        """Get {date: {status: count}} for a trainer's or member's month, then prefetch its neighbours"""
+        key = (role, user_id, year, month)
+        with self.months_lock:
+            counts = self.months.get(key)
+            if counts is not None:
+                self.months.move_to_end(key)
+            future = self.pending.get(key)
+        
+        CACHE_REQUESTS.inc(cache="session_calendar", result="hit" if counts is not None else "miss")
+        if counts is None:
+            # Wait for a prefetch already under way rather than querying twice
+            counts = future.result() if future is not None else self.load(key)
+        
+        self.prefetch(role, user_id, year, month)
+        return counts
+    
+    def prefetch(self, role, user_id, year, month):
+        """Load the months before and after in the background"""
+        for offset in (-1, 1):
+            key = (role, user_id, *shift_month(year, month, offset))
+            with self.months_lock:
+                if key in self.months or key in self.pending:
+                    continue
+                self.pending[key] = self.executor.submit(queued("calendar", self.load), key)
+    
+    def load(self, key):
+        # Imported here: models.session imports this module to invalidate on saves
+        from models.session import Session
+        role, user_id, year, month = key
+        with self.months_lock:
+            generation = self.generation
+        
+        start, end = month_range(year, month)
+        if role == 'trainer':
+            counts = Session.day_counts(start, end, trainer_id=user_id)
+        else:
+            counts = Session.day_counts(start, end, member_id=user_id)
+        
+        with self.months_lock:
+            self.pending.pop(key, None)
+            if generation == self.generation:
+                self.months[key] = counts
+                self.months.move_to_end(key)
+                while len(self.months) > self.MAX_MONTHS:
+                    self.months.popitem(last=False)
+        return counts
\ No newline at end of file
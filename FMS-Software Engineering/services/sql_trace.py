@@ -0,0 +1,259 @@
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from config.settings import AppSettings
+from services.ui_actions import UIActions
+from services.metrics import QUERY_SECONDS
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Plumbing between a statement and the code that wanted it
+SKIPPED_FILES = {os.path.join(PROJECT_DIR, "services", name) for name in ("sql_trace.py", "ui_actions.py", "task_runner.py")}
+
+def trace_level():
+    """FMS_SQL_TRACE: unset or 0 is off, 1 logs a summary per UI action, 2 also logs each statement"""
+    value = os.environ.get("FMS_SQL_TRACE", "").strip().lower()
+    if value in ("", "0", "off", "false"):
+        return 0
+    return 2 if value in ("2", "all", "verbose") else 1
+
+def query_shape(sql):
+    """Reduce a statement to its shape, so the same query with different values compares equal"""
+    shape = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    shape = re.sub(r"\b\d+(?:\.\d+)?\b", "?", shape)
+    shape = re.sub(r"\(\s*\?(?:\s*,\s*\?)*\s*\)", "(...)", shape)
+    return " ".join(shape.split())
+
+def calling_method():
+    """Name the innermost project function that led to the statement"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(PROJECT_DIR) and filename not in SKIPPED_FILES:
+            code = frame.f_code
+            return getattr(code, 'co_qualname', code.co_name)
+        frame = frame.f_back
+    return "?"
+
+class ActionQueries:
+    """Statements run for one UI action"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.shapes = {}  # shape -> [count, seconds, {caller}]
+    
+    def add(self, shape, caller, seconds):
+        with self.lock:
+            self.count += 1
+            self.seconds += seconds
+            entry = self.shapes.get(shape)
+            if entry is None:
+                entry = self.shapes[shape] = [0, 0.0, set()]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2].add(caller)
+
+class TracedCursor(sqlite3.Cursor):
+    """Cursor that times its statements and counts the rows fetched"""
+    
+    def execute(self, sql, parameters=()):
+        return self.traced(super().execute, sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.traced(super().executemany, sql, seq_of_parameters)
+    
+    def executescript(self, sql_script):
+        return self.traced(super().executescript, sql_script)
+    
+    def traced(self, method, sql, *args):
+        trace = SqlTrace.instance()
+        trace.local.statements = []
+        started = time.perf_counter()
+        try:
+            return method(sql, *args)
+        finally:
+            seconds = time.perf_counter() - started
+            statements = trace.local.statements
+            trace.local.statements = None
+            trace.record(sql, seconds, max(self.rowcount, 0), statements)
+    
+    def fetchone(self):
+        return self.counted(super().fetchone, single=True)
+    
+    def fetchmany(self, *args):
+        return self.counted(super().fetchmany, *args)
+    
+    def fetchall(self):
+        return self.counted(super().fetchall)
+    
+    def __next__(self):
+        return self.counted(super().__next__, single=True)
+    
+    def counted(self, method, *args, single=False):
+        started = time.perf_counter()
+        result = method(*args)
+        # Stepping through a result set is where most of a SELECT's time goes
+        SqlTrace.instance().add_fetch(time.perf_counter() - started, (1 if result is not None else 0) if single else len(result))
+        return result
+
+class TracedConnection(sqlite3.Connection):
+    """Connection whose statements all go through traced cursors"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if SqlTrace.ENABLED:
+            self.set_trace_callback(SqlTrace.instance().statement_started)
+    
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+    
+    # The C implementations of these skip Python cursor methods
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+    
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+    
+    def commit(self):
+        started = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            SqlTrace.instance().record("COMMIT", time.perf_counter() - started, 0, [])
+
+class SqlTrace:
+    """Records every statement with its duration, rows and calling method, and reports them per UI action"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # Read once: with tracing off, connections are plain sqlite3 ones
+    LEVEL = trace_level()
+    ENABLED = LEVEL > 0
+    
+    def __init__(self, log_path=None):
+        self.log_path = log_path or AppSettings.SQL_TRACE_LOG_PATH
+        self.local = threading.local()  # statements sqlite reported during the current execute
+        self.actions = {}  # UIAction -> ActionQueries
+        self.actions_lock = threading.Lock()
+        self.logger = None
+        if self.ENABLED:
+            self.logger = self.open_log()
+            UIActions.add_listener(self)
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared trace"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def connect(cls, db_path):
+        """Open a connection that is traced when FMS_SQL_TRACE is set or metrics are on, a plain one otherwise"""
+        if not cls.ENABLED and not AppSettings.METRICS_ENABLED:
+            return sqlite3.connect(db_path, check_same_thread=False)
+        cls.instance()
+        return sqlite3.connect(db_path, check_same_thread=False, factory=TracedConnection)
+    
+    def open_log(self):
+        logger = logging.getLogger("fms.sql_trace")
+        if not logger.handlers:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(
+                self.log_path,
+                maxBytes=AppSettings.SQL_TRACE_LOG_BYTES,
+                backupCount=AppSettings.SQL_TRACE_LOG_BACKUPS,
+                encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(threadName)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        return logger
+    
+    def statement_started(self, statement):
+        # sqlite3 trace callback, with the statement's values bound
+        statements = getattr(self.local, 'statements', None)
+        if statements is not None:
+            statements.append(statement)
+        elif self.LEVEL > 1:
+            # Issued by sqlite3 itself, e.g. the implicit BEGIN
+            self.logger.info("SQL %s", statement)
+    
+    def record(self, sql, seconds, rows, statements):
+        caller = calling_method()
+        if AppSettings.METRICS_ENABLED:
+            QUERY_SECONDS.observe(seconds, method=caller)
+        
+        queries = None
+        action = UIActions.current()
+        if action is not None:
+            with self.actions_lock:
+                queries = self.actions.get(action)
+            if queries is not None:
+                queries.add(query_shape(sql), caller, seconds)
+        # Rows fetched next belong to this statement
+        self.local.queries = queries
+        
+        if self.LEVEL > 1:
+            # The trace callback reports the statement with its values bound, after any implicit BEGIN
+            executed = [statement for statement in statements if statement.strip() != "BEGIN"]
+            expanded = executed[0] if executed else sql
+            self.logger.info(
+                "SQL %.2f ms%s [%s] %s",
+                seconds * 1000,
+                f" rows={rows}" if rows else "",
+                caller,
+                " ".join(expanded.split())
+            )
+    
+    def add_fetch(self, seconds, rows):
+        queries = getattr(self.local, 'queries', None)
+        if queries is not None:
+            with queries.lock:
+                queries.seconds += seconds
+                queries.rows += rows
+    
+    def action_started(self, action):
+        with self.actions_lock:
+            self.actions[action] = ActionQueries()
+    
+    def action_finished(self, action):
+        with self.actions_lock:
+            queries = self.actions.pop(action, None)
+        if queries is None or not queries.count:
+            return
+        
+        lines = [
+            f"{action.name} ran {queries.count} queries in {queries.seconds:.2f} s "
+            f"({queries.rows} rows, {action.elapsed:.2f} s total)"
+        ]
+        # The same query shape repeated within one action is usually a per-row lookup in a loop
+        repeated = sorted(
+            ((entry, shape) for shape, entry in queries.shapes.items() if entry[0] >= AppSettings.SQL_TRACE_N_PLUS_ONE),
+            key=lambda item: -item[0][0]
+        )
+        for (count, seconds, callers), shape in repeated:
+            lines.append(f"  N+1? {count} x {shape} ({seconds * 1000:.1f} ms, from {', '.join(sorted(callers))})")
+        
+        slowest = sorted(queries.shapes.items(), key=lambda item: -item[1][1])[:AppSettings.SQL_TRACE_TOP_QUERIES]
+        for shape, (count, seconds, callers) in slowest:
+            lines.append(f"  {seconds * 1000:8.1f} ms {count:5} x {shape} ({', '.join(sorted(callers))})")
+        
+        if repeated:
+            self.logger.warning("\n".join(lines))
+        else:
+            self.logger.info("\n".join(lines))
\ No newline at end of file
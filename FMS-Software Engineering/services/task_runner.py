@@ -0,0 +1,156 @@
+import queue
+import threading
+import traceback
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import AppSettings
+from services.ui_actions import UIActions
+from services.metrics import queued
+
+class Task:
+    """Handle on submitted work; its callbacks run on the Tk thread unless cancelled or its widget is gone"""
+    
+    def __init__(self, runner, future, widget, on_done, on_error, action=None, key=None):
+        self.runner = runner
+        self.future = future
+        self.key = key
+        self.widget = widget
+        self.on_done = on_done
+        self.on_error = on_error
+        self.action = action  # UI action that submitted it, while diagnostics are on
+        self.cancelled = False
+    
+    def cancel(self):
+        """Drop this task's callbacks; the work itself stops if it hasn't started and nothing else awaits it"""
+        if not self.cancelled:
+            self.cancelled = True
+            self.runner.forget(self)
+            self.finish()
+    
+    def finish(self):
+        if self.action is not None:
+            self.action.release()
+            self.action = None
+    
+    def done(self):
+        return self.future.done()
+
+class TaskRunner:
+    """Worker pool for blocking work (SQL, PDF building) whose results are handed back on the Tk thread"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    # How often the Tk thread picks up finished work
+    DRAIN_INTERVAL_MS = 20
+    
+    def __init__(self, max_workers=None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or AppSettings.TASK_WORKERS,
+            thread_name_prefix="tasks"
+        )
+        # Only touched on the Tk thread; workers just queue finished futures
+        self.subscribers = {}  # future -> [Task]
+        self.running = {}  # key -> future, so duplicate requests share one run
+        self.completed = queue.Queue()
+        self.drain_scheduled = False
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared task runner"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def submit(self, widget, func, *args, on_done=None, on_error=None, key=None):
+        """Run func(*args) on a worker and call on_done(result) or on_error(exception) on the Tk thread"""
+        action = UIActions.current() if UIActions.enabled else None
+        future = self.running.get(key) if key is not None else None
+        if future is None:
+            if action is not None:
+                # The work counts towards the action that asked for it
+                future = self.executor.submit(queued("tasks", UIActions.run_in), action, func, *args)
+            else:
+                future = self.executor.submit(queued("tasks", func), *args)
+            self.subscribers[future] = []
+            if key is not None:
+                self.running[key] = future
+            future.add_done_callback(lambda f: self.completed.put((key, f)))
+        
+        if action is not None:
+            action.retain()
+        task = Task(self, future, widget, on_done, on_error, action, key)
+        self.subscribers[future].append(task)
+        self.schedule_drain(widget)
+        return task
+    
+    def forget(self, task):
+        tasks = self.subscribers.get(task.future)
+        if tasks is None:
+            return
+        if task in tasks:
+            tasks.remove(task)
+        if not tasks and task.future.cancel():
+            # Nobody is waiting for the result any more; a resubmit under the same key starts afresh
+            if task.key is not None and self.running.get(task.key) is task.future:
+                del self.running[task.key]
+    
+    def schedule_drain(self, widget):
+        if not self.drain_scheduled:
+            self.drain_scheduled = True
+            # Poll from the root window so closing the requesting view doesn't stop the loop
+            root = widget.nametowidget('.')
+            root.after(self.DRAIN_INTERVAL_MS, lambda: self.drain(root))
+    
+    def drain(self, root):
+        """Run the callbacks of finished work"""
+        self.drain_scheduled = False
+        while True:
+            try:
+                key, future = self.completed.get_nowait()
+            except queue.Empty:
+                break
+            
+            if key is not None and self.running.get(key) is future:
+                del self.running[key]
+            tasks = self.subscribers.pop(future, [])
+            if future.cancelled():
+                for task in tasks:
+                    task.finish()
+                continue
+            
+            for task in tasks:
+                try:
+                    if task.action is not None:
+                        UIActions.run_in(task.action, self.run_callback, task, future)
+                    else:
+                        self.run_callback(task, future)
+                finally:
+                    task.finish()
+        
+        if self.subscribers:
+            self.schedule_drain(root)
+    
+    def run_callback(self, task, future):
+        if task.cancelled or not self.widget_exists(task.widget):
+            return
+        error = future.exception()
+        try:
+            if error is None:
+                if task.on_done is not None:
+                    task.on_done(future.result())
+            elif task.on_error is not None:
+                task.on_error(error)
+            else:
+                print(f"Background task failed: {error}")
+        except Exception:
+            # One failing callback must not stop the others
+            traceback.print_exc()
+    
+    @staticmethod
+    def widget_exists(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except tk.TclError:
+            return False
\ No newline at end of file
@@ -0,0 +1,113 @@
+import functools
+import threading
+import time
+
+class UIAction:
+    """One user interaction (a button press) together with the background tasks it submitted"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self.pending = 1  # The command itself, plus each task still running for it
+        self.lock = threading.Lock()
+    
+    def retain(self):
+        with self.lock:
+            self.pending += 1
+    
+    def release(self):
+        """Mark one piece of the action's work done; the last one ends the action"""
+        with self.lock:
+            self.pending -= 1
+            finished = self.pending == 0
+        if finished:
+            self.elapsed = time.perf_counter() - self.started
+            UIActions.notify('action_finished', self)
+
+class UIActions:
+    """Tracks which user action the running code belongs to, for diagnostics that report per action"""
+    
+    # Stays off until a diagnostic listens; wrapped commands then just call through
+    enabled = False
+    listeners = []
+    work_wrappers = []
+    local = threading.local()
+    
+    @classmethod
+    def add_listener(cls, listener):
+        """Send listener.action_started(action) and listener.action_finished(action) for every action"""
+        cls.listeners.append(listener)
+        cls.enabled = True
+    
+    @classmethod
+    def add_work_wrapper(cls, wrapper):
+        """Run each piece of an action's work, on any thread, as wrapper(action, func, *args)"""
+        cls.work_wrappers.append(wrapper)
+        cls.enabled = True
+    
+    @classmethod
+    def remove_listener(cls, listener):
+        if listener in cls.listeners:
+            cls.listeners.remove(listener)
+        cls.enabled = bool(cls.listeners or cls.work_wrappers)
+    
+    @classmethod
+    def remove_work_wrapper(cls, wrapper):
+        if wrapper in cls.work_wrappers:
+            cls.work_wrappers.remove(wrapper)
+        cls.enabled = bool(cls.listeners or cls.work_wrappers)
+    
+    @classmethod
+    def notify(cls, event, action):
+        for listener in cls.listeners:
+            try:
+                getattr(listener, event)(action)
+            except Exception as e:
+                print(f"UI action listener failed: {e}")
+    
+    @classmethod
+    def current(cls):
+        """Get the action the calling thread is working for, if any"""
+        return getattr(cls.local, 'action', None)
+    
+    @classmethod
+    def run(cls, name, func, *args):
+        """Run func(*args) as a new action, unless it is already part of one"""
+        if cls.current() is not None:
+            return func(*args)
+        action = UIAction(name)
+        cls.notify('action_started', action)
+        try:
+            return cls.run_in(action, func, *args)
+        finally:
+            action.release()
+    
+    @classmethod
+    def run_in(cls, action, func, *args):
+        """Run func(*args) on behalf of action"""
+        previous = cls.current()
+        cls.local.action = action
+        try:
+            for wrapper in cls.work_wrappers:
+                func = functools.partial(wrapper, action, func)
+            return func(*args)
+        finally:
+            cls.local.action = previous
+    
+    @classmethod
+    def wrap_command(cls, command, text=None):
+        """Make a widget command start an action named after it (see views.action_button.ActionButton)"""
+        if getattr(command, 'ui_action', None) is not None:
+            return command
+        name = getattr(command, '__qualname__', None) or repr(command)
+        if '<lambda>' in name:
+            # Name lambdas by their class and the button's label
+            name = f"{name.split('.')[0]} '{text}'" if text else name
+        
+        def wrapped(*args):
+            if not cls.enabled:
+                return command(*args)
+            return cls.run(name, command, *args)
+        wrapped.ui_action = name
+        return wrapped
\ No newline at end of file
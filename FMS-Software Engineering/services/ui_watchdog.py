@@ -0,0 +1,181 @@
+import logging
+import math
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from config.settings import AppSettings
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+class UIWatchdog:
+    """Measures Tk event-loop latency with an after() heartbeat and logs the main thread's stack when the loop stalls"""
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self, heartbeat_ms=None, stall_ms=None, log_path=None):
+        self.heartbeat_ms = heartbeat_ms or AppSettings.WATCHDOG_HEARTBEAT_MS
+        self.stall_ms = stall_ms or AppSettings.WATCHDOG_STALL_MS
+        self.log_path = log_path or AppSettings.WATCHDOG_LOG_PATH
+        
+        self.view = "startup"
+        self.latencies = {}  # view -> deque of heartbeat delays in ms
+        self.stalls = {}  # view -> stall count
+        
+        # Shared with the monitor thread
+        self.state_lock = threading.Lock()
+        self.beat = 0
+        self.last_beat = None
+        self.stall = None  # (beat, view, stack) captured while the loop is blocked
+        
+        self.root = None
+        self.job = None
+        self.main_thread_id = None
+        self.thread = None
+        self.running = False
+        self.last_summary = 0.0
+        self.logger = None
+    
+    @classmethod
+    def instance(cls):
+        """Get the shared watchdog"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def set_view(self, view):
+        """Name the view shown, so latencies and stalls are charged to it"""
+        self.view = view
+    
+    def start(self, root):
+        """Start the heartbeat on root's event loop; must be called from the Tk thread"""
+        if self.running:
+            return
+        self.logger = self.open_log()
+        self.root = root
+        self.main_thread_id = threading.get_ident()
+        self.running = True
+        self.last_summary = time.monotonic()
+        with self.state_lock:
+            self.last_beat = time.monotonic()
+        self.job = root.after(self.heartbeat_ms, self.heartbeat)
+        
+        self.thread = threading.Thread(target=self.monitor, name="ui-watchdog", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop watching and log the latency summary"""
+        if not self.running:
+            return
+        self.running = False
+        if self.job is not None:
+            try:
+                self.root.after_cancel(self.job)
+            except Exception:
+                # The window is already gone
+                pass
+            self.job = None
+        self.log_summary()
+    
+    def open_log(self):
+        logger = logging.getLogger("fms.ui_watchdog")
+        if not logger.handlers:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(
+                self.log_path,
+                maxBytes=AppSettings.WATCHDOG_LOG_BYTES,
+                backupCount=AppSettings.WATCHDOG_LOG_BACKUPS,
+                encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        return logger
+    
+    def heartbeat(self):
+        """Runs on the Tk thread: how late it fires is how long the loop was busy"""
+        if not self.running:
+            return
+        now = time.monotonic()
+        with self.state_lock:
+            delay_ms = max((now - self.last_beat) * 1000 - self.heartbeat_ms, 0.0)
+            stall = self.stall if self.stall is not None and self.stall[0] == self.beat else None
+            self.stall = None
+            self.beat += 1
+            self.last_beat = now
+        
+        view = self.view
+        if stall is not None:
+            # Charge the stall to the view shown while the loop was blocked
+            _, view, stack = stall
+            self.stalls[view] = self.stalls.get(view, 0) + 1
+            self.logger.warning(
+                "UI stall of %.0f ms in view %s; main thread was at:\n%s",
+                delay_ms, view, stack
+            )
+        
+        samples = self.latencies.get(view)
+        if samples is None:
+            samples = self.latencies[view] = deque(maxlen=AppSettings.WATCHDOG_SAMPLES)
+        samples.append(delay_ms)
+        
+        if now - self.last_summary >= AppSettings.WATCHDOG_SUMMARY_SECONDS:
+            self.last_summary = now
+            self.log_summary()
+        
+        self.job = self.root.after(self.heartbeat_ms, self.heartbeat)
+    
+    def monitor(self):
+        # Wakes several times per threshold so a stall is caught while the loop is still blocked
+        interval = self.stall_ms / 4000
+        while self.running:
+            time.sleep(interval)
+            with self.state_lock:
+                blocked_ms = (time.monotonic() - self.last_beat) * 1000 - self.heartbeat_ms
+                if blocked_ms < self.stall_ms or self.stall is not None:
+                    continue
+                beat = self.beat
+            
+            frame = sys._current_frames().get(self.main_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(main thread stack unavailable)\n"
+            del frame
+            with self.state_lock:
+                # Only keep it if the loop hasn't caught up meanwhile
+                if self.beat == beat:
+                    self.stall = (beat, self.view, stack)
+    
+    def stats(self):
+        """Get {view: (samples, p50, p95, p99, max, stalls)} with latencies in ms"""
+        stats = {}
+        for view, samples in list(self.latencies.items()):
+            values = sorted(samples)
+            if not values:
+                continue
+            stats[view] = (
+                len(values),
+                percentile(values, 50),
+                percentile(values, 95),
+                percentile(values, 99),
+                values[-1],
+                self.stalls.get(view, 0)
+            )
+        return stats
+    
+    def log_summary(self):
+        """Write per-view latency percentiles to the log"""
+        stats = self.stats()
+        if not stats or self.logger is None:
+            return
+        lines = [f"{'view':<28}{'samples':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'stalls':>8}"]
+        for view, (count, p50, p95, p99, worst, stalls) in sorted(stats.items()):
+            lines.append(f"{view:<28}{count:>8}{p50:>8.1f}{p95:>8.1f}{p99:>8.1f}{worst:>8.1f}{stalls:>8}")
+        self.logger.info("UI latency (ms) by view:\n%s", "\n".join(lines))
\ No newline at end of file
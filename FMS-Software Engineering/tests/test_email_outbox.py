@@ -0,0 +1,156 @@
+import asyncio
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from config.database import DatabaseManager
+from services.email_outbox import EmailOutbox
+
+class StubSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib, refusing the recipients the server is told to"""
+    
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+    
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 stub ESMTP")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 stub")
+            elif verb in ("MAIL", "RSET"):
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                code = server.recipient_codes.get(address, 250)
+                if code == 250:
+                    recipients.append(address)
+                self.reply(f"{code} {'OK' if code == 250 else 'Refused'}")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.delivered.extend(recipients)
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+class StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, recipient_codes=None):
+        super().__init__(("127.0.0.1", 0), StubSMTPHandler)
+        self.recipient_codes = recipient_codes or {}
+        self.connections = 0
+        self.delivered = []
+        self.lock = threading.Lock()
+
+class EmailOutboxTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.db_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.db_dir, "outbox.db")
+        DatabaseManager(self.db_path).initialize_database()
+        
+        self.server = StubSMTPServer({"bounce@example.com": 550, "busy@example.com": 451})
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.db_dir, ignore_errors=True)
+    
+    def outbox(self):
+        return EmailOutbox(
+            db_path=self.db_path,
+            smtp_server="127.0.0.1",
+            smtp_port=self.server.server_address[1],
+            use_tls=False,
+            username="",
+            sender="gym@example.com",
+            rate_per_minute=60000
+        )
+    
+    def queue(self, *recipients):
+        db = DatabaseManager(self.db_path)
+        conn = db.get_connection()
+        conn.executemany('''
+            INSERT INTO email_outbox (recipient, subject, body, next_attempt_epoch)
+            VALUES (?, 'Class reminder', 'See you at 6pm.', ?)
+        ''', [(recipient, int(time.time()) - 1) for recipient in recipients])
+        conn.commit()
+        db.close_connection()
+    
+    def statuses(self):
+        db = DatabaseManager(self.db_path)
+        cursor = db.get_connection().cursor()
+        cursor.execute("SELECT recipient, status, attempts, next_attempt_epoch FROM email_outbox ORDER BY id")
+        rows = [tuple(row) for row in cursor.fetchall()]
+        db.close_connection()
+        return rows
+    
+    def test_batch_shares_one_connection(self):
+        self.queue(*[f"member{i}@example.com" for i in range(5)])
+        outbox = self.outbox()
+        
+        sent = asyncio.run(outbox.deliver_due())
+        outbox.disconnect()
+        
+        self.assertEqual(sent, 5)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(sorted(self.server.delivered), [f"member{i}@example.com" for i in range(5)])
+        self.assertEqual({status for _, status, _, _ in self.statuses()}, {'sent'})
+    
+    def test_permanent_refusal_is_dead_lettered_and_temporary_one_retried(self):
+        self.queue("member@example.com", "bounce@example.com", "busy@example.com")
+        outbox = self.outbox()
+        
+        sent = asyncio.run(outbox.deliver_due())
+        outbox.disconnect()
+        
+        self.assertEqual(sent, 1)
+        rows = {recipient: (status, attempts, next_attempt) for recipient, status, attempts, next_attempt in self.statuses()}
+        self.assertEqual(rows["member@example.com"][:2], ('sent', 1))
+        self.assertEqual(rows["bounce@example.com"][:2], ('dead', 1))
+        self.assertEqual(rows["busy@example.com"][:2], ('pending', 1))
+        self.assertGreater(rows["busy@example.com"][2], time.time())
+    
+    def test_batch_taken_over_after_expired_claim_is_not_sent_twice(self):
+        self.queue(*[f"member{i}@example.com" for i in range(3)])
+        stalled = self.outbox()
+        batch = stalled.claim_batch()
+        
+        # The stalled terminal's claim runs out and another terminal takes the rows over
+        db = DatabaseManager(self.db_path)
+        db.get_connection().execute("UPDATE email_outbox SET next_attempt_epoch = ?", (int(time.time()) - 1,))
+        db.get_connection().commit()
+        db.close_connection()
+        other = self.outbox()
+        self.assertEqual(asyncio.run(other.deliver_due()), 3)
+        other.disconnect()
+        
+        sent, _ = asyncio.run(stalled.deliver_batch(batch))
+        stalled.disconnect()
+        
+        self.assertEqual(sent, 0)
+        self.assertEqual(len(self.server.delivered), 3)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from config.database import DatabaseManager
+from models.enrollment import ClassEnrollment
+from models.session import FitnessClass, ClassOccurrence
+
+CAPACITY = 5
+PROCESSES = 8
+MEMBERS_PER_PROCESS = 6
+
+def enroll_members(db_dir, occurrence_id, member_ids, barrier):
+    """Worker: enroll members one by one once every worker is ready"""
+    os.chdir(db_dir)
+    barrier.wait()
+    for member_id in member_ids:
+        ClassEnrollment.enroll(occurrence_id, member_id)
+
+class EnrollmentTestCase(unittest.TestCase):
+    """Runs against a fresh database in a temporary working directory"""
+    
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.db_dir = tempfile.mkdtemp()
+        os.chdir(self.db_dir)
+        DatabaseManager().initialize_database()
+    
+    def tearDown(self):
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.db_dir, ignore_errors=True)
+    
+    def create_members(self, count):
+        db = DatabaseManager()
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        member_ids = []
+        for i in range(count):
+            cursor.execute('''
+                INSERT INTO users (username, email, password_hash, user_type, first_name, last_name)
+                VALUES (?, ?, 'x', 'member', 'Member', ?)
+            ''', (f"member{i}", f"member{i}@example.com", str(i)))
+            member_ids.append(cursor.lastrowid)
+        conn.commit()
+        db.close_connection()
+        return member_ids
+    
+    def create_occurrence(self, capacity):
+        """Create a daily class and get its first upcoming occurrence"""
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+        fitness_class = FitnessClass(
+            name="Spin",
+            schedule=json.dumps({'freq': 'daily', 'at': '18:00', 'start': tomorrow.isoformat()}),
+            capacity=capacity,
+            duration=45
+        )
+        fitness_class.save()
+        occurrences = ClassOccurrence.between(datetime.now(), datetime.now() + timedelta(days=7))
+        return fitness_class, occurrences[0].id
+    
+    def occurrence_counts(self, occurrence_id):
+        cursor = DatabaseManager().get_connection().cursor()
+        cursor.execute("SELECT enrolled_count, waitlist_count FROM class_occurrences WHERE id = ?", (occurrence_id,))
+        return tuple(cursor.fetchone())
+    
+    def enrollments(self, occurrence_id, status):
+        cursor = DatabaseManager().get_connection().cursor()
+        cursor.execute('''
+            SELECT * FROM class_enrollments WHERE occurrence_id = ? AND status = ? ORDER BY id
+        ''', (occurrence_id, status))
+        return [ClassEnrollment.from_row(row) for row in cursor.fetchall()]
+
+class EnrollmentConcurrencyTest(EnrollmentTestCase):
+    
+    def test_concurrent_enrollment_never_overbooks(self):
+        member_ids = self.create_members(PROCESSES * MEMBERS_PER_PROCESS)
+        _, occurrence_id = self.create_occurrence(CAPACITY)
+        
+        # Separate processes, so each enroll goes through its own connection and BEGIN IMMEDIATE
+        context = multiprocessing.get_context("spawn")
+        barrier = context.Barrier(PROCESSES)
+        workers = [
+            context.Process(
+                target=enroll_members,
+                args=(self.db_dir, occurrence_id, member_ids[i::PROCESSES], barrier)
+            )
+            for i in range(PROCESSES)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+        
+        enrolled = self.enrollments(occurrence_id, 'enrolled')
+        waitlisted = self.enrollments(occurrence_id, 'waitlisted')
+        self.assertEqual(len(enrolled), CAPACITY)
+        self.assertEqual(len(enrolled) + len(waitlisted), len(member_ids))
+        self.assertEqual(self.occurrence_counts(occurrence_id), (len(enrolled), len(waitlisted)))
+        
+        positions = [enrollment.waitlist_position() for enrollment in waitlisted]
+        self.assertEqual(positions, list(range(1, len(waitlisted) + 1)))
+
+class WaitlistPromotionTest(EnrollmentTestCase):
+    
+    def fill(self, capacity, members):
+        member_ids = self.create_members(members)
+        fitness_class, occurrence_id = self.create_occurrence(capacity)
+        for member_id in member_ids:
+            ClassEnrollment.enroll(occurrence_id, member_id)
+        return fitness_class, occurrence_id
+    
+    def test_cancel_promotes_waitlist_head(self):
+        _, occurrence_id = self.fill(2, 4)
+        first_waiting = self.enrollments(occurrence_id, 'waitlisted')[0]
+        
+        promoted = self.enrollments(occurrence_id, 'enrolled')[0].cancel()
+        
+        self.assertEqual(promoted.id, first_waiting.id)
+        self.assertEqual(self.occurrence_counts(occurrence_id), (2, 1))
+    
+    def test_cancel_on_cancelled_occurrence_promotes_nobody(self):
+        fitness_class, occurrence_id = self.fill(2, 4)
+        # Dropping the schedule cancels occurrences that have enrollments
+        fitness_class.schedule = None
+        fitness_class.save()
+        
+        promoted = self.enrollments(occurrence_id, 'enrolled')[0].cancel()
+        
+        self.assertIsNone(promoted)
+        self.assertEqual(len(self.enrollments(occurrence_id, 'waitlisted')), 2)
+        self.assertEqual(self.occurrence_counts(occurrence_id), (1, 2))
+    
+    def test_raising_capacity_promotes_up_to_free_seats(self):
+        fitness_class, occurrence_id = self.fill(2, 6)
+        
+        fitness_class.capacity = 5
+        fitness_class.save()
+        
+        self.assertEqual(self.occurrence_counts(occurrence_id), (5, 1))
+        self.assertEqual(len(self.enrollments(occurrence_id, 'enrolled')), 5)
+        self.assertEqual(self.enrollments(occurrence_id, 'waitlisted')[0].waitlist_position(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
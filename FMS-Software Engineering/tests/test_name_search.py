@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+from config.database import DatabaseManager
+from models.workout import Exercise
+from services.name_search import NameSearch, TrigramIndex
+
+class TrigramIndexTest(unittest.TestCase):
+    
+    def test_readding_a_key_replaces_its_text(self):
+        index = TrigramIndex()
+        index.add(1, "Squats")
+        index.add(2, "Bench Press")
+        
+        index.add(1, "Front Squats")
+        
+        self.assertEqual([key for key, _, _ in index.search("front")], [1])
+        self.assertEqual([text for _, text, _ in index.search("squats")], ["Front Squats"])
+        self.assertEqual(len(index), 2)
+    
+    def test_removed_key_leaves_no_postings(self):
+        index = TrigramIndex()
+        index.add(1, "Deadlift")
+        
+        index.remove(1)
+        
+        self.assertEqual(index.search("deadlift"), [])
+        self.assertEqual(index.postings, {})
+
+class NameSearchTest(unittest.TestCase):
+    """Runs against a fresh database in a temporary working directory"""
+    
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.db_dir = tempfile.mkdtemp()
+        os.chdir(self.db_dir)
+        DatabaseManager().initialize_database()
+        NameSearch._exercises = None
+    
+    def tearDown(self):
+        NameSearch._exercises = None
+        os.chdir(self.previous_dir)
+        shutil.rmtree(self.db_dir, ignore_errors=True)
+    
+    def test_renamed_exercise_is_found_by_its_new_name(self):
+        exercise = Exercise(name="Squats", category="Strength")
+        exercise.save()
+        self.assertIn((exercise.id, "Squats"), NameSearch.search_exercises("squ"))
+        
+        exercise.name = "Goblet Squats"
+        exercise.save()
+        
+        self.assertEqual(NameSearch.search_exercises("goblet")[0], (exercise.id, "Goblet Squats"))
+        self.assertNotIn((exercise.id, "Squats"), NameSearch.search_exercises("squ"))
+    
+    def test_deleted_exercise_drops_out_of_search(self):
+        exercise = Exercise(name="Kettlebell Swing", category="Strength")
+        exercise.save()
+        self.assertIn((exercise.id, "Kettlebell Swing"), NameSearch.search_exercises("kettle"))
+        
+        Exercise(exercise_id=exercise.id).delete()
+        
+        self.assertNotIn(exercise.id, [key for key, _ in NameSearch.search_exercises("kettle")])
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,454 @@
+"""Build a large synthetic gym database for finding scaling problems.
+    
+    python -m tools.generate_dataset --output large_gym.db --seed 42
+
+Run from the project directory. The same seed and --today always produce the same rows, apart
+from the default admin account and bcrypt's random password salt.
+"""
+import argparse
+import calendar
+import itertools
+import math
+import os
+import random
+import time
+from datetime import date, timedelta
+from config.database import DatabaseManager, USER_SEARCH_VALUES
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Karen",
+    "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Priya", "Mark", "Sandra", "Aarav", "Ashley",
+    "Kevin", "Emily", "Wei", "Aisha", "Luis", "Fatima", "Omar", "Sofia", "Ethan", "Mei"
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Patel", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Nguyen", "Hill", "Kim", "Sawant"
+]
+SPECIALIZATIONS = [
+    "Strength Training", "Weight Loss", "Yoga", "Pilates", "HIIT", "Boxing",
+    "Rehabilitation", "Powerlifting", "Mobility", "Endurance"
+]
+FITNESS_GOALS = ["Lose weight", "Build muscle", "Improve endurance", "Stay healthy", "Train for an event", "Recover from injury"]
+MEMBERSHIP_TYPES = (("Monthly", 55), ("Annual", 30), ("Student", 10), ("Premium", 5))
+SESSION_TYPES = (("Personal Training", 60), ("Assessment", 8), ("Nutrition Coaching", 10), ("Rehab", 7), ("Partner Training", 15))
+DURATIONS = ((30, 20), (45, 25), (60, 45), (90, 10))
+
+# Share of the week's bookings per weekday (Monday first) and per hour of the day
+WEEKDAY_FACTORS = (1.15, 1.1, 1.1, 1.05, 0.95, 0.7, 0.45)
+HOUR_WEIGHTS = {6: 6, 7: 8, 8: 6, 9: 4, 10: 3, 11: 3, 12: 5, 13: 4, 14: 2, 15: 2, 16: 4, 17: 8, 18: 10, 19: 8, 20: 4, 21: 2}
+# New-year resolutions, a summer lull and the December holidays
+MONTH_FACTORS = (1.35, 1.2, 1.1, 1.0, 1.0, 0.9, 0.8, 0.8, 1.05, 1.0, 0.95, 0.75)
+
+# (type, title, message, weight); {date} is the notification's day
+NOTIFICATION_TEMPLATES = (
+    ("info", "Session Reminder", "Reminder: you have a training session tomorrow.", 30),
+    ("success", "Session Booked", "Your training session has been booked.", 20),
+    ("success", "Session Completed", "Your session on {date} was marked as completed.", 20),
+    ("warning", "Session Cancelled", "Your session on {date} was cancelled.", 6),
+    ("warning", "Session Missed", "Your session on {date} was marked as missed.", 3),
+    ("info", "Class Update", "A class you are enrolled in has a new schedule.", 8),
+    ("success", "Payment Received", "Thank you! Your membership payment was received.", 8),
+    ("admin", "Gym Announcement", "The gym will have reduced hours on public holidays.", 5),
+)
+
+def cumulative(weights):
+    """Cumulative weights for random.choices"""
+    return list(itertools.accumulate(weights))
+
+def zipf_weights(count, exponent):
+    """Power-law weights: the item of rank r is picked in proportion to 1 / r ** exponent"""
+    return [1 / (rank ** exponent) for rank in range(1, count + 1)]
+
+class DatasetGenerator:
+    """Writes a realistic large-gym database through bulk inserts, with per-table seeded random streams"""
+    
+    # Tables loaded in bulk: their triggers and indexes are dropped while loading and recreated after
+    BULK_TABLES = ('users', 'member_profiles', 'trainer_profiles', 'sessions', 'notifications', 'progress_records')
+    CHUNK_SIZE = 50000
+    
+    def __init__(self, db_path, seed=42, members=100000, trainers=500, sessions=5000000,
+                 notifications=20000000, progress=1000000, days_back=730, days_ahead=90, today=None):
+        self.db_path = db_path
+        self.seed = seed
+        self.members = members
+        self.trainers = trainers
+        self.sessions = sessions
+        self.notifications = notifications
+        self.progress = progress
+        self.today = today or date.today()
+        self.db = DatabaseManager(db_path)
+        
+        # Every day in range with its string form and share of activity
+        first_day = self.today - timedelta(days=days_back)
+        self.days = [first_day + timedelta(days=offset) for offset in range(days_back + days_ahead + 1)]
+        self.day_strings = [day.isoformat() for day in self.days]
+        self.day_epochs = [calendar.timegm(day.timetuple()) for day in self.days]
+        self.today_index = days_back
+        self.now_epoch = self.day_epochs[self.today_index] + 12 * 3600
+        
+        day_weights = [self.day_weight(index) for index in range(len(self.days))]
+        self.day_cum = cumulative(day_weights)
+        self.past_day_cum = cumulative(day_weights[:self.today_index + 1])
+        self.hours = list(HOUR_WEIGHTS)
+        self.hour_cum = cumulative(HOUR_WEIGHTS.values())
+        
+        self.trainer_ids = []
+        self.member_ids = []
+        self.member_cum = []
+        self.preferred_trainer = []
+        self.trainer_cum = []
+        self.hourly_rates = {}
+    
+    def rng(self, stream):
+        """Random stream of its own per table, so changing one count doesn't change the other tables"""
+        return random.Random(f"{self.seed}:{stream}")
+    
+    def day_weight(self, index):
+        """Bookings on a day: seasonality, weekday, the gym's growth, and fewer bookings the further ahead"""
+        day = self.days[index]
+        weight = MONTH_FACTORS[day.month - 1] * WEEKDAY_FACTORS[day.weekday()]
+        weight *= 0.6 + 0.4 * min(index / max(self.today_index, 1), 1.0)
+        if index > self.today_index:
+            weight *= math.exp(-(index - self.today_index) / 21)
+        return weight
+    
+    def timestamp(self, day_index, seconds):
+        """'YYYY-MM-DD HH:MM:SS' and its epoch, as strftime('%s') reads it"""
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
+        return f"{self.day_strings[day_index]} {hours:02d}:{minutes:02d}:{secs:02d}", self.day_epochs[day_index] + seconds
+    
+    def generate(self):
+        """Build the database"""
+        started = time.perf_counter()
+        self.db.initialize_database()
+        conn = self.db.get_connection()
+        
+        # Nothing to protect while building a new file
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -262144")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        
+        schema = self.drop_triggers_and_indexes(conn)
+        self.step("users", self.insert_users, conn)
+        self.step("sessions", self.insert_sessions, conn)
+        self.step("notifications", self.insert_notifications, conn)
+        self.step("progress records", self.insert_progress, conn)
+        self.step("indexes and triggers", self.restore_schema, conn, schema)
+        self.step("search index and counters", self.rebuild_derived, conn)
+        
+        conn.execute("PRAGMA analysis_limit = 1000")
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.execute("PRAGMA journal_mode = DELETE")
+        self.db.close_connection()
+        print(f"Wrote {self.db_path} in {time.perf_counter() - started:.1f} s")
+    
+    def step(self, label, func, *args):
+        started = time.perf_counter()
+        func(*args)
+        print(f"  {label}: {time.perf_counter() - started:.1f} s")
+    
+    def drop_triggers_and_indexes(self, conn):
+        """Drop the bulk tables' triggers and indexes, returning the SQL to recreate them"""
+        placeholders = ", ".join("?" * len(self.BULK_TABLES))
+        rows = conn.execute(f'''
+            SELECT type, name, sql FROM sqlite_master
+            WHERE type IN ('trigger', 'index') AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+        ''', self.BULK_TABLES).fetchall()
+        for row in rows:
+            conn.execute(f"DROP {row['type'].upper()} {row['name']}")
+        conn.commit()
+        return rows
+    
+    def restore_schema(self, conn, schema):
+        # Indexes first: triggers never fire while they are created
+        for row in sorted(schema, key=lambda row: row['type'] != 'index'):
+            conn.execute(row['sql'])
+        conn.commit()
+    
+    def rebuild_derived(self, conn):
+        """Redo what the dropped triggers would have maintained"""
+        # Unread badge counters
+        conn.execute("DELETE FROM notification_counters")
+        conn.execute('''
+            INSERT INTO notification_counters (user_id, unread_count)
+            SELECT user_id, COUNT(*) FROM notifications
+            WHERE user_id IS NOT NULL AND NOT coalesce(is_read, 0)
+            GROUP BY user_id
+        ''')
+        
+        # User search index (contentless, so it is rebuilt from the users table)
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'users_fts'").fetchone():
+            conn.execute("INSERT INTO users_fts (users_fts) VALUES ('delete-all')")
+            conn.execute(f'''
+                INSERT INTO users_fts (rowid, username, email, first_name, last_name, phone, user_type)
+                SELECT id, {USER_SEARCH_VALUES.format(row='users')} FROM users
+            ''')
+        conn.commit()
+    
+    def next_id(self, conn, table):
+        return (conn.execute(f"SELECT max(id) FROM {table}").fetchone()[0] or 0) + 1
+    
+    def bulk_insert(self, conn, sql, rows):
+        """Insert an iterable of rows in chunks"""
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            conn.executemany(sql, chunk)
+        conn.commit()
+    
+    def insert_users(self, conn):
+        """Insert trainers and members with their profiles"""
+        rng = self.rng("users")
+        # Everyone gets the same password; hashing 100k bcrypt passwords would take hours
+        password_hash = self.db.hash_password("password123")
+        first_id = self.next_id(conn, 'users')
+        self.trainer_ids = list(range(first_id, first_id + self.trainers))
+        self.member_ids = list(range(first_id + self.trainers, first_id + self.trainers + self.members))
+        
+        def user_rows():
+            for number, user_id in enumerate(self.trainer_ids + self.member_ids):
+                user_type = 'trainer' if number < self.trainers else 'member'
+                first_name = rng.choice(FIRST_NAMES)
+                last_name = rng.choice(LAST_NAMES)
+                day_index = rng.choices(range(self.today_index + 1), cum_weights=self.past_day_cum)[0]
+                created_at, _ = self.timestamp(day_index, rng.randrange(6 * 3600, 22 * 3600))
+                birth_year = self.today.year - int(min(max(rng.gauss(36, 12), 16), 85))
+                yield (
+                    user_id,
+                    f"{user_type}{user_id}",
+                    f"{first_name.lower()}.{last_name.lower()}{user_id}@example.com",
+                    password_hash,
+                    user_type,
+                    first_name,
+                    last_name,
+                    f"555-{rng.randrange(100, 1000)}-{rng.randrange(1000, 10000)}",
+                    f"{birth_year}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+                    rng.choice(("Male", "Female", "Other")) if rng.random() < 0.97 else None,
+                    created_at,
+                    1 if rng.random() < 0.95 else 0
+                )
+        
+        self.bulk_insert(conn, '''
+            INSERT INTO users (id, username, email, password_hash, user_type, first_name, last_name,
+                               phone, date_of_birth, gender, created_at, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', user_rows())
+        
+        # A few trainers get most of the bookings
+        self.trainer_cum = cumulative(zipf_weights(self.trainers, 0.8))
+        self.hourly_rates = {trainer_id: round(min(max(rng.lognormvariate(4.0, 0.35), 25), 200), 2)
+                             for trainer_id in self.trainer_ids}
+        self.bulk_insert(conn, '''
+            INSERT INTO trainer_profiles (user_id, specializations, certifications, experience_years, hourly_rate, bio)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            (trainer_id, ", ".join(rng.sample(SPECIALIZATIONS, rng.randint(1, 3))), "NASM-CPT",
+             rng.randint(1, 25), self.hourly_rates[trainer_id], None)
+            for trainer_id in self.trainer_ids
+        ))
+        
+        # Member activity is heavy-tailed: most members book rarely, a few several times a week
+        self.member_cum = cumulative(rng.paretovariate(1.5) for _ in self.member_ids)
+        self.preferred_trainer = rng.choices(self.trainer_ids, cum_weights=self.trainer_cum, k=len(self.member_ids))
+        
+        def profile_rows():
+            for user_id in self.member_ids:
+                start_index = rng.randrange(self.today_index + 1)
+                membership_type = rng.choices(*zip(*MEMBERSHIP_TYPES))[0]
+                length = 365 if membership_type == 'Annual' else 30 * rng.randint(1, 12)
+                yield (
+                    user_id,
+                    round(rng.gauss(170, 10), 1),
+                    round(min(max(rng.gauss(78, 15), 42), 180), 1),
+                    rng.choice(FITNESS_GOALS),
+                    membership_type,
+                    self.day_strings[start_index],
+                    (self.days[start_index] + timedelta(days=length)).isoformat()
+                )
+        
+        self.bulk_insert(conn, '''
+            INSERT INTO member_profiles (user_id, height, weight, fitness_goals, membership_type,
+                                         membership_start, membership_end)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', profile_rows())
+    
+    def insert_sessions(self, conn):
+        """Insert sessions with seasonal, weekday and hourly booking peaks"""
+        rng = self.rng("sessions")
+        session_types, type_weights = zip(*SESSION_TYPES)
+        durations, duration_weights = zip(*DURATIONS)
+        type_cum = cumulative(type_weights)
+        duration_cum = cumulative(duration_weights)
+        member_indexes = range(len(self.member_ids))
+        day_indexes = range(len(self.days))
+        first_id = self.next_id(conn, 'sessions')
+        
+        def session_rows():
+            session_id = first_id
+            for chunk_start in range(0, self.sessions, self.CHUNK_SIZE):
+                count = min(self.CHUNK_SIZE, self.sessions - chunk_start)
+                members = rng.choices(member_indexes, cum_weights=self.member_cum, k=count)
+                days = rng.choices(day_indexes, cum_weights=self.day_cum, k=count)
+                hours = rng.choices(self.hours, cum_weights=self.hour_cum, k=count)
+                other_trainers = rng.choices(self.trainer_ids, cum_weights=self.trainer_cum, k=count)
+                types = rng.choices(session_types, cum_weights=type_cum, k=count)
+                lengths = rng.choices(durations, cum_weights=duration_cum, k=count)
+                
+                for i in range(count):
+                    # Members mostly stay with their own trainer
+                    member_index = members[i]
+                    trainer_id = self.preferred_trainer[member_index] if rng.random() < 0.8 else other_trainers[i]
+                    session_date, start_epoch = self.timestamp(days[i], hours[i] * 3600 + rng.randrange(4) * 900)
+                    duration = lengths[i]
+                    
+                    draw = rng.random()
+                    if start_epoch < self.now_epoch:
+                        status = 'completed' if draw < 0.85 else 'cancelled' if draw < 0.94 else 'no_show'
+                    else:
+                        status = 'scheduled' if draw < 0.94 else 'cancelled'
+                    
+                    # Booked up to a month ahead
+                    created_at, _ = self.timestamp(max(days[i] - rng.randrange(31), 0), rng.randrange(7 * 3600, 21 * 3600))
+                    yield (
+                        session_id,
+                        self.member_ids[member_index],
+                        trainer_id,
+                        session_date,
+                        duration,
+                        types[i],
+                        status,
+                        round(self.hourly_rates[trainer_id] * duration / 60, 2),
+                        None,
+                        created_at,
+                        start_epoch,
+                        start_epoch + duration * 60,
+                        session_id
+                    )
+                    session_id += 1
+        
+        # start_epoch, end_epoch and change_seq are what the dropped triggers would have set
+        self.bulk_insert(conn, '''
+            INSERT INTO sessions (id, member_id, trainer_id, session_date, duration, session_type, status,
+                                  price, notes, created_at, start_epoch, end_epoch, change_seq)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', session_rows())
+    
+    def insert_notifications(self, conn):
+        """Insert notifications, mostly read once they are a couple of weeks old"""
+        rng = self.rng("notifications")
+        templates = [template[:3] for template in NOTIFICATION_TEMPLATES]
+        template_cum = cumulative(template[3] for template in NOTIFICATION_TEMPLATES)
+        past_days = range(self.today_index + 1)
+        read_cutoff = self.now_epoch - 14 * 86400
+        
+        def notification_rows():
+            for chunk_start in range(0, self.notifications, self.CHUNK_SIZE):
+                count = min(self.CHUNK_SIZE, self.notifications - chunk_start)
+                members = rng.choices(self.member_ids, cum_weights=self.member_cum, k=count)
+                trainers = rng.choices(self.trainer_ids, cum_weights=self.trainer_cum, k=count)
+                days = rng.choices(past_days, cum_weights=self.past_day_cum, k=count)
+                picked = rng.choices(templates, cum_weights=template_cum, k=count)
+                
+                for i in range(count):
+                    # Trainers get a tenth of the notifications, busy trainers the most
+                    user_id = trainers[i] if rng.random() < 0.1 else members[i]
+                    created_at, created_epoch = self.timestamp(days[i], rng.randrange(86400))
+                    notification_type, title, message = picked[i]
+                    is_read = rng.random() < (0.97 if created_epoch < read_cutoff else 0.45)
+                    yield (
+                        user_id,
+                        title,
+                        message.format(date=self.day_strings[days[i]]),
+                        notification_type,
+                        int(is_read),
+                        created_at,
+                        created_epoch
+                    )
+        
+        self.bulk_insert(conn, '''
+            INSERT INTO notifications (user_id, title, message, type, is_read, created_at, created_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', notification_rows())
+    
+    def insert_progress(self, conn):
+        """Insert progress records for the members who track progress, trending from their starting weight"""
+        rng = self.rng("progress")
+        trackers = [index for index in range(len(self.member_ids)) if rng.random() < 0.6]
+        if not trackers:
+            return
+        tracker_cum = cumulative(self.member_cum[index] - (self.member_cum[index - 1] if index else 0) for index in trackers)
+        start_weight = {index: min(max(rng.gauss(80, 15), 45), 170) for index in trackers}
+        trend = {index: rng.gauss(-0.01, 0.015) for index in trackers}  # kg per day
+        past_days = range(self.today_index + 1)
+        
+        def progress_rows():
+            for chunk_start in range(0, self.progress, self.CHUNK_SIZE):
+                count = min(self.CHUNK_SIZE, self.progress - chunk_start)
+                members = rng.choices(trackers, cum_weights=tracker_cum, k=count)
+                days = rng.choices(past_days, cum_weights=self.past_day_cum, k=count)
+                for i in range(count):
+                    member_index = members[i]
+                    weight = start_weight[member_index] + trend[member_index] * days[i] + rng.gauss(0, 0.8)
+                    body_fat = min(max(rng.gauss(24, 6) + trend[member_index] * days[i] * 0.3, 6), 50)
+                    yield (
+                        self.member_ids[member_index],
+                        self.day_strings[days[i]],
+                        round(weight, 1),
+                        round(body_fat, 1),
+                        round(weight * (1 - body_fat / 100) * 0.52, 1),
+                        None,
+                        "Felt strong today" if rng.random() < 0.05 else None,
+                        None
+                    )
+        
+        self.bulk_insert(conn, '''
+            INSERT INTO progress_records (member_id, record_date, weight, body_fat, muscle_mass,
+                                          measurements, notes, photo_path)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', progress_rows())
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large synthetic gym database.")
+    parser.add_argument("--output", default="large_gym.db", help="database file to create")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--members", type=int, default=100000)
+    parser.add_argument("--trainers", type=int, default=500)
+    parser.add_argument("--sessions", type=int, default=5000000)
+    parser.add_argument("--notifications", type=int, default=20000000)
+    parser.add_argument("--progress", type=int, default=1000000)
+    parser.add_argument("--days-back", type=int, default=730, help="days of history")
+    parser.add_argument("--days-ahead", type=int, default=90, help="days of future bookings")
+    parser.add_argument("--today", type=date.fromisoformat, default=None, help="YYYY-MM-DD the data is built around")
+    parser.add_argument("--force", action="store_true", help="replace the output file if it exists")
+    args = parser.parse_args()
+    
+    if os.path.exists(args.output):
+        if not args.force:
+            parser.error(f"{args.output} exists; use --force to replace it")
+        os.remove(args.output)
+    if args.trainers < 1 or args.members < 1:
+        parser.error("at least one trainer and one member are needed")
+    
+    DatasetGenerator(
+        args.output,
+        seed=args.seed,
+        members=args.members,
+        trainers=args.trainers,
+        sessions=args.sessions,
+        notifications=args.notifications,
+        progress=args.progress,
+        days_back=args.days_back,
+        days_ahead=args.days_ahead,
+        today=args.today
+    ).generate()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,15 @@
+import customtkinter as ctk
+from services.ui_actions import UIActions
+
+class ActionButton(ctk.CTkButton):
+    """CTkButton whose presses are tracked as UI actions while a diagnostic is listening"""
+    
+    def __init__(self, *args, command=None, **kwargs):
+        if command is not None:
+            command = UIActions.wrap_command(command, kwargs.get('text'))
+        super().__init__(*args, command=command, **kwargs)
+    
+    def configure(self, *args, **kwargs):
+        if kwargs.get('command') is not None:
+            kwargs['command'] = UIActions.wrap_command(kwargs['command'], kwargs.get('text') or self.cget('text'))
+        return super().configure(*args, **kwargs)
\ No newline at end of file
@@ -4,16 +4,29 @@ import tkinter as tk
 from datetime import datetime, timedelta
 from models.user import User, MemberProfile, TrainerProfile
 from models.workout import Workout, Exercise
-from models.session import Session, FitnessClass
+from models.session import Session, FitnessClass, ClassOccurrence
 from models.notification import Notification
 from services.pdf_service import PDFService
+from services.task_runner import TaskRunner
+from services.metrics import NOTIFICATION_FANOUT
+from views.exercise_browser import ExerciseBrowser
+from views.card_pool import CardPool
+from views.cards import UserCard
+from views.section_cache import SectionCache
+from views.action_button import ActionButton
 
 class AdminDashboard:
+    # User list filter -> user_type
+    USER_FILTER_TYPES = {"All Users": None, "Members": 'member', "Trainers": 'trainer', "Admins": 'admin'}
+    USER_RESULT_LIMIT = 100
+    USER_SEARCH_DELAY_MS = 250
+    
     def __init__(self, parent, user_data, logout_callback):
         self.parent = parent
         self.user_data = user_data
         self.logout_callback = logout_callback
         self.user = User.get_by_id(user_data['id'])
+        self.user_search_task = None
         
         self.setup_ui()
         self.load_dashboard_data()
@@ -37,6 +50,7 @@ class AdminDashboard:
         # Content area
         self.content_frame = ctk.CTkFrame(self.main_frame)
         self.content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        self.sections = SectionCache(self.content_frame, view="admin")
         
         # Show dashboard by default
         self.show_dashboard()
@@ -60,7 +74,7 @@ class AdminDashboard:
         button_frame.pack(side="right", padx=20, pady=20)
         
         # System notifications
-        system_notif_button = ctk.CTkButton(
+        system_notif_button = ActionButton(
             button_frame,
             text="📢 System Alerts",
             width=120,
@@ -69,7 +83,7 @@ class AdminDashboard:
         system_notif_button.pack(side="left", padx=(0, 10))
         
         # Theme toggle
-        self.theme_button = ctk.CTkButton(
+        self.theme_button = ActionButton(
             button_frame,
             text="🌙",
             width=40,
@@ -78,7 +92,7 @@ class AdminDashboard:
         self.theme_button.pack(side="left", padx=(0, 10))
         
         # Logout button
-        logout_button = ctk.CTkButton(
+        logout_button = ActionButton(
             button_frame,
             text="Logout",
             width=80,
@@ -109,7 +123,7 @@ class AdminDashboard:
         ]
         
         for text, command in nav_buttons:
-            button = ctk.CTkButton(
+            button = ActionButton(
                 sidebar_frame,
                 text=text,
                 width=200,
@@ -119,40 +133,52 @@ class AdminDashboard:
             )
             button.pack(padx=10, pady=3)
     
-    def clear_content(self):
-        """Clear content frame"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def clear_content(self, section=None):
+        """Clear content frame before showing a section"""
+        # Cached sections are only hidden; anything else is destroyed
+        self.sections.clear(section)
     
     def show_dashboard(self):
         """Show admin dashboard overview"""
-        self.clear_content()
-        
+        self.clear_content('dashboard')
+        self.sections.show('dashboard', self.build_dashboard)
+    
+    def build_dashboard(self, frame):
+        """Build the overview section"""
         # Title
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="System Overview",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=(20, 30))
         
         # Stats cards row 1
-        stats_frame_1 = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        stats_frame_1 = ctk.CTkFrame(frame, fg_color="transparent")
         stats_frame_1.pack(fill="x", padx=20, pady=(0, 20))
+        self.sections.bind(stats_frame_1, self.load_system_stats, lambda stats: self.show_system_stats(stats_frame_1, *stats), key='system_stats')
         
-        # Get system stats
+        # Recent activity section
+        self.show_recent_activity(frame)
+    
+    def load_system_stats(self):
+        """Count members, trainers, sessions and classes (worker thread)"""
         total_members = len(User.get_all_by_type('member'))
         total_trainers = len(User.get_all_by_type('trainer'))
-        total_sessions = len(Session.get_by_trainer_id(0))  # All sessions
+        total_sessions = sum(count for count, _ in Session.totals_by_status().values())
         active_classes = len(FitnessClass.get_all_active())
-        
+        return total_members, total_trainers, total_sessions, active_classes
+    
+    def show_system_stats(self, stats_frame_1, total_members, total_trainers, total_sessions, active_classes):
+        """Fill the system stat cards"""
         self.create_stat_card(stats_frame_1, "Total Members", str(total_members), "👥").pack(side="left", padx=10, fill="x", expand=True)
         self.create_stat_card(stats_frame_1, "Active Trainers", str(total_trainers), "🏋️").pack(side="left", padx=10, fill="x", expand=True)
-        self.create_stat_card(stats_frame_1, "Total Sessions", str(len(Session.get_by_member_id(0))), "📅").pack(side="left", padx=10, fill="x", expand=True)
+        self.create_stat_card(stats_frame_1, "Total Sessions", str(total_sessions), "📅").pack(side="left", padx=10, fill="x", expand=True)
         self.create_stat_card(stats_frame_1, "Active Classes", str(active_classes), "🎯").pack(side="left", padx=10, fill="x", expand=True)
-        
-        # Recent activity section
-        activity_frame = ctk.CTkFrame(self.content_frame)
+    
+    def show_recent_activity(self, parent):
+        """Show the recent system activity list"""
+        activity_frame = ctk.CTkFrame(parent)
         activity_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         activity_title = ctk.CTkLabel(
@@ -216,10 +242,13 @@ class AdminDashboard:
     
     def show_user_management(self):
         """Show user management interface"""
-        self.clear_content()
-        
+        self.clear_content('users')
+        self.sections.show('users', self.build_user_management)
+    
+    def build_user_management(self, frame):
+        """Build the user management section"""
         # Title and add user button
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -229,7 +258,7 @@ class AdminDashboard:
         )
         title_label.pack(side="left")
         
-        add_user_button = ctk.CTkButton(
+        add_user_button = ActionButton(
             header_frame,
             text="➕ Add New User",
             command=self.add_new_user
@@ -237,7 +266,7 @@ class AdminDashboard:
         add_user_button.pack(side="right")
         
         # Filter tabs
-        filter_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        filter_frame = ctk.CTkFrame(frame, fg_color="transparent")
         filter_frame.pack(fill="x", padx=20, pady=(0, 20))
         
         # User type filter
@@ -259,8 +288,11 @@ class AdminDashboard:
             width=200
         )
         self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind('<KeyRelease>', self.schedule_user_search)
+        self.search_entry.bind('<Return>', lambda event: self.search_users() or "break")
+        self.pending_user_search = None
         
-        search_button = ctk.CTkButton(
+        search_button = ActionButton(
             search_frame,
             text="🔍",
             width=40,
@@ -268,15 +300,24 @@ class AdminDashboard:
         )
         search_button.pack(side="left")
         
+        self.users_count_label = ctk.CTkLabel(frame, text="", text_color="gray")
+        self.users_count_label.pack(anchor="w", padx=20)
+        
         # Users list
-        self.users_frame = ctk.CTkScrollableFrame(self.content_frame)
+        self.users_frame = ctk.CTkScrollableFrame(frame)
         self.users_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.user_cards = CardPool(
+            self.users_frame,
+            lambda parent: UserCard(parent, on_edit=self.edit_user, on_toggle_status=self.toggle_user_status)
+        )
         
         self.display_users("All Users")
+        # Coming back re-runs the current search; only changed rows are reconfigured
+        self.sections.on_show(self.search_users)
     
     def show_trainer_management(self):
         """Show trainer-specific management"""
-        self.clear_content()
+        self.clear_content('trainer_management')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -301,7 +342,7 @@ class AdminDashboard:
     
     def show_member_management(self):
         """Show member-specific management"""
-        self.clear_content()
+        self.clear_content('member_management')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -326,10 +367,13 @@ class AdminDashboard:
     
     def show_class_management(self):
         """Show fitness class management"""
-        self.clear_content()
-        
+        self.clear_content('classes')
+        self.sections.show('classes', self.build_class_management)
+    
+    def build_class_management(self, frame):
+        """Build the class management section"""
         # Title and add class button
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -339,7 +383,7 @@ class AdminDashboard:
         )
         title_label.pack(side="left")
         
-        add_class_button = ctk.CTkButton(
+        add_class_button = ActionButton(
             header_frame,
             text="➕ Create New Class",
             command=self.create_new_class
@@ -347,12 +391,18 @@ class AdminDashboard:
         add_class_button.pack(side="right")
         
         # Classes list
-        classes_frame = ctk.CTkScrollableFrame(self.content_frame)
+        classes_frame = ctk.CTkScrollableFrame(frame)
         classes_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        # Display existing classes
-        classes = FitnessClass.get_all_active()
-        
+        self.sections.bind(
+            classes_frame,
+            lambda: (FitnessClass.get_all_active(), ClassOccurrence.next_by_class()),
+            lambda result: self.show_class_list(classes_frame, *result),
+            key='class_management'
+        )
+    
+    def show_class_list(self, classes_frame, classes, next_occurrences):
+        """List active classes with their next occurrence"""
         if classes:
             for fitness_class in classes:
                 class_card = ctk.CTkFrame(classes_frame)
@@ -398,11 +448,18 @@ class AdminDashboard:
                     )
                     price_label.pack(side="left", padx=(20, 0))
                 
+                # Schedule
+                schedule_text = fitness_class.schedule_description
+                if fitness_class.id in next_occurrences:
+                    schedule_text += f"  •  Next: {next_occurrences[fitness_class.id].strftime('%a %b %d, %I:%M %p')}"
+                schedule_label = ctk.CTkLabel(class_card, text=schedule_text, text_color="gray")
+                schedule_label.pack(anchor="w", padx=20, pady=(0, 10))
+                
                 # Action buttons
                 button_frame = ctk.CTkFrame(class_card, fg_color="transparent")
                 button_frame.pack(fill="x", padx=20, pady=(0, 15))
                 
-                edit_button = ctk.CTkButton(
+                edit_button = ActionButton(
                     button_frame,
                     text="Edit",
                     width=80,
@@ -410,7 +467,7 @@ class AdminDashboard:
                 )
                 edit_button.pack(side="right", padx=(5, 0))
                 
-                assign_trainer_button = ctk.CTkButton(
+                assign_trainer_button = ActionButton(
                     button_frame,
                     text="Assign Trainer",
                     width=120,
@@ -428,7 +485,7 @@ class AdminDashboard:
     
     def show_reports(self):
         """Show reports and analytics"""
-        self.clear_content()
+        self.clear_content('reports')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -449,7 +506,7 @@ class AdminDashboard:
         row1_frame = ctk.CTkFrame(button_grid, fg_color="transparent")
         row1_frame.pack(pady=10)
         
-        user_report_button = ctk.CTkButton(
+        user_report_button = ActionButton(
             row1_frame,
             text="📊 User Activity Report",
             width=200,
@@ -458,7 +515,7 @@ class AdminDashboard:
         )
         user_report_button.pack(side="left", padx=10)
         
-        revenue_report_button = ctk.CTkButton(
+        revenue_report_button = ActionButton(
             row1_frame,
             text="💰 Revenue Report",
             width=200,
@@ -471,7 +528,7 @@ class AdminDashboard:
         row2_frame = ctk.CTkFrame(button_grid, fg_color="transparent")
         row2_frame.pack(pady=10)
         
-        session_report_button = ctk.CTkButton(
+        session_report_button = ActionButton(
             row2_frame,
             text="📅 Session Analytics",
             width=200,
@@ -480,7 +537,7 @@ class AdminDashboard:
         )
         session_report_button.pack(side="left", padx=10)
         
-        class_report_button = ctk.CTkButton(
+        class_report_button = ActionButton(
             row2_frame,
             text="🎯 Class Performance",
             width=200,
@@ -491,33 +548,28 @@ class AdminDashboard:
     
     def show_payments(self):
         """Show payment management"""
-        self.clear_content()
-        
+        self.clear_content('payments')
+        self.sections.show('payments', self.build_payments)
+    
+    def build_payments(self, frame):
+        """Build the payment management section"""
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Payment Management",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=20)
         
         # Payment overview
-        payments_frame = ctk.CTkFrame(self.content_frame)
+        payments_frame = ctk.CTkFrame(frame)
         payments_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Payment stats
         stats_frame = ctk.CTkFrame(payments_frame, fg_color="transparent")
         stats_frame.pack(fill="x", padx=20, pady=20)
         
-        # Calculate payment stats (simplified)
-        all_sessions = Session.get_by_member_id(0)  # Get all sessions
-        total_revenue = sum(s.price for s in all_sessions if s.price and s.status == 'completed')
-        pending_payments = sum(s.price for s in all_sessions if s.price and s.status == 'scheduled')
-        
-        revenue_card = self.create_stat_card(stats_frame, "Total Revenue", f"${total_revenue:.2f}", "💰")
-        revenue_card.pack(side="left", padx=10, fill="x", expand=True)
-        
-        pending_card = self.create_stat_card(stats_frame, "Pending", f"${pending_payments:.2f}", "⏳")
-        pending_card.pack(side="left", padx=10, fill="x", expand=True)
+        # Calculate payment stats in SQL; stale sessions are closed out nightly so 'scheduled' means upcoming
+        self.sections.bind(stats_frame, Session.totals_by_status, lambda totals: self.show_payment_stats(stats_frame, totals), key='session_totals')
         
         # Payment management features
         features_label = ctk.CTkLabel(
@@ -529,12 +581,26 @@ class AdminDashboard:
         )
         features_label.pack(expand=True, pady=20)
     
+    def show_payment_stats(self, stats_frame, totals):
+        """Fill the revenue and pending payment cards"""
+        total_revenue = totals.get('completed', (0, 0))[1]
+        pending_payments = totals.get('scheduled', (0, 0))[1]
+        
+        revenue_card = self.create_stat_card(stats_frame, "Total Revenue", f"${total_revenue:.2f}", "💰")
+        revenue_card.pack(side="left", padx=10, fill="x", expand=True)
+        
+        pending_card = self.create_stat_card(stats_frame, "Pending", f"${pending_payments:.2f}", "⏳")
+        pending_card.pack(side="left", padx=10, fill="x", expand=True)
+    
     def show_exercise_management(self):
         """Show exercise library management"""
-        self.clear_content()
-        
+        self.clear_content('exercises')
+        self.sections.show('exercises', self.build_exercise_management)
+    
+    def build_exercise_management(self, frame):
+        """Build the exercise library section"""
         # Title and add exercise button
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -544,74 +610,23 @@ class AdminDashboard:
         )
         title_label.pack(side="left")
         
-        add_exercise_button = ctk.CTkButton(
+        add_exercise_button = ActionButton(
             header_frame,
             text="➕ Add New Exercise",
             command=self.add_new_exercise
         )
         add_exercise_button.pack(side="right")
         
-        # Exercises list
-        exercises_frame = ctk.CTkScrollableFrame(self.content_frame)
-        exercises_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        exercises = Exercise.get_all()
-        
-        for exercise in exercises:
-            exercise_card = ctk.CTkFrame(exercises_frame)
-            exercise_card.pack(fill="x", pady=5, padx=10)
-            
-            # Exercise header
-            header_frame = ctk.CTkFrame(exercise_card, fg_color="transparent")
-            header_frame.pack(fill="x", padx=20, pady=15)
-            
-            exercise_name = ctk.CTkLabel(
-                header_frame,
-                text=exercise.name,
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            exercise_name.pack(side="left")
-            
-            # Edit button
-            edit_button = ctk.CTkButton(
-                header_frame,
-                text="Edit",
-                width=60,
-                command=lambda e=exercise: self.edit_exercise(e)
-            )
-            edit_button.pack(side="right")
-            
-            # Exercise details
-            details_frame = ctk.CTkFrame(exercise_card, fg_color="transparent")
-            details_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            if exercise.category:
-                category_label = ctk.CTkLabel(
-                    details_frame,
-                    text=f"Category: {exercise.category}",
-                    text_color="gray"
-                )
-                category_label.pack(anchor="w")
-            
-            if exercise.muscle_groups:
-                muscle_label = ctk.CTkLabel(
-                    details_frame,
-                    text=f"Muscle Groups: {exercise.muscle_groups}",
-                    text_color="gray"
-                )
-                muscle_label.pack(anchor="w")
-            
-            if exercise.difficulty_level:
-                difficulty_label = ctk.CTkLabel(
-                    details_frame,
-                    text=f"Difficulty: {exercise.difficulty_level}",
-                    text_color="gray"
-                )
-                difficulty_label.pack(anchor="w")
+        # Search, facet filters and results
+        self.exercise_browser = ExerciseBrowser(
+            frame,
+            on_edit=self.edit_exercise,
+            on_delete=self.delete_exercise
+        )
     
     def show_notification_management(self):
         """Show notification management"""
-        self.clear_content()
+        self.clear_content('notification_management')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -669,7 +684,7 @@ class AdminDashboard:
         self.notification_message_textbox.pack(anchor="w", pady=(0, 10))
         
         # Send button
-        send_button = ctk.CTkButton(
+        send_button = ActionButton(
             form_frame,
             text="📢 Send Notification",
             command=self.send_broadcast_notification
@@ -678,7 +693,7 @@ class AdminDashboard:
     
     def show_system_settings(self):
         """Show system settings"""
-        self.clear_content()
+        self.clear_content('system_settings')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -720,7 +735,7 @@ class AdminDashboard:
             )
             option_label.pack(side="left", padx=15, pady=8)
             
-            edit_button = ctk.CTkButton(
+            edit_button = ActionButton(
                 option_frame,
                 text="Edit",
                 width=60,
@@ -744,90 +759,49 @@ class AdminDashboard:
         """Filter users by type"""
         self.display_users(selected_filter)
     
+    def schedule_user_search(self, event):
+        """Search as the admin types, once typing pauses"""
+        if event.keysym == 'Return':
+            return
+        if self.pending_user_search is not None:
+            self.search_entry.after_cancel(self.pending_user_search)
+        self.pending_user_search = self.search_entry.after(self.USER_SEARCH_DELAY_MS, self.search_users)
+    
     def search_users(self):
         """Search users"""
-        search_term = self.search_entry.get().strip()
-        if search_term:
-            messagebox.showinfo("Search", f"Searching for: {search_term}\n(Search functionality would be implemented here)")
-        else:
-            self.display_users(self.user_filter.get())
+        self.pending_user_search = None
+        self.display_users(self.user_filter.get())
     
     def display_users(self, filter_type):
-        """Display users based on filter"""
-        # Clear current display
-        for widget in self.users_frame.winfo_children():
-            widget.destroy()
-        
-        # Get users based on filter
-        if filter_type == "All Users":
-            members = User.get_all_by_type('member')
-            trainers = User.get_all_by_type('trainer')
-            admins = User.get_all_by_type('admin')
-            all_users = members + trainers + admins
-        elif filter_type == "Members":
-            all_users = User.get_all_by_type('member')
-        elif filter_type == "Trainers":
-            all_users = User.get_all_by_type('trainer')
-        elif filter_type == "Admins":
-            all_users = User.get_all_by_type('admin')
+        """Display users matching the search box and type filter"""
+        # Filtering and the result limit are applied in the query
+        search_term = self.search_entry.get().strip()
+        user_type = self.USER_FILTER_TYPES.get(filter_type)
+        
+        # Only the latest search is shown; the previous results stay up until it arrives
+        if self.user_search_task is not None:
+            self.user_search_task.cancel()
+        self.user_search_task = TaskRunner.instance().submit(
+            self.users_frame,
+            User.search,
+            search_term,
+            user_type,
+            self.USER_RESULT_LIMIT,
+            on_done=self.show_users,
+            key=('user_search', search_term, user_type)
+        )
+    
+    def show_users(self, all_users):
+        """List users found by a search"""
+        self.user_search_task = None
+        
+        if len(all_users) == self.USER_RESULT_LIMIT:
+            self.users_count_label.configure(text=f"Showing the first {self.USER_RESULT_LIMIT} users - refine your search to see more")
         else:
-            all_users = []
+            self.users_count_label.configure(text=f"{len(all_users)} users")
         
-        # Display users
-        for user in all_users:
-            user_card = ctk.CTkFrame(self.users_frame)
-            user_card.pack(fill="x", pady=5, padx=10)
-            
-            # User info
-            info_frame = ctk.CTkFrame(user_card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=20, pady=15)
-            
-            user_name = ctk.CTkLabel(
-                info_frame,
-                text=f"{user.full_name} ({user.user_type.title()})",
-                font=ctk.CTkFont(size=14, weight="bold")
-            )
-            user_name.pack(side="left")
-            
-            # User details
-            details_frame = ctk.CTkFrame(user_card, fg_color="transparent")
-            details_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            email_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Email: {user.email}",
-                text_color="gray"
-            )
-            email_label.pack(anchor="w")
-            
-            username_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Username: {user.username}",
-                text_color="gray"
-            )
-            username_label.pack(anchor="w")
-            
-            # Action buttons
-            button_frame = ctk.CTkFrame(user_card, fg_color="transparent")
-            button_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            edit_button = ctk.CTkButton(
-                button_frame,
-                text="Edit",
-                width=80,
-                command=lambda u=user: self.edit_user(u)
-            )
-            edit_button.pack(side="right", padx=(5, 0))
-            
-            if user.user_type != 'admin':
-                deactivate_button = ctk.CTkButton(
-                    button_frame,
-                    text="Deactivate" if user.is_active else "Activate",
-                    width=100,
-                    fg_color="red" if user.is_active else "green",
-                    command=lambda u=user: self.toggle_user_status(u)
-                )
-                deactivate_button.pack(side="right", padx=(5, 0))
+        # Cards of users still listed are kept; the rest are reused for new results
+        self.user_cards.show(all_users)
     
     def add_new_user(self):
         """Add new user"""
@@ -878,11 +852,19 @@ class AdminDashboard:
         if dialog.result:
             messagebox.showinfo("Success", "New exercise added successfully!")
             self.show_exercise_management()
+            self.exercise_browser.refresh()
     
     def edit_exercise(self, exercise):
         """Edit exercise"""
         messagebox.showinfo("Edit Exercise", f"Edit exercise functionality for {exercise.name} would be implemented here")
     
+    def delete_exercise(self, exercise):
+        """Remove an exercise from the library"""
+        if messagebox.askyesno("Confirm", f"Are you sure you want to delete {exercise.name}?"):
+            Exercise(exercise_id=exercise.id).delete()
+            messagebox.showinfo("Success", "Exercise deleted successfully!")
+            self.exercise_browser.refresh()
+    
     def send_broadcast_notification(self):
         """Send broadcast notification"""
         title = self.notification_title_entry.get().strip()
@@ -893,27 +875,39 @@ class AdminDashboard:
             messagebox.showerror("Error", "Please enter both title and message")
             return
         
-        # Get target users
-        if audience == "All Users":
-            members = User.get_all_by_type('member')
-            trainers = User.get_all_by_type('trainer')
-            target_users = members + trainers
-        elif audience == "Members Only":
-            target_users = User.get_all_by_type('member')
-        elif audience == "Trainers Only":
-            target_users = User.get_all_by_type('trainer')
-        else:
-            target_users = []
-        
-        # Send notifications
-        for user in target_users:
-            Notification.create_notification(user.id, title, message, "admin")
-        
-        messagebox.showinfo("Success", f"Broadcast notification sent to {len(target_users)} users!")
+        def send():
+            # Get target users
+            if audience == "All Users":
+                members = User.get_all_by_type('member')
+                trainers = User.get_all_by_type('trainer')
+                target_users = members + trainers
+            elif audience == "Members Only":
+                target_users = User.get_all_by_type('member')
+            elif audience == "Trainers Only":
+                target_users = User.get_all_by_type('trainer')
+            else:
+                target_users = []
+            
+            # Send notifications
+            NOTIFICATION_FANOUT.observe(len(target_users), source="broadcast")
+            for user in target_users:
+                Notification.create_notification(user.id, title, message, "admin")
+            return len(target_users)
+        
+        def show_sent(user_count):
+            messagebox.showinfo("Success", f"Broadcast notification sent to {user_count} users!")
+            
+            # Clear form
+            self.notification_title_entry.delete(0, 'end')
+            self.notification_message_textbox.delete("1.0", 'end')
         
-        # Clear form
-        self.notification_title_entry.delete(0, 'end')
-        self.notification_message_textbox.delete("1.0", 'end')
+        TaskRunner.instance().submit(
+            self.notification_title_entry,
+            send,
+            on_done=show_sent,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to send notification: {str(e)}"),
+            key=('broadcast', audience, title, message)
+        )
     
     def generate_user_report(self):
         """Generate user activity report"""
@@ -921,15 +915,16 @@ class AdminDashboard:
     
     def generate_revenue_report(self):
         """Generate revenue report"""
-        # Calculate basic revenue stats
-        all_sessions = Session.get_by_member_id(0)  # All sessions
-        total_revenue = sum(s.price for s in all_sessions if s.price and s.status == 'completed')
-        total_sessions = len([s for s in all_sessions if s.status == 'completed'])
+        def show_report(totals):
+            # Calculate basic revenue stats
+            total_sessions, total_revenue = totals.get('completed', (0, 0))
+            
+            messagebox.showinfo(
+                "Revenue Report", 
+                f"Revenue Report Generated!\n\nTotal Revenue: ${total_revenue:.2f}\nCompleted Sessions: {total_sessions}\nAverage per Session: ${total_revenue/total_sessions if total_sessions > 0 else 0:.2f}"
+            )
         
-        messagebox.showinfo(
-            "Revenue Report", 
-            f"Revenue Report Generated!\n\nTotal Revenue: ${total_revenue:.2f}\nCompleted Sessions: {total_sessions}\nAverage per Session: ${total_revenue/total_sessions if total_sessions > 0 else 0:.2f}"
-        )
+        TaskRunner.instance().submit(self.main_frame, Session.totals_by_status, on_done=show_report, key='session_totals')
     
     def generate_session_report(self):
         """Generate session analytics"""
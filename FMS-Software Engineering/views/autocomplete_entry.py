@@ -0,0 +1,110 @@
+import customtkinter as ctk
+from views.action_button import ActionButton
+
+class AutocompleteEntry(ctk.CTkFrame):
+    """Entry with a debounced, ranked suggestion list underneath"""
+    
+    def __init__(self, parent, search, on_select=None, width=300, placeholder_text="", limit=8, delay_ms=120):
+        super().__init__(parent, fg_color="transparent")
+        self.search = search
+        self.on_select = on_select
+        self.limit = limit
+        self.delay_ms = delay_ms
+        self.pending_search = None
+        self.suggestions = []
+        self.highlighted = 0
+        self.last_query = None
+        
+        self.entry = ctk.CTkEntry(self, width=width, placeholder_text=placeholder_text)
+        self.entry.pack(fill="x")
+        self.entry.bind('<KeyRelease>', self.on_key_release)
+        self.entry.bind('<Down>', lambda event: self.move_highlight(1) or "break")
+        self.entry.bind('<Up>', lambda event: self.move_highlight(-1) or "break")
+        self.entry.bind('<Return>', lambda event: self.choose_highlighted() or "break")
+        self.entry.bind('<Escape>', lambda event: self.hide_suggestions() or "break")
+        
+        # Suggestion buttons are created once and relabelled on every keystroke
+        self.suggestions_frame = ctk.CTkFrame(self)
+        self.suggestion_buttons = []
+        for index in range(limit):
+            button = ActionButton(
+                self.suggestions_frame,
+                text="",
+                anchor="w",
+                height=26,
+                fg_color="transparent",
+                text_color=("gray10", "gray90"),
+                hover_color=("gray75", "gray30"),
+                command=lambda i=index: self.choose(i)
+            )
+            self.suggestion_buttons.append(button)
+    
+    def get(self):
+        return self.entry.get()
+    
+    def set(self, text):
+        """Replace the entry text without showing suggestions"""
+        self.entry.delete(0, 'end')
+        self.entry.insert(0, text)
+        self.last_query = text
+        self.hide_suggestions()
+    
+    def on_key_release(self, event):
+        """Restart the debounce timer when the text changes"""
+        if event.keysym in ('Up', 'Down', 'Return', 'Escape'):
+            return
+        if self.pending_search is not None:
+            self.after_cancel(self.pending_search)
+        self.pending_search = self.after(self.delay_ms, self.run_search)
+    
+    def run_search(self):
+        """Look up suggestions for the current text"""
+        self.pending_search = None
+        query = self.entry.get().strip()
+        if query == self.last_query:
+            return
+        self.last_query = query
+        
+        self.suggestions = self.search(query, self.limit) if query else []
+        self.highlighted = 0
+        self.show_suggestions()
+    
+    def show_suggestions(self):
+        """Relabel the suggestion buttons and show the list"""
+        if not self.suggestions:
+            self.hide_suggestions()
+            return
+        
+        for index, button in enumerate(self.suggestion_buttons):
+            if index < len(self.suggestions):
+                button.configure(text=self.suggestions[index][1])
+                button.pack(fill="x", padx=2, pady=1)
+            else:
+                button.pack_forget()
+        self.update_highlight()
+        self.suggestions_frame.pack(fill="x", pady=(2, 0))
+    
+    def hide_suggestions(self):
+        self.suggestions = []
+        self.suggestions_frame.pack_forget()
+    
+    def move_highlight(self, step):
+        """Move the keyboard highlight through the suggestions"""
+        if self.suggestions:
+            self.highlighted = (self.highlighted + step) % len(self.suggestions)
+            self.update_highlight()
+    
+    def update_highlight(self):
+        for index, button in enumerate(self.suggestion_buttons[:len(self.suggestions)]):
+            button.configure(fg_color=("gray80", "gray25") if index == self.highlighted else "transparent")
+    
+    def choose_highlighted(self):
+        if self.suggestions:
+            self.choose(self.highlighted)
+    
+    def choose(self, index):
+        """Fill the entry with a suggestion and notify the owner"""
+        value, label = self.suggestions[index]
+        self.set(label)
+        if self.on_select:
+            self.on_select(value, label)
\ No newline at end of file
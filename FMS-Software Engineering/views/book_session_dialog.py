@@ -3,16 +3,34 @@ from tkinter import messagebox
 from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 from models.user import User
-from models.session import Session
+from models.session import Session, SessionConflictError
 from models.notification import Notification
+from services.availability_service import AvailabilityService
+from views.action_button import ActionButton
 
 class BookSessionDialog:
-    def __init__(self, parent, member_id):
+    NO_TIMES = "No open times"
+    
+    def __init__(self, parent, member_id, trainer_id=None, start_time=None, duration=None, on_booked=None):
         self.parent = parent
         self.member_id = member_id
+        self.on_booked = on_booked
         self.result = None
         
         self.setup_dialog()
+        
+        # Preselect a slot picked in the find-a-slot view
+        if trainer_id is not None:
+            for trainer_name in self.trainer_menu.cget("values"):
+                if trainer_name.endswith(f"(ID: {trainer_id})"):
+                    self.trainer_menu.set(trainer_name)
+        if duration is not None:
+            self.duration_menu.set(str(duration))
+        if start_time is not None:
+            self.date_entry.set_date(start_time.date())
+        self.refresh_times()
+        if start_time is not None and start_time.strftime('%I:%M %p') in self.time_menu.cget("values"):
+            self.time_menu.set(start_time.strftime('%I:%M %p'))
     
     def setup_dialog(self):
         """Setup session booking dialog"""
@@ -47,7 +65,8 @@ class BookSessionDialog:
         self.trainer_menu = ctk.CTkOptionMenu(
             main_frame,
             values=trainer_names if trainer_names else ["No trainers available"],
-            width=400
+            width=400,
+            command=lambda value: self.refresh_times()
         )
         self.trainer_menu.pack(pady=(0, 20))
         
@@ -91,6 +110,7 @@ class BookSessionDialog:
             maxdate=(datetime.now() + timedelta(days=90)).date()
         )
         self.date_entry.pack(side="left")
+        self.date_entry.bind('<<DateEntrySelected>>', lambda event: self.refresh_times())
         
         # Time selection
         time_label = ctk.CTkLabel(main_frame, text="Session Time")
@@ -99,24 +119,13 @@ class BookSessionDialog:
         time_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         time_frame.pack(fill="x", pady=(0, 20))
         
-        # Hour selection
-        self.hour_menu = ctk.CTkOptionMenu(
+        # Only times when both the trainer and the member are free are offered
+        self.time_menu = ctk.CTkOptionMenu(
             time_frame,
-            values=[f"{i:02d}" for i in range(6, 22)],  # 6 AM to 9 PM
-            width=80
+            values=[self.NO_TIMES],
+            width=160
         )
-        self.hour_menu.pack(side="left", padx=(0, 10))
-        
-        colon_label = ctk.CTkLabel(time_frame, text=":")
-        colon_label.pack(side="left")
-        
-        # Minute selection
-        self.minute_menu = ctk.CTkOptionMenu(
-            time_frame,
-            values=["00", "15", "30", "45"],
-            width=80
-        )
-        self.minute_menu.pack(side="left", padx=(10, 0))
+        self.time_menu.pack(side="left")
         
         # Duration
         duration_label = ctk.CTkLabel(main_frame, text="Duration (minutes)")
@@ -125,7 +134,8 @@ class BookSessionDialog:
         self.duration_menu = ctk.CTkOptionMenu(
             main_frame,
             values=["30", "45", "60", "75", "90", "120"],
-            width=400
+            width=400,
+            command=lambda value: self.refresh_times()
         )
         self.duration_menu.set("60")
         self.duration_menu.pack(pady=(0, 20))
@@ -156,7 +166,7 @@ class BookSessionDialog:
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(20, 0))
         
-        cancel_button = ctk.CTkButton(
+        cancel_button = ActionButton(
             button_frame,
             text="Cancel",
             width=100,
@@ -164,7 +174,7 @@ class BookSessionDialog:
         )
         cancel_button.pack(side="right", padx=(10, 0))
         
-        book_button = ctk.CTkButton(
+        book_button = ActionButton(
             button_frame,
             text="Book Session",
             width=120,
@@ -173,8 +183,6 @@ class BookSessionDialog:
         book_button.pack(side="right")
         
         # Set default values
-        self.hour_menu.set("09")
-        self.minute_menu.set("00")
         self.price_entry.insert(0, "75.00")
     
     def center_dialog(self):
@@ -184,6 +192,30 @@ class BookSessionDialog:
         y = (self.dialog.winfo_screenheight() - self.dialog.winfo_height()) // 2
         self.dialog.geometry(f"+{x}+{y}")
     
+    def get_trainer_id(self):
+        """Get the ID of the selected trainer, or None"""
+        try:
+            return int(self.trainer_menu.get().split("ID: ")[1].split(")")[0])
+        except (IndexError, ValueError):
+            return None
+    
+    def refresh_times(self):
+        """Offer the open start times for the selected trainer, date and duration"""
+        trainer_id = self.get_trainer_id()
+        open_times = []
+        if trainer_id is not None:
+            open_times = AvailabilityService.instance().open_slots(
+                trainer_id,
+                self.date_entry.get_date(),
+                int(self.duration_menu.get()),
+                member_id=self.member_id
+            )
+        
+        time_labels = [start.strftime('%I:%M %p') for start in open_times] or [self.NO_TIMES]
+        self.time_menu.configure(values=time_labels)
+        if self.time_menu.get() not in time_labels:
+            self.time_menu.set(time_labels[0])
+    
     def book_session(self):
         """Handle session booking"""
         # Validate trainer selection
@@ -192,10 +224,8 @@ class BookSessionDialog:
             return
         
         # Extract trainer ID from selection
-        trainer_selection = self.trainer_menu.get()
-        try:
-            trainer_id = int(trainer_selection.split("ID: ")[1].split(")")[0])
-        except (IndexError, ValueError):
+        trainer_id = self.get_trainer_id()
+        if trainer_id is None:
             messagebox.showerror("Error", "Please select a valid trainer.")
             return
         
@@ -209,11 +239,13 @@ class BookSessionDialog:
             return
         
         # Build session datetime
-        selected_date = self.date_entry.get()
-        hour = int(self.hour_menu.get())
-        minute = int(self.minute_menu.get())
+        if self.time_menu.get() == self.NO_TIMES:
+            messagebox.showerror("Error", "This trainer has no open times on that date. Please pick another date or trainer.")
+            return
         
-        session_datetime = datetime.combine(selected_date, datetime.min.time().replace(hour=hour, minute=minute))
+        selected_date = self.date_entry.get_date()
+        selected_time = datetime.strptime(self.time_menu.get(), '%I:%M %p').time()
+        session_datetime = datetime.combine(selected_date, selected_time)
         
         # Check if session is in the past
         if session_datetime <= datetime.now():
@@ -233,7 +265,7 @@ class BookSessionDialog:
         )
         
         try:
-            session.save()
+            session.book()
             
             # Create notifications
             member = User.get_by_id(self.member_id)
@@ -257,7 +289,17 @@ class BookSessionDialog:
             
             self.result = True
             self.dialog.destroy()
+            if self.on_booked:
+                self.on_booked()
             
+        except SessionConflictError as e:
+            conflict_time = datetime.fromisoformat(e.conflicting_session.session_date).strftime('%I:%M %p on %B %d')
+            if e.conflict_with == 'trainer':
+                message = f"This trainer already has a session booked at {conflict_time}."
+            else:
+                message = f"You already have a session booked at {conflict_time}."
+            messagebox.showerror("Time Unavailable", f"{message} Please choose another time.")
+            self.refresh_times()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to book session: {str(e)}")
     
@@ -0,0 +1,109 @@
+import customtkinter as ctk
+from views.section_cache import snapshot
+
+def repack(entries, shown):
+    """Pack the shown widgets of [(widget, pack options)] in list order and forget the others"""
+    for widget, _ in entries:
+        widget.pack_forget()
+    for widget, pack_options in entries:
+        if widget in shown:
+            widget.pack(**pack_options)
+
+class Card:
+    """Row widget tree built once, then reconfigured for whichever item it shows"""
+    
+    PACK_OPTIONS = {"fill": "x", "pady": 5, "padx": 10}
+    
+    def __init__(self, parent):
+        self.frame = ctk.CTkFrame(parent)
+        self.item = None
+        self.signature = None
+        self.optional = []  # [(widget, pack options)] packed only for some items
+        self.shown = None
+        self.build()
+    
+    def build(self):
+        """Create the card's widgets; commands act on self.item so they never need rebinding"""
+        raise NotImplementedError
+    
+    def update(self, item):
+        """Configure the widgets for item"""
+        raise NotImplementedError
+    
+    def show(self, item):
+        """Show item, leaving the widgets alone when it is unchanged"""
+        self.item = item
+        signature = snapshot(item)
+        if signature != self.signature:
+            self.signature = signature
+            self.update(item)
+    
+    def add_optional(self, widget, **pack_options):
+        self.optional.append((widget, pack_options))
+        return widget
+    
+    def pack_optional(self, *widgets):
+        """Pack just these optional widgets"""
+        if widgets != self.shown:
+            self.shown = widgets
+            repack(self.optional, widgets)
+
+class CardPool:
+    """Shows a list of items as cards, reusing the cards of the previous render instead of rebuilding them"""
+    
+    # Hidden cards kept for reuse when a list shrinks
+    MAX_SPARE = 50
+    
+    def __init__(self, parent, new_card, empty_text=None, by_position=False):
+        self.parent = parent
+        self.new_card = new_card  # new_card(parent) -> Card
+        self.by_position = by_position  # Match cards to items by index instead of item.id
+        self.cards = {}  # key -> Card, in display order
+        self.spare = []
+        self.empty_label = None
+        if empty_text:
+            self.empty_label = ctk.CTkLabel(parent, text=empty_text, font=ctk.CTkFont(size=16), text_color="gray")
+    
+    def show(self, items):
+        """Show one card per item in order; only rows whose item changed are reconfigured"""
+        if self.by_position:
+            keys = list(range(len(items)))
+        else:
+            keys = [item.id for item in items]
+        previous = self.cards
+        
+        # Cards of items that are gone are hidden and reused for new ones
+        wanted = set(keys)
+        for key, card in previous.items():
+            if key not in wanted:
+                card.frame.pack_forget()
+                self.spare.append(card)
+        
+        self.cards = {}
+        for key, item in zip(keys, items):
+            card = previous.get(key)
+            if card is None:
+                card = self.spare.pop() if self.spare else self.new_card(self.parent)
+            card.show(item)
+            self.cards[key] = card
+        
+        if list(previous) != keys:
+            # Order changed: repacking moves existing widgets without creating any
+            for card in self.cards.values():
+                card.frame.pack_forget()
+            for card in self.cards.values():
+                card.frame.pack(**card.PACK_OPTIONS)
+        
+        while len(self.spare) > self.MAX_SPARE:
+            self.spare.pop().frame.destroy()
+        
+        if self.empty_label is not None:
+            if items:
+                self.empty_label.pack_forget()
+            else:
+                self.empty_label.pack(pady=50)
+        return self.cards
+    
+    def items(self):
+        """Get the items shown, in order"""
+        return [card.item for card in self.cards.values()]
\ No newline at end of file
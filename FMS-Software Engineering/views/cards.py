@@ -0,0 +1,261 @@
+import customtkinter as ctk
+from views.card_pool import Card
+from views.action_button import ActionButton
+
+class SessionCard(Card):
+    STATUS_COLORS = {
+        'scheduled': 'green',
+        'completed': 'blue',
+        'cancelled': 'red',
+        'no_show': 'orange'
+    }
+    
+    def __init__(self, parent, on_cancel, on_complete=None, client_name=None):
+        self.on_cancel = on_cancel
+        self.on_complete = on_complete  # Trainers only
+        self.client_name = client_name  # client_name(session), shown on trainer cards
+        super().__init__(parent)
+    
+    def build(self):
+        # Session info
+        info_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info_frame.pack(fill="x", padx=20, pady=15)
+        
+        # Status indicator
+        self.status_label = ctk.CTkLabel(info_frame, text="")
+        self.status_label.pack(side="left")
+        
+        self.info_label = ctk.CTkLabel(info_frame, text="", font=ctk.CTkFont(size=14))
+        self.info_label.pack(side="left", padx=(20, 0))
+        
+        # Price
+        self.price_label = self.add_optional(
+            ctk.CTkLabel(info_frame, text="", font=ctk.CTkFont(weight="bold")),
+            side="right"
+        )
+        
+        # Actions for upcoming sessions
+        self.button_frame = self.add_optional(
+            ctk.CTkFrame(info_frame, fg_color="transparent"),
+            side="right",
+            padx=(0, 20)
+        )
+        
+        if self.on_complete is not None:
+            complete_button = ActionButton(
+                self.button_frame,
+                text="Complete",
+                width=80,
+                fg_color="green",
+                hover_color="dark green",
+                command=lambda: self.on_complete(self.item)
+            )
+            complete_button.pack(side="left", padx=(0, 5))
+        
+        cancel_button = ActionButton(
+            self.button_frame,
+            text="Cancel",
+            width=80,
+            fg_color="red",
+            hover_color="dark red",
+            command=lambda: self.on_cancel(self.item)
+        )
+        cancel_button.pack(side="left")
+    
+    def update(self, session):
+        self.status_label.configure(
+            text=f"● {session.status.replace('_', ' ').title()}",
+            text_color=self.STATUS_COLORS.get(session.status, 'gray')
+        )
+        
+        session_info = session.session_type or 'Training Session'
+        if self.client_name is not None:
+            session_info = f"{self.client_name(session)} - {session_info}"
+        if session.session_date:
+            session_info += f" - {session.session_date}"
+        self.info_label.configure(text=session_info)
+        
+        shown = []
+        if session.price:
+            self.price_label.configure(text=f"${session.price:.2f}")
+            shown.append(self.price_label)
+        if session.status == 'scheduled':
+            shown.append(self.button_frame)
+        self.pack_optional(*shown)
+
+class NotificationCard(Card):
+    def build(self):
+        # Notification header
+        header_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=15)
+        
+        self.title_label = ctk.CTkLabel(header_frame, text="", font=ctk.CTkFont(size=14, weight="bold"))
+        self.title_label.pack(side="left")
+        
+        self.date_label = ctk.CTkLabel(header_frame, text="", text_color="gray")
+        self.date_label.pack(side="right")
+        
+        # Notification message
+        self.message_label = ctk.CTkLabel(self.frame, text="", wraplength=600, justify="left")
+        self.message_label.pack(anchor="w", padx=20, pady=(0, 15))
+    
+    def update(self, notification):
+        title_text = notification.title
+        if not notification.is_read:
+            title_text = "🔵 " + title_text
+        self.title_label.configure(text=title_text)
+        self.date_label.configure(text=notification.created_at[:10] if notification.created_at else "")
+        self.message_label.configure(text=notification.message)
+
+class UserCard(Card):
+    def __init__(self, parent, on_edit, on_toggle_status):
+        self.on_edit = on_edit
+        self.on_toggle_status = on_toggle_status
+        super().__init__(parent)
+    
+    def build(self):
+        # User info
+        info_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info_frame.pack(fill="x", padx=20, pady=15)
+        
+        self.name_label = ctk.CTkLabel(info_frame, text="", font=ctk.CTkFont(size=14, weight="bold"))
+        self.name_label.pack(side="left")
+        
+        # User details
+        details_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        details_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        self.email_label = ctk.CTkLabel(details_frame, text="", text_color="gray")
+        self.email_label.pack(anchor="w")
+        
+        self.username_label = ctk.CTkLabel(details_frame, text="", text_color="gray")
+        self.username_label.pack(anchor="w")
+        
+        # Action buttons
+        button_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        edit_button = ActionButton(
+            button_frame,
+            text="Edit",
+            width=80,
+            command=lambda: self.on_edit(self.item)
+        )
+        edit_button.pack(side="right", padx=(5, 0))
+        
+        # Admins can't be deactivated
+        self.status_button = self.add_optional(
+            ActionButton(button_frame, text="", width=100, command=lambda: self.on_toggle_status(self.item)),
+            side="right",
+            padx=(5, 0)
+        )
+    
+    def update(self, user):
+        self.name_label.configure(text=f"{user.full_name} ({user.user_type.title()})")
+        self.email_label.configure(text=f"Email: {user.email}")
+        self.username_label.configure(text=f"Username: {user.username}")
+        
+        if user.user_type != 'admin':
+            self.status_button.configure(
+                text="Deactivate" if user.is_active else "Activate",
+                fg_color="red" if user.is_active else "green"
+            )
+            self.pack_optional(self.status_button)
+        else:
+            self.pack_optional()
+
+class ExerciseCard(Card):
+    def __init__(self, parent, image_loader, on_edit=None, on_delete=None):
+        self.image_loader = image_loader
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+        super().__init__(parent)
+    
+    def build(self):
+        # Exercise header
+        header_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=15)
+        
+        self.name_label = ctk.CTkLabel(header_frame, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.name_label.pack(side="left")
+        
+        # Thumbnail is filled in once the card scrolls into view
+        self.image_label = self.add_optional(
+            ctk.CTkLabel(header_frame, text="", width=64, height=64),
+            side="left",
+            padx=(0, 15),
+            before=self.name_label
+        )
+        
+        if self.on_delete:
+            delete_button = ActionButton(
+                header_frame,
+                text="Delete",
+                width=60,
+                fg_color="red",
+                hover_color="dark red",
+                command=lambda: self.on_delete(self.item)
+            )
+            delete_button.pack(side="right", padx=(5, 0))
+        
+        if self.on_edit:
+            edit_button = ActionButton(
+                header_frame,
+                text="Edit",
+                width=60,
+                command=lambda: self.on_edit(self.item)
+            )
+            edit_button.pack(side="right")
+        
+        self.difficulty_label = ctk.CTkLabel(header_frame, text="", text_color="gray")
+        self.difficulty_label.pack(side="right", padx=(0, 20 if self.on_edit or self.on_delete else 0))
+        
+        # Exercise details
+        details_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        details_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        self.category_label = self.add_optional(ctk.CTkLabel(details_frame, text="", text_color="gray"), anchor="w")
+        self.muscle_label = self.add_optional(ctk.CTkLabel(details_frame, text="", text_color="gray"), anchor="w")
+        self.equipment_label = self.add_optional(ctk.CTkLabel(details_frame, text="", text_color="gray"), anchor="w")
+    
+    def update(self, exercise):
+        self.name_label.configure(text=exercise.name)
+        self.difficulty_label.configure(text=exercise.difficulty_level or "Beginner")
+        
+        shown = []
+        if exercise.image_path:
+            self.image_loader.add(self.image_label, exercise.image_path)
+            shown.append(self.image_label)
+        if exercise.category:
+            self.category_label.configure(text=f"Category: {exercise.category}")
+            shown.append(self.category_label)
+        if exercise.muscle_groups:
+            self.muscle_label.configure(text=f"Target Muscles: {exercise.muscle_groups}")
+            shown.append(self.muscle_label)
+        if exercise.equipment:
+            self.equipment_label.configure(text=f"Equipment: {exercise.equipment}")
+            shown.append(self.equipment_label)
+        self.pack_optional(*shown)
+
+class WorkoutExerciseCard(Card):
+    PACK_OPTIONS = {"fill": "x", "pady": 2}
+    
+    def __init__(self, parent, on_remove):
+        self.on_remove = on_remove
+        super().__init__(parent)
+    
+    def build(self):
+        self.exercise_label = ctk.CTkLabel(self.frame, text="", font=ctk.CTkFont(size=12))
+        self.exercise_label.pack(side="left", padx=10, pady=5)
+        
+        remove_button = ActionButton(
+            self.frame,
+            text="Remove",
+            width=60,
+            height=25,
+            command=lambda: self.on_remove(self.item)
+        )
+        remove_button.pack(side="right", padx=10, pady=5)
+    
+    def update(self, exercise):
+        self.exercise_label.configure(text=f"{exercise['name']} - Sets: {exercise['sets']}, Reps: {exercise['reps']}")
\ No newline at end of file
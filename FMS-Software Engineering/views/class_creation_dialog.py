@@ -1,7 +1,12 @@
 import customtkinter as ctk
 from tkinter import messagebox
+from tkcalendar import DateEntry
+from datetime import datetime
+from itertools import islice
 from models.session import FitnessClass
 from models.user import User
+from services.class_schedule import WEEKDAY_CODES, WEEKDAY_NAMES, dump_rule, describe_rule, iter_occurrences
+from views.action_button import ActionButton
 
 class ClassCreationDialog:
     def __init__(self, parent):
@@ -14,7 +19,7 @@ class ClassCreationDialog:
         """Setup class creation dialog"""
         self.dialog = ctk.CTkToplevel(self.parent)
         self.dialog.title("Create New Fitness Class")
-        self.dialog.geometry("500x600")
+        self.dialog.geometry("500x700")
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
         
@@ -103,22 +108,131 @@ class ClassCreationDialog:
         self.duration_menu.set("60")
         self.duration_menu.pack(pady=(0, 15))
         
-        # Schedule (simplified)
+        # Schedule
         schedule_label = ctk.CTkLabel(main_frame, text="Schedule")
         schedule_label.pack(anchor="w", pady=(0, 5))
         
-        self.schedule_entry = ctk.CTkEntry(
+        repeat_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        repeat_frame.pack(fill="x", pady=(0, 10))
+        
+        repeat_label = ctk.CTkLabel(repeat_frame, text="Every")
+        repeat_label.pack(side="left", padx=(0, 10))
+        
+        self.interval_menu = ctk.CTkOptionMenu(
+            repeat_frame,
+            values=["1", "2", "3", "4"],
+            width=60,
+            command=lambda value: self.update_schedule_preview()
+        )
+        self.interval_menu.pack(side="left", padx=(0, 10))
+        
+        self.frequency_menu = ctk.CTkOptionMenu(
+            repeat_frame,
+            values=["week(s)", "day(s)"],
+            width=100,
+            command=lambda value: self.update_schedule_preview()
+        )
+        self.frequency_menu.pack(side="left")
+        
+        # Weekdays (weekly schedules only)
+        days_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        days_frame.pack(fill="x", pady=(0, 10))
+        
+        self.day_checkboxes = []
+        for day_name in WEEKDAY_NAMES:
+            day_checkbox = ctk.CTkCheckBox(
+                days_frame,
+                text=day_name,
+                width=55,
+                command=self.update_schedule_preview
+            )
+            day_checkbox.pack(side="left")
+            self.day_checkboxes.append(day_checkbox)
+        
+        # Start time
+        time_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        time_frame.pack(fill="x", pady=(0, 10))
+        
+        time_label = ctk.CTkLabel(time_frame, text="At")
+        time_label.pack(side="left", padx=(0, 10))
+        
+        self.hour_menu = ctk.CTkOptionMenu(
+            time_frame,
+            values=[f"{hour:02d}" for hour in range(1, 13)],
+            width=70,
+            command=lambda value: self.update_schedule_preview()
+        )
+        self.hour_menu.set("06")
+        self.hour_menu.pack(side="left", padx=(0, 5))
+        
+        self.minute_menu = ctk.CTkOptionMenu(
+            time_frame,
+            values=["00", "15", "30", "45"],
+            width=70,
+            command=lambda value: self.update_schedule_preview()
+        )
+        self.minute_menu.pack(side="left", padx=(0, 5))
+        
+        self.period_menu = ctk.CTkOptionMenu(
+            time_frame,
+            values=["AM", "PM"],
+            width=70,
+            command=lambda value: self.update_schedule_preview()
+        )
+        self.period_menu.set("PM")
+        self.period_menu.pack(side="left")
+        
+        # Date range
+        range_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        range_frame.pack(fill="x", pady=(0, 10))
+        
+        starts_label = ctk.CTkLabel(range_frame, text="Starts")
+        starts_label.pack(side="left", padx=(0, 10))
+        
+        self.start_date_entry = DateEntry(
+            range_frame,
+            width=12,
+            background='darkblue',
+            foreground='white',
+            borderwidth=2,
+            mindate=datetime.now().date()
+        )
+        self.start_date_entry.pack(side="left", padx=(0, 20))
+        self.start_date_entry.bind('<<DateEntrySelected>>', lambda event: self.update_schedule_preview())
+        
+        self.has_end_checkbox = ctk.CTkCheckBox(
+            range_frame,
+            text="Ends",
+            width=60,
+            command=self.update_schedule_preview
+        )
+        self.has_end_checkbox.pack(side="left", padx=(0, 10))
+        
+        self.end_date_entry = DateEntry(
+            range_frame,
+            width=12,
+            background='darkblue',
+            foreground='white',
+            borderwidth=2,
+            mindate=datetime.now().date()
+        )
+        self.end_date_entry.pack(side="left")
+        self.end_date_entry.bind('<<DateEntrySelected>>', lambda event: self.update_schedule_preview())
+        
+        # Summary and the next few class times
+        self.schedule_preview = ctk.CTkLabel(
             main_frame,
-            placeholder_text="e.g., 'Mondays and Wednesdays at 6:00 PM'",
-            width=400
+            text="",
+            text_color="gray",
+            justify="left"
         )
-        self.schedule_entry.pack(pady=(0, 20))
+        self.schedule_preview.pack(anchor="w", pady=(0, 20))
         
         # Buttons
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(20, 0))
         
-        cancel_button = ctk.CTkButton(
+        cancel_button = ActionButton(
             button_frame,
             text="Cancel",
             width=100,
@@ -126,7 +240,7 @@ class ClassCreationDialog:
         )
         cancel_button.pack(side="right", padx=(10, 0))
         
-        create_button = ctk.CTkButton(
+        create_button = ActionButton(
             button_frame,
             text="Create Class",
             width=120,
@@ -137,6 +251,7 @@ class ClassCreationDialog:
         # Set defaults
         self.price_entry.insert(0, "25.00")
         self.capacity_entry.insert(0, "20")
+        self.update_schedule_preview()
     
     def center_dialog(self):
         """Center dialog on screen"""
@@ -145,6 +260,44 @@ class ClassCreationDialog:
         y = (self.dialog.winfo_screenheight() - self.dialog.winfo_height()) // 2
         self.dialog.geometry(f"+{x}+{y}")
     
+    def get_schedule_rule(self):
+        """Build the recurrence rule from the schedule fields, or None if no weekday is picked"""
+        at = datetime.strptime(
+            f"{self.hour_menu.get()}:{self.minute_menu.get()} {self.period_menu.get()}", '%I:%M %p'
+        ).strftime('%H:%M')
+        rule = {
+            'freq': 'daily' if self.frequency_menu.get() == "day(s)" else 'weekly',
+            'interval': int(self.interval_menu.get()),
+            'at': at,
+            'start': self.start_date_entry.get_date().isoformat()
+        }
+        if rule['freq'] == 'weekly':
+            rule['byday'] = [code for code, checkbox in zip(WEEKDAY_CODES, self.day_checkboxes) if checkbox.get()]
+            if not rule['byday']:
+                return None
+        if self.has_end_checkbox.get():
+            rule['until'] = self.end_date_entry.get_date().isoformat()
+        return rule
+    
+    def update_schedule_preview(self):
+        """Show the schedule summary and its next few class times"""
+        weekly = self.frequency_menu.get() == "week(s)"
+        for checkbox in self.day_checkboxes:
+            checkbox.configure(state="normal" if weekly else "disabled")
+        self.end_date_entry.configure(state="normal" if self.has_end_checkbox.get() else "disabled")
+        
+        rule = self.get_schedule_rule()
+        if rule is None:
+            self.schedule_preview.configure(text="Pick at least one day of the week.")
+            return
+        
+        upcoming = list(islice(iter_occurrences(rule, datetime.now()), 3))
+        if upcoming:
+            next_times = ", ".join(start.strftime('%a %b %d, %I:%M %p') for start in upcoming)
+            self.schedule_preview.configure(text=f"{describe_rule(rule)}\nNext: {next_times}")
+        else:
+            self.schedule_preview.configure(text=f"{describe_rule(rule)}\nNo upcoming classes.")
+    
     def create_class(self):
         """Create the fitness class"""
         # Validate required fields
@@ -184,14 +337,22 @@ class ClassCreationDialog:
             return
         
         duration = int(self.duration_menu.get())
-        schedule = self.schedule_entry.get().strip()
+        
+        # Validate schedule
+        rule = self.get_schedule_rule()
+        if rule is None:
+            messagebox.showerror("Error", "Please pick at least one day of the week")
+            return
+        if rule.get('until') and rule['until'] < rule['start']:
+            messagebox.showerror("Error", "The end date must be after the start date")
+            return
         
         # Create fitness class
         fitness_class = FitnessClass(
             name=name,
             description=description,
             trainer_id=trainer_id,
-            schedule=schedule,  # In a full implementation, this would be JSON formatted
+            schedule=dump_rule(rule),
             capacity=capacity,
             price=price,
             duration=duration
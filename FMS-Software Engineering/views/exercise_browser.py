@@ -0,0 +1,153 @@
+import customtkinter as ctk
+from models.workout import Exercise
+from services.exercise_catalog import ExerciseCatalog
+from views.card_pool import CardPool
+from views.cards import ExerciseCard
+from views.lazy_image_loader import LazyImageLoader
+from views.action_button import ActionButton
+
+class ExerciseBrowser:
+    # Facet menus: (facet, label shown when nothing is selected)
+    FACET_MENUS = [
+        ("category", "All Categories"),
+        ("muscle_group", "All Muscle Groups"),
+        ("equipment", "All Equipment"),
+        ("difficulty_level", "All Levels"),
+    ]
+    
+    # Only the top of long result lists is rendered, even with cards recycled between searches
+    MAX_CARDS = 100
+    
+    # Search hits considered before facet filtering
+    SEARCH_LIMIT = 500
+    
+    def __init__(self, parent, on_edit=None, on_delete=None):
+        self.parent = parent
+        self.on_edit = on_edit
+        self.on_delete = on_delete
+        self.filters = {facet: None for facet, _ in self.FACET_MENUS}
+        self.search_ids = None
+        self.facet_menus = {}
+        self.facet_labels = {}
+        
+        self.setup_ui()
+        self.refresh()
+    
+    def setup_ui(self):
+        """Setup search bar, facet filters and results list"""
+        # Search
+        search_frame = ctk.CTkFrame(self.parent, fg_color="transparent")
+        search_frame.pack(fill="x", padx=20, pady=(0, 10))
+        
+        self.search_entry = ctk.CTkEntry(
+            search_frame,
+            placeholder_text="Search exercises...",
+            width=300
+        )
+        self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind('<Return>', lambda event: self.search() or "break")
+        
+        search_button = ActionButton(
+            search_frame,
+            text="Search",
+            width=80,
+            command=self.search
+        )
+        search_button.pack(side="left", padx=(0, 10))
+        
+        clear_button = ActionButton(
+            search_frame,
+            text="Clear Filters",
+            width=100,
+            fg_color="gray",
+            hover_color="dark gray",
+            command=self.clear_filters
+        )
+        clear_button.pack(side="left")
+        
+        # Facet filters
+        facet_frame = ctk.CTkFrame(self.parent, fg_color="transparent")
+        facet_frame.pack(fill="x", padx=20, pady=(0, 10))
+        
+        for facet, all_label in self.FACET_MENUS:
+            menu = ctk.CTkOptionMenu(
+                facet_frame,
+                values=[all_label],
+                width=170,
+                dynamic_resizing=False,
+                command=lambda label, f=facet: self.select_facet(f, label)
+            )
+            menu.pack(side="left", padx=(0, 10))
+            self.facet_menus[facet] = menu
+        
+        self.results_label = ctk.CTkLabel(self.parent, text="", text_color="gray")
+        self.results_label.pack(anchor="w", padx=20)
+        
+        # Exercises list
+        self.exercises_frame = ctk.CTkScrollableFrame(self.parent)
+        self.exercises_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.image_loader = LazyImageLoader(self.exercises_frame)
+        self.exercise_cards = CardPool(
+            self.exercises_frame,
+            lambda parent: ExerciseCard(parent, self.image_loader, self.on_edit, self.on_delete),
+            empty_text="No exercises match your search."
+        )
+    
+    def search(self):
+        """Restrict the library to full-text search hits"""
+        search_term = self.search_entry.get().strip()
+        if search_term:
+            self.search_ids = [e.id for e in Exercise.search(search_term, limit=self.SEARCH_LIMIT)]
+        else:
+            self.search_ids = None
+        self.refresh()
+    
+    def select_facet(self, facet, label):
+        """Apply a facet menu selection"""
+        self.filters[facet] = self.facet_labels[facet].get(label)
+        self.refresh()
+    
+    def clear_filters(self):
+        """Reset search and facet filters"""
+        self.search_entry.delete(0, 'end')
+        self.search_ids = None
+        self.filters = {facet: None for facet, _ in self.FACET_MENUS}
+        self.refresh()
+    
+    def refresh(self):
+        """Recompute matches and facet counts, then redraw"""
+        catalog = ExerciseCatalog.instance()
+        total = catalog.count(self.filters, self.search_ids)
+        exercises = catalog.filter(self.filters, self.search_ids, limit=self.MAX_CARDS)
+        self.update_facet_menus(catalog.facet_counts(self.filters, self.search_ids))
+        
+        if len(exercises) < total:
+            self.results_label.configure(text=f"Showing {len(exercises)} of {total} exercises - refine your filters to see more")
+        else:
+            self.results_label.configure(text=f"{total} exercises")
+        
+        self.display_exercises(exercises)
+    
+    def update_facet_menus(self, counts):
+        """Relabel facet menus with live counts"""
+        for facet, all_label in self.FACET_MENUS:
+            labels = {all_label: None}
+            selected_label = all_label
+            for value, count in counts[facet].items():
+                label = f"{value} ({count})"
+                labels[label] = value
+                if value == self.filters[facet]:
+                    selected_label = label
+            
+            # Keep a selection visible even when it no longer matches anything
+            if self.filters[facet] is not None and selected_label == all_label:
+                selected_label = f"{self.filters[facet]} (0)"
+                labels[selected_label] = self.filters[facet]
+            
+            self.facet_labels[facet] = labels
+            self.facet_menus[facet].configure(values=list(labels))
+            self.facet_menus[facet].set(selected_label)
+    
+    def display_exercises(self, exercises):
+        """Display exercise cards in the results list"""
+        self.exercise_cards.show(exercises)
\ No newline at end of file
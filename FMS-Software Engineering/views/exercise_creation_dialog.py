@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from models.workout import Exercise
+from views.action_button import ActionButton
 
 class ExerciseCreationDialog:
     def __init__(self, parent):
@@ -109,7 +110,7 @@ class ExerciseCreationDialog:
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(20, 0))
         
-        cancel_button = ctk.CTkButton(
+        cancel_button = ActionButton(
             button_frame,
             text="Cancel",
             width=100,
@@ -117,7 +118,7 @@ class ExerciseCreationDialog:
         )
         cancel_button.pack(side="right", padx=(10, 0))
         
-        add_button = ctk.CTkButton(
+        add_button = ActionButton(
             button_frame,
             text="Add Exercise",
             width=120,
@@ -1,6 +1,9 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from models.workout import Exercise
+from services.exercise_catalog import ExerciseCatalog
+from services.name_search import NameSearch
+from views.autocomplete_entry import AutocompleteEntry
+from views.action_button import ActionButton
 
 class ExerciseSelectionDialog:
     def __init__(self, parent):
@@ -37,13 +40,15 @@ class ExerciseSelectionDialog:
         exercise_label.pack(anchor="w", padx=20, pady=(0, 5))
         
         # Get all exercises
-        exercises = Exercise.get_all()
-        exercise_names = [exercise.name for exercise in exercises]
+        self.catalog = ExerciseCatalog.instance()
+        exercise_names = self.catalog.names()
         
-        self.exercise_menu = ctk.CTkOptionMenu(
+        self.exercise_menu = AutocompleteEntry(
             main_frame,
-            values=exercise_names if exercise_names else ["No exercises available"],
-            width=500
+            search=self.search_exercises,
+            on_select=lambda exercise_id, name: self.on_exercise_change(name),
+            width=500,
+            placeholder_text="Start typing an exercise name..." if exercise_names else "No exercises available"
         )
         self.exercise_menu.pack(padx=20, pady=(0, 15))
         
@@ -121,7 +126,7 @@ class ExerciseSelectionDialog:
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", padx=20, pady=(10, 20))
         
-        cancel_button = ctk.CTkButton(
+        cancel_button = ActionButton(
             button_frame,
             text="Cancel",
             width=100,
@@ -129,7 +134,7 @@ class ExerciseSelectionDialog:
         )
         cancel_button.pack(side="right", padx=(10, 0))
         
-        add_button = ctk.CTkButton(
+        add_button = ActionButton(
             button_frame,
             text="Add Exercise",
             width=120,
@@ -137,9 +142,6 @@ class ExerciseSelectionDialog:
         )
         add_button.pack(side="right")
         
-        # Bind exercise selection change
-        self.exercise_menu.configure(command=self.on_exercise_change)
-        
         # Set default values
         self.sets_entry.insert(0, "3")
         self.reps_entry.insert(0, "10")
@@ -147,6 +149,7 @@ class ExerciseSelectionDialog:
         
         # Load initial exercise info
         if exercise_names:
+            self.exercise_menu.set(exercise_names[0])
             self.on_exercise_change(exercise_names[0])
     
     def center_dialog(self):
@@ -156,6 +159,10 @@ class ExerciseSelectionDialog:
         y = (self.dialog.winfo_screenheight() - self.dialog.winfo_height()) // 2
         self.dialog.geometry(f"+{x}+{y}")
     
+    def search_exercises(self, query, limit):
+        """Get fuzzy exercise name matches for the picker"""
+        return NameSearch.search_exercises(query, limit)
+    
     def on_exercise_change(self, selected_exercise):
         """Handle exercise selection change"""
         if selected_exercise == "No exercises available":
@@ -163,13 +170,7 @@ class ExerciseSelectionDialog:
             return
         
         # Find selected exercise
-        exercises = Exercise.get_all()
-        selected_exercise_obj = None
-        
-        for exercise in exercises:
-            if exercise.name == selected_exercise:
-                selected_exercise_obj = exercise
-                break
+        selected_exercise_obj = self.catalog.get_by_name(selected_exercise)
         
         if selected_exercise_obj:
             info_text = f"Exercise: {selected_exercise_obj.name}\n"
@@ -187,13 +188,13 @@ class ExerciseSelectionDialog:
     
     def add_exercise(self):
         """Add exercise to workout"""
-        if self.exercise_menu.get() == "No exercises available":
-            messagebox.showerror("Error", "No exercise selected")
+        if not self.catalog.get_by_name(self.exercise_menu.get().strip()):
+            messagebox.showerror("Error", "Please choose an exercise from the suggestions")
             return
         
         # Collect exercise data
         exercise_data = {
-            'name': self.exercise_menu.get(),
+            'name': self.exercise_menu.get().strip(),
             'sets': self.sets_entry.get().strip() or "3",
             'reps': self.reps_entry.get().strip() or "10",
             'weight': self.weight_entry.get().strip() or "",
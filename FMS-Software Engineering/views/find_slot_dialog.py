@@ -0,0 +1,183 @@
+import customtkinter as ctk
+from datetime import datetime
+from models.user import User
+from services.availability_service import AvailabilityService
+from views.action_button import ActionButton
+
+class FindSlotDialog:
+    # Date ranges offered, in days
+    RANGES = {"Next 7 days": 7, "Next 14 days": 14, "Next 4 weeks": 28}
+    # Most open slots listed at once
+    RESULT_LIMIT = 60
+    
+    def __init__(self, parent, member_id, on_booked=None):
+        self.parent = parent
+        self.member_id = member_id
+        self.on_booked = on_booked
+        self.result = None
+        
+        self.trainers = {trainer.id: trainer.full_name for trainer in User.get_all_by_type('trainer')}
+        
+        self.setup_dialog()
+        self.search()
+    
+    def setup_dialog(self):
+        """Setup find a slot dialog"""
+        self.dialog = ctk.CTkToplevel(self.parent)
+        self.dialog.title("Find a Slot")
+        self.dialog.geometry("600x600")
+        self.dialog.transient(self.parent)
+        self.dialog.grab_set()
+        
+        # Center the dialog
+        self.center_dialog()
+        
+        # Main container
+        main_frame = ctk.CTkFrame(self.dialog)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Title
+        title_label = ctk.CTkLabel(
+            main_frame,
+            text="Find a Slot",
+            font=ctk.CTkFont(size=20, weight="bold")
+        )
+        title_label.pack(pady=(10, 15))
+        
+        # Filters
+        filter_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        filter_frame.pack(fill="x", padx=20, pady=(0, 10))
+        
+        trainer_names = ["Any Trainer"] + [f"{name} (ID: {trainer_id})" for trainer_id, name in self.trainers.items()]
+        self.trainer_menu = ctk.CTkOptionMenu(
+            filter_frame,
+            values=trainer_names,
+            width=200,
+            command=lambda value: self.search()
+        )
+        self.trainer_menu.pack(side="left", padx=(0, 10))
+        
+        self.duration_menu = ctk.CTkOptionMenu(
+            filter_frame,
+            values=["30", "45", "60", "75", "90", "120"],
+            width=80,
+            command=lambda value: self.search()
+        )
+        self.duration_menu.set("60")
+        self.duration_menu.pack(side="left", padx=(0, 10))
+        
+        duration_label = ctk.CTkLabel(filter_frame, text="min")
+        duration_label.pack(side="left", padx=(0, 10))
+        
+        self.range_menu = ctk.CTkOptionMenu(
+            filter_frame,
+            values=list(self.RANGES),
+            width=140,
+            command=lambda value: self.search()
+        )
+        self.range_menu.pack(side="left")
+        
+        self.summary_label = ctk.CTkLabel(main_frame, text="", text_color="gray")
+        self.summary_label.pack(anchor="w", padx=20, pady=(0, 5))
+        
+        # Open slots
+        self.slots_frame = ctk.CTkScrollableFrame(main_frame)
+        self.slots_frame.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        
+        close_button = ActionButton(
+            main_frame,
+            text="Close",
+            width=100,
+            command=self.cancel
+        )
+        close_button.pack(side="right", padx=20, pady=(0, 10))
+    
+    def center_dialog(self):
+        """Center dialog on screen"""
+        self.dialog.update_idletasks()
+        x = (self.dialog.winfo_screenwidth() - self.dialog.winfo_width()) // 2
+        y = (self.dialog.winfo_screenheight() - self.dialog.winfo_height()) // 2
+        self.dialog.geometry(f"+{x}+{y}")
+    
+    def search(self):
+        """List the earliest open slots matching the filters"""
+        for widget in self.slots_frame.winfo_children():
+            widget.destroy()
+        
+        trainer_ids = None
+        if self.trainer_menu.get() != "Any Trainer":
+            trainer_ids = {int(self.trainer_menu.get().split("ID: ")[1].split(")")[0])}
+        duration = int(self.duration_menu.get())
+        
+        slots = AvailabilityService.instance().find_slots(
+            datetime.now().date(),
+            self.RANGES[self.range_menu.get()],
+            duration,
+            trainer_ids=trainer_ids,
+            member_id=self.member_id,
+            limit=self.RESULT_LIMIT
+        )
+        
+        if not slots:
+            self.summary_label.configure(text="")
+            no_slots_label = ctk.CTkLabel(
+                self.slots_frame,
+                text="No open slots in this range.",
+                font=ctk.CTkFont(size=14),
+                text_color="gray"
+            )
+            no_slots_label.pack(pady=30)
+            return
+        
+        if len(slots) >= self.RESULT_LIMIT:
+            self.summary_label.configure(text=f"Showing the earliest {len(slots)} open slots")
+        else:
+            self.summary_label.configure(text=f"{len(slots)} open slots")
+        
+        current_day = None
+        for start_time, trainer_id in slots:
+            # Day heading
+            if start_time.date() != current_day:
+                current_day = start_time.date()
+                day_label = ctk.CTkLabel(
+                    self.slots_frame,
+                    text=start_time.strftime('%A, %B %d'),
+                    font=ctk.CTkFont(size=14, weight="bold")
+                )
+                day_label.pack(anchor="w", padx=10, pady=(10, 2))
+            
+            slot_row = ctk.CTkFrame(self.slots_frame)
+            slot_row.pack(fill="x", padx=10, pady=2)
+            
+            slot_label = ctk.CTkLabel(
+                slot_row,
+                text=f"{start_time.strftime('%I:%M %p')}  •  {self.trainers.get(trainer_id, 'Trainer')}"
+            )
+            slot_label.pack(side="left", padx=15, pady=5)
+            
+            book_button = ActionButton(
+                slot_row,
+                text="Book",
+                width=70,
+                command=lambda t=trainer_id, s=start_time: self.book_slot(t, s, duration)
+            )
+            book_button.pack(side="right", padx=10, pady=5)
+    
+    def book_slot(self, trainer_id, start_time, duration):
+        """Open the booking dialog prefilled with a slot"""
+        from views.book_session_dialog import BookSessionDialog
+        self.result = True
+        self.dialog.destroy()
+        BookSessionDialog(
+            self.parent,
+            self.member_id,
+            trainer_id=trainer_id,
+            start_time=start_time,
+            duration=duration,
+            on_booked=self.on_booked
+        )
+    
+    def cancel(self):
+        """Close the dialog"""
+        self.result = False
+        self.dialog.destroy()
\ No newline at end of file
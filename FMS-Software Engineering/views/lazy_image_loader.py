@@ -0,0 +1,96 @@
+import tkinter
+from config.settings import AppSettings
+from services.image_service import ImageService
+
+class LazyImageLoader:
+    """Fill thumbnail labels in a scrollable frame once they scroll into view"""
+    
+    # Pixels beyond the visible area that still count as visible
+    PRELOAD_MARGIN = 200
+    CHECK_DELAY_MS = 50
+    
+    def __init__(self, scrollable_frame, size=None):
+        self.frame = scrollable_frame
+        self.size = size or AppSettings.THUMBNAIL_SIZE
+        self.pending = []
+        self.assigned = {}  # label -> image path it should show; labels are reused by card pools
+        self.check_scheduled = None
+        
+        self.scroll_command = None
+        self.canvas = self.find_canvas(scrollable_frame)
+        if self.canvas is not None:
+            # CTkScrollableFrame has no scroll event, so chain onto the canvas's scroll command,
+            # which keeps its scrollbar in step
+            self.scroll_command = str(self.canvas.cget("yscrollcommand"))
+            self.canvas.configure(yscrollcommand=self.on_scroll)
+    
+    @staticmethod
+    def find_canvas(scrollable_frame):
+        """Get the canvas a scrollable frame scrolls in, or None if customtkinter lays it out differently"""
+        # The frame is a window item on the canvas, so the canvas is its Tk master
+        canvas = scrollable_frame.master
+        return canvas if isinstance(canvas, tkinter.Canvas) else None
+    
+    def on_scroll(self, first, last):
+        if self.scroll_command:
+            self.canvas.tk.eval(f"{self.scroll_command} {first} {last}")
+        self.schedule_check()
+    
+    def add(self, label, image_path):
+        """Register a label to receive the thumbnail of an image"""
+        previous_path = self.assigned.get(label)
+        if previous_path == image_path:
+            return
+        if previous_path is not None:
+            # A recycled label: cover the old thumbnail (CTkLabel.configure can't unset an image)
+            self.pending = [(l, path) for l, path in self.pending if l is not label]
+            label.configure(image=ImageService.instance().blank(self.size))
+        self.assigned[label] = image_path
+        self.pending.append((label, image_path))
+        self.schedule_check()
+    
+    def clear(self):
+        """Forget labels from a previous render"""
+        self.pending = []
+        self.assigned = {}
+    
+    def schedule_check(self):
+        if self.check_scheduled is None:
+            self.check_scheduled = self.frame.after(self.CHECK_DELAY_MS, self.check_visible)
+    
+    def check_visible(self):
+        """Request thumbnails for labels inside the visible area"""
+        self.check_scheduled = None
+        # Without the canvas there are no scroll updates; measure against the window and keep polling
+        viewport = self.canvas if self.canvas is not None else self.frame.winfo_toplevel()
+        if not viewport.winfo_exists() or not viewport.winfo_ismapped():
+            return
+        
+        view_top = viewport.winfo_rooty() - self.PRELOAD_MARGIN
+        view_bottom = viewport.winfo_rooty() + viewport.winfo_height() + self.PRELOAD_MARGIN
+        
+        still_pending = []
+        for label, image_path in self.pending:
+            if not label.winfo_exists():
+                continue
+            if not label.winfo_ismapped():
+                still_pending.append((label, image_path))
+                continue
+            label_top = label.winfo_rooty()
+            if label_top + label.winfo_height() >= view_top and label_top <= view_bottom:
+                ImageService.instance().request(
+                    label,
+                    image_path,
+                    lambda image, l=label, path=image_path: self.show_image(l, image, path),
+                    self.size
+                )
+            else:
+                still_pending.append((label, image_path))
+        self.pending = still_pending
+        if still_pending and self.canvas is None:
+            self.schedule_check()
+    
+    def show_image(self, label, image, image_path):
+        # The label may have been given another image while this one loaded
+        if image is not None and label.winfo_exists() and self.assigned.get(label) == image_path:
+            label.configure(image=image, text="")
\ No newline at end of file
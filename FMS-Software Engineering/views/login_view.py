@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from controllers.auth_controller import AuthController
+from views.action_button import ActionButton
 
 class LoginView:
     def __init__(self, parent, on_success_callback):
@@ -67,7 +68,7 @@ class LoginView:
         self.password_entry.pack(padx=40, pady=(0, 20))
         
         # Login button
-        self.login_button = ctk.CTkButton(
+        self.login_button = ActionButton(
             self.login_container,
             text="LOGIN",
             width=320,
@@ -88,7 +89,7 @@ class LoginView:
         )
         self.register_label.pack(side="left")
         
-        self.register_button = ctk.CTkButton(
+        self.register_button = ActionButton(
             self.register_frame,
             text="Sign Up",
             width=80,
@@ -1,11 +1,26 @@
+import os
 import customtkinter as ctk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import tkinter as tk
 from models.user import User, MemberProfile
 from models.workout import Workout
-from models.session import Session
+from models.session import Session, ClassOccurrence
+from models.enrollment import ClassEnrollment, EnrollmentError
 from models.notification import Notification
+from models.progress import ProgressRecord
 from services.pdf_service import PDFService
+from services.availability_service import AvailabilityService
+from services.change_monitor import ChangeMonitor
+from services.session_calendar import SessionCalendar
+from services.task_runner import TaskRunner
+from views.card_pool import CardPool, repack
+from views.cards import SessionCard, NotificationCard
+from views.exercise_browser import ExerciseBrowser
+from views.progress_history import ProgressHistory
+from views.section_cache import SectionCache, load_async
+from views.session_calendar_view import SessionCalendarView
+from views.action_button import ActionButton
+from services.image_service import ImageService
 from datetime import datetime, timedelta
 
 class MemberDashboard:
@@ -15,6 +30,7 @@ class MemberDashboard:
         self.logout_callback = logout_callback
         self.user = User.get_by_id(user_data['id'])
         self.member_profile = MemberProfile.get_by_user_id(user_data['id'])
+        self.section_task = None
         
         self.setup_ui()
         self.load_dashboard_data()
@@ -38,9 +54,13 @@ class MemberDashboard:
         # Content area
         self.content_frame = ctk.CTkFrame(self.main_frame)
         self.content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        self.sections = SectionCache(self.content_frame, view="member")
         
         # Show dashboard by default
         self.show_dashboard()
+        
+        # Keep the open section current with changes made from other terminals
+        self.setup_change_monitor()
     
     def setup_header(self):
         """Setup header with user info and notifications"""
@@ -61,19 +81,18 @@ class MemberDashboard:
         button_frame.pack(side="right", padx=20, pady=20)
         
         # Notifications button
-        self.notifications_count = len(Notification.get_by_user_id(self.user.id, unread_only=True))
-        notif_text = f"Notifications ({self.notifications_count})" if self.notifications_count > 0 else "Notifications"
-        
-        self.notifications_button = ctk.CTkButton(
+        self.notifications_count = None
+        self.notifications_button = ActionButton(
             button_frame,
-            text=notif_text,
+            text="Notifications",
             width=120,
             command=self.show_notifications
         )
         self.notifications_button.pack(side="left", padx=(0, 10))
+        self.refresh_notification_badge()
         
         # Theme toggle
-        self.theme_button = ctk.CTkButton(
+        self.theme_button = ActionButton(
             button_frame,
             text="🌙",
             width=40,
@@ -82,7 +101,7 @@ class MemberDashboard:
         self.theme_button.pack(side="left", padx=(0, 10))
         
         # Logout button
-        logout_button = ctk.CTkButton(
+        logout_button = ActionButton(
             button_frame,
             text="Logout",
             width=80,
@@ -103,6 +122,8 @@ class MemberDashboard:
             ("🏠 Dashboard", self.show_dashboard),
             ("💪 My Workouts", self.show_workouts),
             ("📅 Sessions", self.show_sessions),
+            ("📆 Calendar", self.show_calendar),
+            ("🧘 Classes", self.show_classes),
             ("📊 Progress", self.show_progress),
             ("👤 Profile", self.show_profile),
             ("🏋️ Exercise Library", self.show_exercises),
@@ -111,7 +132,7 @@ class MemberDashboard:
         ]
         
         for text, command in nav_buttons:
-            button = ctk.CTkButton(
+            button = ActionButton(
                 sidebar_frame,
                 text=text,
                 width=180,
@@ -121,37 +142,61 @@ class MemberDashboard:
             )
             button.pack(padx=10, pady=5)
     
-    def clear_content(self):
-        """Clear content frame"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def clear_content(self, section=None):
+        """Clear content frame before showing a section"""
+        # Results still loading for the previous section are no longer wanted
+        if self.section_task is not None:
+            self.section_task.cancel()
+            self.section_task = None
+        
+        # Cached sections are only hidden; anything else is destroyed
+        self.sections.clear(section)
     
     def show_dashboard(self):
         """Show main dashboard with overview"""
-        self.clear_content()
-        
+        self.clear_content('dashboard')
+        self.sections.show('dashboard', self.build_dashboard)
+    
+    def build_dashboard(self, frame):
+        """Build the overview section"""
         # Title
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Dashboard Overview",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=(20, 30))
         
-        # Stats cards
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        stats_frame.pack(fill="x", padx=20, pady=(0, 30))
-        
-        # Quick stats
+        overview_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        overview_frame.pack(fill="both", expand=True)
+        self.sections.bind(
+            overview_frame,
+            self.load_overview,
+            lambda overview: self.show_overview(overview_frame, overview),
+            key=('member_overview', self.user.id)
+        )
+    
+    def load_overview(self):
+        """Query the overview figures (worker thread)"""
         workouts_count = len(Workout.get_by_member_id(self.user.id))
         upcoming_sessions = len(Session.get_upcoming_sessions(self.user.id, 'member'))
+        recent_sessions = Session.get_by_member_id(self.user.id)[:3]
+        return workouts_count, upcoming_sessions, recent_sessions
+    
+    def show_overview(self, parent, overview):
+        """Build the overview stats and recent activity"""
+        workouts_count, upcoming_sessions, recent_sessions = overview
+        
+        # Stats cards
+        stats_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        stats_frame.pack(fill="x", padx=20, pady=(0, 30))
         
         self.create_stat_card(stats_frame, "Total Workouts", str(workouts_count), "💪").pack(side="left", padx=10, fill="x", expand=True)
         self.create_stat_card(stats_frame, "Upcoming Sessions", str(upcoming_sessions), "📅").pack(side="left", padx=10, fill="x", expand=True)
         self.create_stat_card(stats_frame, "Profile Complete", "85%", "👤").pack(side="left", padx=10, fill="x", expand=True)
         
         # Recent activity
-        activity_frame = ctk.CTkFrame(self.content_frame)
+        activity_frame = ctk.CTkFrame(parent)
         activity_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         activity_title = ctk.CTkLabel(
@@ -162,7 +207,6 @@ class MemberDashboard:
         activity_title.pack(pady=20)
         
         # Recent sessions
-        recent_sessions = Session.get_by_member_id(self.user.id)[:3]
         if recent_sessions:
             for session in recent_sessions:
                 session_frame = ctk.CTkFrame(activity_frame)
@@ -215,10 +259,13 @@ class MemberDashboard:
     
     def show_workouts(self):
         """Show member's workout plans"""
-        self.clear_content()
-        
+        self.clear_content('workouts')
+        self.sections.show('workouts', self.build_workouts)
+    
+    def build_workouts(self, frame):
+        """Build the workout plans section"""
         # Title and actions
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -228,7 +275,7 @@ class MemberDashboard:
         )
         title_label.pack(side="left")
         
-        export_button = ctk.CTkButton(
+        export_button = ActionButton(
             header_frame,
             text="📄 Export PDF",
             command=self.export_workouts_pdf
@@ -236,11 +283,18 @@ class MemberDashboard:
         export_button.pack(side="right")
         
         # Workouts list
-        workouts_frame = ctk.CTkScrollableFrame(self.content_frame)
+        workouts_frame = ctk.CTkScrollableFrame(frame)
         workouts_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        workouts = Workout.get_by_member_id(self.user.id)
-        
+        self.sections.bind(
+            workouts_frame,
+            lambda: Workout.get_by_member_id(self.user.id),
+            lambda workouts: self.show_workout_list(workouts_frame, workouts),
+            key=('member_workouts', self.user.id)
+        )
+    
+    def show_workout_list(self, workouts_frame, workouts):
+        """List workout plans"""
         if workouts:
             for workout in workouts:
                 workout_card = ctk.CTkFrame(workouts_frame)
@@ -293,10 +347,13 @@ class MemberDashboard:
     
     def show_sessions(self):
         """Show member's training sessions"""
-        self.clear_content()
-        
+        self.clear_content('sessions')
+        self.sections.show('sessions', self.build_sessions)
+    
+    def build_sessions(self, frame):
+        """Build the sessions section"""
         # Title and book session button
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -306,116 +363,247 @@ class MemberDashboard:
         )
         title_label.pack(side="left")
         
-        book_button = ctk.CTkButton(
+        book_button = ActionButton(
             header_frame,
             text="📅 Book Session",
             command=self.book_session
         )
         book_button.pack(side="right")
         
+        find_slot_button = ActionButton(
+            header_frame,
+            text="🔍 Find a Slot",
+            command=self.find_slot
+        )
+        find_slot_button.pack(side="right", padx=(0, 10))
+        
         # Sessions list
-        sessions_frame = ctk.CTkScrollableFrame(self.content_frame)
+        sessions_frame = ctk.CTkScrollableFrame(frame)
         sessions_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        sessions = Session.get_by_member_id(self.user.id)
+        # Upcoming sessions first, then the latest completed ones; their cards are reused across reloads
+        upcoming_frame = ctk.CTkFrame(sessions_frame, fg_color="transparent")
+        upcoming_label = ctk.CTkLabel(
+            upcoming_frame,
+            text="Upcoming Sessions",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        upcoming_label.pack(anchor="w", pady=(20, 10))
+        self.upcoming_cards = CardPool(upcoming_frame, self.new_session_card)
         
-        if sessions:
-            # Group by status
-            upcoming = [s for s in sessions if s.status == 'scheduled']
-            completed = [s for s in sessions if s.status == 'completed']
-            cancelled = [s for s in sessions if s.status == 'cancelled']
-            
-            # Show upcoming sessions first
-            if upcoming:
-                upcoming_label = ctk.CTkLabel(
-                    sessions_frame,
-                    text="Upcoming Sessions",
-                    font=ctk.CTkFont(size=18, weight="bold")
-                )
-                upcoming_label.pack(anchor="w", pady=(20, 10))
-                
-                for session in upcoming:
-                    self.create_session_card(sessions_frame, session)
-            
-            # Show completed sessions
-            if completed:
-                completed_label = ctk.CTkLabel(
-                    sessions_frame,
-                    text="Completed Sessions",
-                    font=ctk.CTkFont(size=18, weight="bold")
-                )
-                completed_label.pack(anchor="w", pady=(20, 10))
-                
-                for session in completed[:5]:  # Show last 5 completed
-                    self.create_session_card(sessions_frame, session)
-        else:
-            no_sessions_label = ctk.CTkLabel(
-                sessions_frame,
-                text="No training sessions yet. Book your first session!",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            )
-            no_sessions_label.pack(pady=50)
-    
-    def create_session_card(self, parent, session):
-        """Create a session card widget"""
-        card = ctk.CTkFrame(parent)
-        card.pack(fill="x", pady=5, padx=10)
+        completed_frame = ctk.CTkFrame(sessions_frame, fg_color="transparent")
+        completed_label = ctk.CTkLabel(
+            completed_frame,
+            text="Completed Sessions",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        completed_label.pack(anchor="w", pady=(20, 10))
+        self.completed_cards = CardPool(completed_frame, self.new_session_card)
         
-        # Session info
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.pack(fill="x", padx=20, pady=15)
+        self.no_sessions_label = ctk.CTkLabel(
+            sessions_frame,
+            text="No training sessions yet. Book your first session!",
+            font=ctk.CTkFont(size=16),
+            text_color="gray"
+        )
+        self.session_groups = [
+            (upcoming_frame, {"fill": "x"}),
+            (completed_frame, {"fill": "x"}),
+            (self.no_sessions_label, {"pady": 50})
+        ]
         
-        # Status indicator
-        status_colors = {
-            'scheduled': 'green',
-            'completed': 'blue',
-            'cancelled': 'red'
-        }
+        self.session_cards = {}
+        self.sections.bind(
+            sessions_frame,
+            lambda: Session.get_by_member_id(self.user.id),
+            self.show_session_list,
+            key=('member_sessions', self.user.id),
+            clear=False
+        )
+    
+    def show_session_list(self, sessions):
+        """List sessions grouped by status"""
+        # Group by status
+        upcoming = [s for s in sessions if s.status == 'scheduled']
+        completed = [s for s in sessions if s.status == 'completed']
+        
+        self.upcoming_cards.show(upcoming)
+        self.completed_cards.show(completed[:5])  # Show last 5 completed
+        
+        # Cards the change monitor patches in place
+        self.session_cards = {**self.upcoming_cards.cards, **self.completed_cards.cards}
+        
+        shown = []
+        if upcoming:
+            shown.append(self.upcoming_cards.parent)
+        if completed:
+            shown.append(self.completed_cards.parent)
+        if not sessions:
+            shown.append(self.no_sessions_label)
+        repack(self.session_groups, shown)
+    
+    def show_calendar(self):
+        """Show sessions on a month calendar"""
+        self.clear_content('calendar')
+        self.sections.show('calendar', self.build_calendar)
+    
+    def build_calendar(self, frame):
+        """Build the calendar section"""
+        title_label = ctk.CTkLabel(
+            frame,
+            text="Session Calendar",
+            font=ctk.CTkFont(size=24, weight="bold")
+        )
+        title_label.pack(anchor="w", padx=20, pady=20)
         
-        status_label = ctk.CTkLabel(
-            info_frame,
-            text=f"● {session.status.title()}",
-            text_color=status_colors.get(session.status, 'gray')
+        self.calendar_view = SessionCalendarView(frame, self.user.id, 'member', self.new_session_card)
+        self.sections.on_show(self.calendar_view.refresh)
+    
+    def new_session_card(self, parent):
+        """Create a reusable session card"""
+        return SessionCard(parent, on_cancel=self.cancel_session)
+    
+    def show_classes(self):
+        """Show the member's class enrollments and upcoming classes"""
+        self.clear_content('classes')
+        self.sections.show('classes', self.build_classes)
+    
+    def build_classes(self, frame):
+        """Build the classes section"""
+        title_label = ctk.CTkLabel(
+            frame,
+            text="Fitness Classes",
+            font=ctk.CTkFont(size=24, weight="bold")
         )
-        status_label.pack(side="left")
+        title_label.pack(anchor="w", padx=20, pady=20)
         
-        # Session type and date
-        session_info = f"{session.session_type or 'Training Session'}"
-        if session.session_date:
-            session_info += f" - {session.session_date}"
+        classes_frame = ctk.CTkScrollableFrame(frame)
+        classes_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        info_label = ctk.CTkLabel(
-            info_frame,
-            text=session_info,
-            font=ctk.CTkFont(size=14)
+        self.sections.bind(
+            classes_frame,
+            self.load_classes,
+            lambda classes: self.show_class_list(classes_frame, classes),
+            key=('member_classes', self.user.id)
         )
-        info_label.pack(side="left", padx=(20, 0))
+    
+    def load_classes(self):
+        """Query the member's enrollments, their waitlist places and the upcoming classes (worker thread)"""
+        enrollments = ClassEnrollment.get_by_member_id(self.user.id)
+        waitlist_positions = {enrollment.id: enrollment.waitlist_position() for enrollment in enrollments}
+        now = datetime.now()
+        occurrences = ClassOccurrence.between(now, now + timedelta(days=14))
+        return enrollments, waitlist_positions, occurrences
+    
+    def show_class_list(self, classes_frame, classes):
+        """List the member's classes and the upcoming ones"""
+        enrollments, waitlist_positions, occurrences = classes
+        enrolled_occurrences = {enrollment.occurrence_id: enrollment for enrollment in enrollments}
+        
+        # My classes
+        if enrollments:
+            my_classes_label = ctk.CTkLabel(
+                classes_frame,
+                text="My Classes",
+                font=ctk.CTkFont(size=18, weight="bold")
+            )
+            my_classes_label.pack(anchor="w", pady=(20, 10))
+            
+            for enrollment in enrollments:
+                card = ctk.CTkFrame(classes_frame)
+                card.pack(fill="x", pady=5, padx=10)
+                
+                info_frame = ctk.CTkFrame(card, fg_color="transparent")
+                info_frame.pack(fill="x", padx=20, pady=15)
+                
+                if enrollment.occurrence_status == 'cancelled':
+                    status_text, status_color = "● Class cancelled", "red"
+                elif enrollment.status == 'waitlisted':
+                    status_text, status_color = f"● Waitlist #{waitlist_positions[enrollment.id]}", "orange"
+                else:
+                    status_text, status_color = "● Enrolled", "green"
+                
+                status_label = ctk.CTkLabel(info_frame, text=status_text, text_color=status_color)
+                status_label.pack(side="left")
+                
+                info_label = ctk.CTkLabel(
+                    info_frame,
+                    text=f"{enrollment.class_name} - {enrollment.start_time.strftime('%a %b %d, %I:%M %p')}",
+                    font=ctk.CTkFont(size=14)
+                )
+                info_label.pack(side="left", padx=(20, 0))
+                
+                cancel_button = ActionButton(
+                    info_frame,
+                    text="Leave Waitlist" if enrollment.status == 'waitlisted' else "Cancel",
+                    width=110,
+                    fg_color="red",
+                    hover_color="dark red",
+                    command=lambda e=enrollment: self.cancel_enrollment(e)
+                )
+                cancel_button.pack(side="right")
         
-        # Price
-        if session.price:
-            price_label = ctk.CTkLabel(
-                info_frame,
-                text=f"${session.price:.2f}",
-                font=ctk.CTkFont(weight="bold")
+        # Upcoming classes
+        upcoming_label = ctk.CTkLabel(
+            classes_frame,
+            text="Upcoming Classes (next 2 weeks)",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        upcoming_label.pack(anchor="w", pady=(20, 10))
+        
+        if not occurrences:
+            no_classes_label = ctk.CTkLabel(
+                classes_frame,
+                text="No classes scheduled in the next two weeks.",
+                font=ctk.CTkFont(size=16),
+                text_color="gray"
             )
-            price_label.pack(side="right")
+            no_classes_label.pack(pady=30)
+            return
         
-        # Cancel button for upcoming sessions
-        if session.status == 'scheduled':
-            cancel_button = ctk.CTkButton(
+        for occurrence in occurrences:
+            card = ctk.CTkFrame(classes_frame)
+            card.pack(fill="x", pady=5, padx=10)
+            
+            info_frame = ctk.CTkFrame(card, fg_color="transparent")
+            info_frame.pack(fill="x", padx=20, pady=10)
+            
+            info_label = ctk.CTkLabel(
                 info_frame,
-                text="Cancel",
-                width=80,
-                fg_color="red",
-                hover_color="dark red",
-                command=lambda s=session: self.cancel_session(s)
+                text=f"{occurrence.class_name} - {occurrence.start_time.strftime('%a %b %d, %I:%M %p')}",
+                font=ctk.CTkFont(size=14)
             )
-            cancel_button.pack(side="right", padx=(0, 20))
+            info_label.pack(side="left")
+            
+            if occurrence.seats_left is None:
+                seats_text = "Open"
+            elif occurrence.seats_left > 0:
+                seats_text = f"{occurrence.seats_left} of {occurrence.capacity} seats left"
+            else:
+                seats_text = f"Full • {occurrence.waitlist_count} waiting"
+            
+            seats_label = ctk.CTkLabel(info_frame, text=seats_text, text_color="gray")
+            seats_label.pack(side="left", padx=(20, 0))
+            
+            if occurrence.id in enrolled_occurrences:
+                joined_label = ctk.CTkLabel(
+                    info_frame,
+                    text="Waitlisted" if enrolled_occurrences[occurrence.id].status == 'waitlisted' else "Enrolled",
+                    text_color="green"
+                )
+                joined_label.pack(side="right")
+            else:
+                enroll_button = ActionButton(
+                    info_frame,
+                    text="Join Waitlist" if occurrence.seats_left == 0 else "Enroll",
+                    width=110,
+                    command=lambda o=occurrence: self.enroll_in_class(o)
+                )
+                enroll_button.pack(side="right")
     
     def show_progress(self):
         """Show member's progress tracking"""
-        self.clear_content()
+        self.clear_content('progress')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -449,17 +637,45 @@ class MemberDashboard:
         self.progress_notes = ctk.CTkTextbox(form_inner, height=100)
         self.progress_notes.pack(padx=20, pady=(0, 20), fill="x")
         
+        # Progress photo
+        photo_frame = ctk.CTkFrame(form_inner, fg_color="transparent")
+        photo_frame.pack(fill="x", padx=20)
+        
+        self.progress_photo_path = None
+        photo_button = ActionButton(
+            photo_frame,
+            text="Attach Photo",
+            width=120,
+            fg_color="gray",
+            hover_color="dark gray",
+            command=self.choose_progress_photo
+        )
+        photo_button.pack(side="left")
+        
+        self.photo_label = ctk.CTkLabel(photo_frame, text="No photo attached", text_color="gray")
+        self.photo_label.pack(side="left", padx=(10, 0))
+        
         # Save button
-        save_button = ctk.CTkButton(
+        save_button = ActionButton(
             form_inner,
             text="Save Progress",
             command=self.save_progress
         )
         save_button.pack(pady=20)
+        
+        # Progress history
+        history_label = ctk.CTkLabel(
+            progress_frame,
+            text="Progress History",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        history_label.pack(anchor="w", padx=40, pady=(0, 10))
+        
+        self.progress_history = ProgressHistory(progress_frame, self.user.id, height=200)
     
     def show_profile(self):
         """Show member profile management"""
-        self.clear_content()
+        self.clear_content('profile')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -544,7 +760,7 @@ class MemberDashboard:
             self.profile_entries[field_name] = entry
         
         # Save button
-        save_button = ctk.CTkButton(
+        save_button = ActionButton(
             profile_frame,
             text="Save Profile",
             command=self.save_profile
@@ -553,7 +769,7 @@ class MemberDashboard:
     
     def show_exercises(self):
         """Show exercise library"""
-        self.clear_content()
+        self.clear_content('exercises')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -562,73 +778,12 @@ class MemberDashboard:
         )
         title_label.pack(pady=20)
         
-        # Search frame
-        search_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        search_frame.pack(fill="x", padx=20, pady=(0, 20))
-        
-        search_entry = ctk.CTkEntry(
-            search_frame,
-            placeholder_text="Search exercises...",
-            width=300
-        )
-        search_entry.pack(side="left", padx=(0, 10))
-        
-        search_button = ctk.CTkButton(
-            search_frame,
-            text="Search",
-            width=80
-        )
-        search_button.pack(side="left")
-        
-        # Exercises list
-        exercises_frame = ctk.CTkScrollableFrame(self.content_frame)
-        exercises_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-        
-        from models.workout import Exercise
-        exercises = Exercise.get_all()
-        
-        for exercise in exercises:
-            exercise_card = ctk.CTkFrame(exercises_frame)
-            exercise_card.pack(fill="x", pady=5, padx=10)
-            
-            # Exercise header
-            header_frame = ctk.CTkFrame(exercise_card, fg_color="transparent")
-            header_frame.pack(fill="x", padx=20, pady=15)
-            
-            exercise_name = ctk.CTkLabel(
-                header_frame,
-                text=exercise.name,
-                font=ctk.CTkFont(size=16, weight="bold")
-            )
-            exercise_name.pack(side="left")
-            
-            difficulty_label = ctk.CTkLabel(
-                header_frame,
-                text=exercise.difficulty_level or "Beginner",
-                text_color="gray"
-            )
-            difficulty_label.pack(side="right")
-            
-            # Exercise details
-            if exercise.muscle_groups:
-                muscle_label = ctk.CTkLabel(
-                    exercise_card,
-                    text=f"Target Muscles: {exercise.muscle_groups}",
-                    text_color="gray"
-                )
-                muscle_label.pack(anchor="w", padx=20)
-            
-            if exercise.equipment:
-                equipment_label = ctk.CTkLabel(
-                    exercise_card,
-                    text=f"Equipment: {exercise.equipment}",
-                    text_color="gray"
-                )
-                equipment_label.pack(anchor="w", padx=20, pady=(0, 15))
+        # Search, facet filters and results
+        self.exercise_browser = ExerciseBrowser(self.content_frame)
     
     def show_meals(self):
         """Show meal planning (placeholder)"""
-        self.clear_content()
+        self.clear_content('meals')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -648,76 +803,92 @@ class MemberDashboard:
     
     def show_notifications(self):
         """Show notifications"""
-        self.clear_content()
-        
+        self.clear_content('notifications')
+        self.sections.show('notifications', self.build_notifications)
+    
+    def build_notifications(self, frame):
+        """Build the notifications section"""
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Notifications",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=20)
         
-        # Mark all as read button
-        mark_read_button = ctk.CTkButton(
-            self.content_frame,
+        # Mark all as read and archive search
+        actions_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        actions_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        mark_read_button = ActionButton(
+            actions_frame,
             text="Mark All as Read",
             command=self.mark_all_notifications_read
         )
-        mark_read_button.pack(pady=(0, 20))
+        mark_read_button.pack(side="left")
+        
+        archive_entry = ctk.CTkEntry(actions_frame, placeholder_text="Search older notifications...", width=250)
+        archive_button = ActionButton(
+            actions_frame,
+            text="Search Archive",
+            width=120,
+            command=lambda: self.show_archived_notifications(archive_entry.get())
+        )
+        archive_button.pack(side="right")
+        archive_entry.pack(side="right", padx=(0, 10))
+        archive_entry.bind("<Return>", lambda event: self.show_archived_notifications(archive_entry.get()))
         
         # Notifications list
-        notifications_frame = ctk.CTkScrollableFrame(self.content_frame)
+        notifications_frame = ctk.CTkScrollableFrame(frame)
         notifications_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        notifications = Notification.get_by_user_id(self.user.id)
+        self.notification_cards = CardPool(notifications_frame, NotificationCard, empty_text="No notifications yet.")
+        self.sections.bind(
+            notifications_frame,
+            lambda: Notification.get_by_user_id(self.user.id),
+            self.notification_cards.show,
+            key=('notifications', self.user.id),
+            clear=False
+        )
+    
+    def show_archived_notifications(self, query):
+        """Show archived notifications matching a search"""
+        self.clear_content('archived_notifications')
         
-        if notifications:
-            for notification in notifications:
-                notif_card = ctk.CTkFrame(notifications_frame)
-                notif_card.pack(fill="x", pady=5, padx=10)
-                
-                # Notification header
-                header_frame = ctk.CTkFrame(notif_card, fg_color="transparent")
-                header_frame.pack(fill="x", padx=20, pady=15)
-                
-                title_text = notification.title
-                if not notification.is_read:
-                    title_text = "🔵 " + title_text
-                
-                notif_title = ctk.CTkLabel(
-                    header_frame,
-                    text=title_text,
-                    font=ctk.CTkFont(size=14, weight="bold")
-                )
-                notif_title.pack(side="left")
-                
-                notif_date = ctk.CTkLabel(
-                    header_frame,
-                    text=notification.created_at[:10] if notification.created_at else "",
-                    text_color="gray"
-                )
-                notif_date.pack(side="right")
-                
-                # Notification message
-                message_label = ctk.CTkLabel(
-                    notif_card,
-                    text=notification.message,
-                    wraplength=600,
-                    justify="left"
-                )
-                message_label.pack(anchor="w", padx=20, pady=(0, 15))
-        else:
-            no_notif_label = ctk.CTkLabel(
-                notifications_frame,
-                text="No notifications yet.",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            )
-            no_notif_label.pack(pady=50)
+        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=20)
+        
+        title_label = ctk.CTkLabel(
+            header_frame,
+            text="Archived Notifications",
+            font=ctk.CTkFont(size=24, weight="bold")
+        )
+        title_label.pack(side="left")
+        
+        back_button = ActionButton(
+            header_frame,
+            text="← Back",
+            width=80,
+            command=self.show_notifications
+        )
+        back_button.pack(side="right")
+        
+        results_frame = ctk.CTkScrollableFrame(self.content_frame)
+        results_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        self.section_task = load_async(
+            results_frame,
+            lambda: Notification.search_archive(self.user.id, query),
+            lambda notifications: self.show_archive_results(results_frame, notifications)
+        )
+    
+    def show_archive_results(self, results_frame, notifications):
+        """List archived notifications found by a search"""
+        archive_cards = CardPool(results_frame, NotificationCard, empty_text="No archived notifications found.")
+        archive_cards.show(notifications)
     
     def show_settings(self):
         """Show settings"""
-        self.clear_content()
+        self.clear_content('settings')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -750,7 +921,7 @@ class MemberDashboard:
         export_label = ctk.CTkLabel(export_frame, text="Data Export")
         export_label.pack(side="left")
         
-        export_button = ctk.CTkButton(
+        export_button = ActionButton(
             export_frame,
             text="Export My Data",
             command=self.export_user_data
@@ -774,10 +945,17 @@ class MemberDashboard:
     def book_session(self):
         """Book a new training session"""
         from views.book_session_dialog import BookSessionDialog
-        dialog = BookSessionDialog(self.parent, self.user.id)
-        if dialog.result:
-            self.show_sessions()  # Refresh sessions view
-            messagebox.showinfo("Success", "Session booked successfully!")
+        BookSessionDialog(self.parent, self.user.id, on_booked=self.on_session_booked)
+    
+    def find_slot(self):
+        """Browse open session slots across all trainers"""
+        from views.find_slot_dialog import FindSlotDialog
+        FindSlotDialog(self.parent, self.user.id, on_booked=self.on_session_booked)
+    
+    def on_session_booked(self):
+        """Refresh sessions after a booking"""
+        self.show_sessions()  # Refresh sessions view
+        messagebox.showinfo("Success", "Session booked successfully!")
     
     def cancel_session(self, session):
         """Cancel a training session"""
@@ -786,6 +964,37 @@ class MemberDashboard:
             self.show_sessions()  # Refresh sessions view
             messagebox.showinfo("Success", "Session cancelled successfully!")
     
+    def enroll_in_class(self, occurrence):
+        """Enroll in a class occurrence, joining the waitlist if it filled up"""
+        try:
+            enrollment = ClassEnrollment.enroll(occurrence.id, self.user.id)
+        except EnrollmentError as e:
+            messagebox.showerror("Enrollment Closed", str(e))
+            self.show_classes()
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to enroll: {str(e)}")
+            return
+        
+        self.show_classes()  # Refresh classes view
+        if enrollment.status == 'waitlisted':
+            messagebox.showinfo(
+                "Waitlisted",
+                f"{occurrence.class_name} is full. You are #{enrollment.waitlist_position()} on the waitlist."
+            )
+        else:
+            messagebox.showinfo("Success", f"You are enrolled in {occurrence.class_name}!")
+    
+    def cancel_enrollment(self, enrollment):
+        """Cancel a class enrollment or leave its waitlist"""
+        if not messagebox.askyesno("Confirm", f"Are you sure you want to cancel {enrollment.class_name}?"):
+            return
+        
+        # The member moved up from the waitlist, if any, is notified by cancel()
+        enrollment.cancel()
+        self.show_classes()  # Refresh classes view
+        messagebox.showinfo("Success", "Enrollment cancelled successfully!")
+    
     def save_progress(self):
         """Save progress record"""
         weight = self.weight_entry.get().strip()
@@ -797,13 +1006,41 @@ class MemberDashboard:
         
         try:
             weight_float = float(weight)
-            # Here you would save to progress_records table
-            # For now, just show success message
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a valid weight")
+            return
+        
+        try:
+            photo_path = None
+            if self.progress_photo_path:
+                photo_path = ImageService.store_image(self.progress_photo_path, f"progress_{self.user.id}")
+            
+            record = ProgressRecord(
+                member_id=self.user.id,
+                weight=weight_float,
+                notes=notes,
+                photo_path=photo_path
+            )
+            record.save()
+            
             messagebox.showinfo("Success", "Progress recorded successfully!")
             self.weight_entry.delete(0, 'end')
             self.progress_notes.delete("1.0", 'end')
-        except ValueError:
-            messagebox.showerror("Error", "Please enter a valid weight")
+            self.progress_photo_path = None
+            self.photo_label.configure(text="No photo attached")
+            self.progress_history.refresh()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save progress: {str(e)}")
+    
+    def choose_progress_photo(self):
+        """Pick a photo to attach to the next progress record"""
+        photo_path = filedialog.askopenfilename(
+            title="Choose Progress Photo",
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.bmp *.webp"), ("All files", "*.*")]
+        )
+        if photo_path:
+            self.progress_photo_path = photo_path
+            self.photo_label.configure(text=os.path.basename(photo_path))
     
     def save_profile(self):
         """Save profile changes"""
@@ -833,17 +1070,25 @@ class MemberDashboard:
     
     def export_workouts_pdf(self):
         """Export workouts to PDF"""
-        workouts = Workout.get_by_member_id(self.user.id)
-        if not workouts:
-            messagebox.showinfo("Info", "No workouts to export")
-            return
-        
-        try:
-            pdf_service = PDFService()
-            filename = pdf_service.export_workouts_pdf(self.user, workouts)
-            messagebox.showinfo("Success", f"Workouts exported to {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export PDF: {str(e)}")
+        def build_pdf():
+            workouts = Workout.get_by_member_id(self.user.id)
+            if not workouts:
+                return None
+            return PDFService().export_workouts_pdf(self.user, workouts)
+        
+        def show_result(filename):
+            if filename is None:
+                messagebox.showinfo("Info", "No workouts to export")
+            else:
+                messagebox.showinfo("Success", f"Workouts exported to {filename}")
+        
+        TaskRunner.instance().submit(
+            self.main_frame,
+            build_pdf,
+            on_done=show_result,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to export PDF: {str(e)}"),
+            key=('workouts_pdf', self.user.id)
+        )
     
     def export_user_data(self):
         """Export all user data"""
@@ -856,10 +1101,58 @@ class MemberDashboard:
     def mark_all_notifications_read(self):
         """Mark all notifications as read"""
         Notification.mark_all_as_read(self.user.id)
-        self.notifications_count = 0
-        self.notifications_button.configure(text="Notifications")
+        self.update_notification_badge(0)
         self.show_notifications()  # Refresh view
     
+    def refresh_notification_badge(self):
+        """Update the unread count on the notifications button"""
+        self.update_notification_badge(Notification.unread_count(self.user.id))
+    
+    def update_notification_badge(self, count):
+        # Only touch the widget when the count actually changed
+        if count == self.notifications_count:
+            return
+        self.notifications_count = count
+        notif_text = f"Notifications ({count})" if count > 0 else "Notifications"
+        self.notifications_button.configure(text=notif_text)
+    
+    def setup_change_monitor(self):
+        """Watch for sessions and notifications written by other terminals"""
+        self.change_monitor = ChangeMonitor(self.parent)
+        self.change_monitor.watch('sessions', 'change_seq', 'member_id', self.user.id, self.on_sessions_changed)
+        self.change_monitor.watch('notifications', 'id', 'user_id', self.user.id, self.on_notifications_added)
+        # Also catches notifications read elsewhere; the badge is one key lookup
+        self.change_monitor.on_change(self.refresh_notification_badge)
+        self.change_monitor.start()
+    
+    def on_sessions_changed(self, rows):
+        """Patch the open section with sessions booked or changed since the last check"""
+        sessions = [Session.from_row(row) for row in rows]
+        for session in sessions:
+            AvailabilityService.invalidate(session.session_date)
+        SessionCalendar.invalidate()
+        
+        # Hidden sections reload when they are next shown
+        section = self.sections.current
+        if section == 'calendar':
+            self.calendar_view.refresh()
+        elif section == 'sessions' and self.session_cards and all(session.id in self.session_cards for session in sessions):
+            # Status or time changes of listed sessions: reconfigure just those cards
+            for session in sessions:
+                self.session_cards[session.id].show(session)
+        elif section in ('dashboard', 'sessions'):
+            # New sessions move the lists and counts around, so reload the section
+            self.sections.refresh()
+    
+    def on_notifications_added(self, rows):
+        """Put new notifications at the top of the open notifications list"""
+        if self.sections.current != 'notifications':
+            return
+        
+        # Rows come oldest first; the cards already listed are kept as they are
+        added = [Notification.from_row(row) for row in reversed(rows)]
+        self.notification_cards.show(added + self.notification_cards.items())
+    
     def load_dashboard_data(self):
         """Load initial dashboard data"""
         # This would load any additional data needed for the dashboard
@@ -867,4 +1160,5 @@ class MemberDashboard:
     
     def destroy(self):
         """Clean up the dashboard"""
+        self.change_monitor.stop()
         self.main_frame.destroy()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import customtkinter as ctk
+from models.progress import ProgressRecord
+from views.lazy_image_loader import LazyImageLoader
+from views.section_cache import load_async
+
+class ProgressHistory:
+    def __init__(self, parent, member_id, height=300):
+        self.parent = parent
+        self.member_id = member_id
+        
+        self.records_frame = ctk.CTkScrollableFrame(parent, height=height)
+        self.records_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.image_loader = LazyImageLoader(self.records_frame)
+        self.task = None
+        
+        self.refresh()
+    
+    def refresh(self):
+        """Reload the member's progress records on a worker thread"""
+        if self.task is not None:
+            self.task.cancel()
+        for widget in self.records_frame.winfo_children():
+            widget.destroy()
+        self.image_loader.clear()
+        
+        self.task = load_async(
+            self.records_frame,
+            lambda: ProgressRecord.get_by_member_id(self.member_id),
+            self.show_records
+        )
+    
+    def show_records(self, records):
+        """Display the member's progress records, newest first"""
+        self.task = None
+        if not records:
+            no_records_label = ctk.CTkLabel(
+                self.records_frame,
+                text="No progress recorded yet.",
+                font=ctk.CTkFont(size=14),
+                text_color="gray"
+            )
+            no_records_label.pack(pady=30)
+            return
+        
+        for record in records:
+            record_card = ctk.CTkFrame(self.records_frame)
+            record_card.pack(fill="x", pady=5, padx=10)
+            
+            # Photo is filled in once the card scrolls into view
+            if record.photo_path:
+                photo_label = ctk.CTkLabel(record_card, text="", width=64, height=64)
+                photo_label.pack(side="left", padx=(15, 0), pady=10)
+                self.image_loader.add(photo_label, record.photo_path)
+            
+            info_frame = ctk.CTkFrame(record_card, fg_color="transparent")
+            info_frame.pack(side="left", fill="x", expand=True, padx=15, pady=10)
+            
+            date_label = ctk.CTkLabel(
+                info_frame,
+                text=record.record_date,
+                font=ctk.CTkFont(size=14, weight="bold")
+            )
+            date_label.pack(anchor="w")
+            
+            if record.weight is not None:
+                weight_label = ctk.CTkLabel(info_frame, text=f"Weight: {record.weight:g} lbs", text_color="gray")
+                weight_label.pack(anchor="w")
+            
+            if record.notes:
+                notes_label = ctk.CTkLabel(
+                    info_frame,
+                    text=record.notes,
+                    text_color="gray",
+                    wraplength=500,
+                    justify="left"
+                )
+                notes_label.pack(anchor="w")
\ No newline at end of file
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from controllers.auth_controller import AuthController
+from views.action_button import ActionButton
 
 class RegisterDialog:
     def __init__(self, parent):
@@ -85,7 +86,7 @@ class RegisterDialog:
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         button_frame.pack(fill="x", pady=(20, 0))
         
-        cancel_button = ctk.CTkButton(
+        cancel_button = ActionButton(
             button_frame,
             text="Cancel",
             width=100,
@@ -93,7 +94,7 @@ class RegisterDialog:
         )
         cancel_button.pack(side="right", padx=(10, 0))
         
-        register_button = ctk.CTkButton(
+        register_button = ActionButton(
             button_frame,
             text="Register",
             width=100,
@@ -0,0 +1,164 @@
+import customtkinter as ctk
+from collections import OrderedDict
+from config.settings import AppSettings
+from services.task_runner import TaskRunner
+from services.ui_watchdog import UIWatchdog
+from services.metrics import CACHE_REQUESTS
+
+def snapshot(value):
+    """Reduce loaded data (models, rows, lists) to plain values that compare equal when nothing changed"""
+    if isinstance(value, (list, tuple)):
+        return tuple(snapshot(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, snapshot(item)) for key, item in value.items())
+    if hasattr(value, '__dict__'):
+        # Models carry their own DatabaseManager, which isn't part of the data
+        attributes = {key: item for key, item in vars(value).items() if key != 'db'}
+        return (type(value).__name__, snapshot(attributes))
+    if hasattr(value, 'keys'):
+        # sqlite3.Row
+        return tuple(value)
+    return value
+
+def load_async(parent, loader, render, key=None):
+    """Run loader on a worker thread behind a placeholder in parent, then render(result) on the Tk thread"""
+    placeholder = ctk.CTkLabel(parent, text="Loading...", text_color="gray")
+    placeholder.pack(pady=50)
+    
+    def show(result):
+        placeholder.destroy()
+        render(result)
+    
+    def show_error(error):
+        placeholder.configure(text=f"Failed to load: {error}", text_color="red")
+    
+    # The callbacks are tied to the placeholder, so they are skipped once the section is left
+    return TaskRunner.instance().submit(placeholder, loader, on_done=show, on_error=show_error, key=key)
+
+class Binding:
+    """Data loaded into part of a section; reloaded on each show, redrawn only when it changed"""
+    
+    def __init__(self, parent, loader, render, key, clear):
+        self.parent = parent
+        self.loader = loader
+        self.render = render
+        self.key = key
+        self.clear = clear  # False when render updates parent's widgets itself (card pools)
+        self.signature = None
+        self.loaded = False
+        self.task = None
+        
+        self.notice = ctk.CTkLabel(parent, text="Loading...", text_color="gray")
+        self.notice.pack(pady=50)
+    
+    def load(self):
+        # Keep showing the current data until the reload arrives
+        if self.task is not None:
+            self.task.cancel()
+        self.task = TaskRunner.instance().submit(
+            self.parent,
+            self.fetch,
+            on_done=self.show,
+            on_error=self.show_error,
+            key=('section', self.key) if self.key is not None else None
+        )
+    
+    def fetch(self):
+        # Worker thread: compare on plain values so the Tk thread only does a tuple comparison
+        result = self.loader()
+        return result, snapshot(result)
+    
+    def show(self, loaded):
+        self.task = None
+        result, signature = loaded
+        if self.loaded and signature == self.signature:
+            return
+        self.loaded = True
+        self.signature = signature
+        
+        self.clear_parent()
+        self.render(result)
+    
+    def show_error(self, error):
+        self.task = None
+        self.loaded = False
+        self.clear_parent()
+        self.notice = ctk.CTkLabel(self.parent, text=f"Failed to load: {error}", text_color="red")
+        self.notice.pack(pady=50)
+    
+    def clear_parent(self):
+        if self.notice is not None:
+            self.notice.destroy()
+            self.notice = None
+        if self.clear:
+            for widget in self.parent.winfo_children():
+                widget.destroy()
+
+class Section:
+    def __init__(self, frame):
+        self.frame = frame
+        self.show_callbacks = []
+
+class SectionCache:
+    """Keeps built dashboard sections in hidden frames so navigating back doesn't rebuild their widgets"""
+    
+    def __init__(self, parent, max_sections=None, view=None):
+        self.parent = parent
+        self.view = view  # Prefix of the section names reported to the UI watchdog
+        self.max_sections = max_sections or AppSettings.SECTION_CACHE_SIZE
+        self.sections = OrderedDict()  # name -> Section, least recently shown first
+        self.current = None
+    
+    def clear(self, name=None):
+        """Hide the shown section and destroy anything built outside the cache, before showing section name"""
+        if self.current is not None:
+            self.sections[self.current].frame.pack_forget()
+            self.current = None
+        
+        cached_frames = [section.frame for section in self.sections.values()]
+        for widget in self.parent.winfo_children():
+            if widget not in cached_frames:
+                widget.destroy()
+        
+        if name is not None:
+            # Every section switch passes here, cached or not, so stalls are charged to the right one
+            UIWatchdog.instance().set_view(f"{self.view}/{name}" if self.view else name)
+    
+    def show(self, name, build):
+        """Show a section, calling build(frame) the first time and re-binding its data after that"""
+        self.clear(name)
+        self.current = name
+        section = self.sections.get(name)
+        CACHE_REQUESTS.inc(cache="sections", result="hit" if section is not None else "miss")
+        if section is not None:
+            self.sections.move_to_end(name)
+            section.frame.pack(fill="both", expand=True)
+            self.refresh()
+            return
+        
+        section = Section(ctk.CTkFrame(self.parent, fg_color="transparent"))
+        self.sections[name] = section
+        section.frame.pack(fill="both", expand=True)
+        build(section.frame)
+        
+        # The section just shown is the most recent, so it is never the one dropped
+        while len(self.sections) > self.max_sections:
+            _, evicted = self.sections.popitem(last=False)
+            evicted.frame.destroy()
+    
+    def refresh(self):
+        """Reload the shown section's data, redrawing only what changed"""
+        if self.current is None:
+            return
+        for callback in list(self.sections[self.current].show_callbacks):
+            callback()
+    
+    def on_show(self, callback):
+        """Call callback() whenever the section being built is shown again or refreshed"""
+        self.sections[self.current].show_callbacks.append(callback)
+    
+    def bind(self, parent, loader, render, key=None, clear=True):
+        """Fill parent with render(loader()), loading on a worker behind a placeholder"""
+        binding = Binding(parent, loader, render, key, clear)
+        self.on_show(binding.load)
+        binding.load()
\ No newline at end of file
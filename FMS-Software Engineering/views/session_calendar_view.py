@@ -0,0 +1,126 @@
+import calendar
+import customtkinter as ctk
+from datetime import date, datetime, timedelta
+from models.session import Session
+from services.session_calendar import SessionCalendar, shift_month
+from views.card_pool import CardPool
+from views.action_button import ActionButton
+
+class SessionCalendarView:
+    WEEKS_SHOWN = 6
+    
+    def __init__(self, parent, user_id, role, new_session_card):
+        self.parent = parent
+        self.user_id = user_id
+        self.role = role  # 'trainer' or 'member'
+        self.new_session_card = new_session_card
+        self.calendar = SessionCalendar.instance()
+        
+        today = date.today()
+        self.year, self.month = today.year, today.month
+        self.selected_day = today
+        
+        self.setup_ui()
+        self.show_month()
+        self.open_day(today)
+    
+    def setup_ui(self):
+        """Build the month grid once; paging only relabels its cells"""
+        self.frame = ctk.CTkFrame(self.parent, fg_color="transparent")
+        self.frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        # Month navigation
+        nav_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        nav_frame.pack(fill="x", pady=(0, 10))
+        
+        prev_button = ActionButton(nav_frame, text="◀", width=40, command=lambda: self.page(-1))
+        prev_button.pack(side="left")
+        
+        self.month_label = ctk.CTkLabel(nav_frame, text="", width=200, font=ctk.CTkFont(size=18, weight="bold"))
+        self.month_label.pack(side="left", padx=10)
+        
+        next_button = ActionButton(nav_frame, text="▶", width=40, command=lambda: self.page(1))
+        next_button.pack(side="left")
+        
+        today_button = ActionButton(nav_frame, text="Today", width=80, command=self.go_to_today)
+        today_button.pack(side="right")
+        
+        # Day grid
+        grid_frame = ctk.CTkFrame(self.frame)
+        grid_frame.pack(fill="x")
+        
+        for column, day_name in enumerate(calendar.day_abbr):
+            grid_frame.grid_columnconfigure(column, weight=1, uniform="day")
+            day_label = ctk.CTkLabel(grid_frame, text=day_name, text_color="gray")
+            day_label.grid(row=0, column=column, pady=(5, 0))
+        
+        self.day_buttons = []
+        for week in range(self.WEEKS_SHOWN):
+            for column in range(7):
+                day_button = ActionButton(grid_frame, text="", height=48)
+                day_button.grid(row=week + 1, column=column, padx=2, pady=2, sticky="ew")
+                self.day_buttons.append(day_button)
+        
+        # Sessions of the opened day
+        self.day_title = ctk.CTkLabel(self.frame, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.day_title.pack(anchor="w", pady=(15, 5))
+        
+        self.day_frame = ctk.CTkScrollableFrame(self.frame, height=220)
+        self.day_frame.pack(fill="both", expand=True)
+        self.day_cards = CardPool(self.day_frame, self.new_session_card, empty_text="No sessions on this day.")
+    
+    def page(self, offset):
+        """Show the previous or next month"""
+        self.year, self.month = shift_month(self.year, self.month, offset)
+        self.show_month()
+    
+    def go_to_today(self):
+        today = date.today()
+        self.year, self.month = today.year, today.month
+        self.show_month()
+        self.open_day(today)
+    
+    def refresh(self):
+        """Re-read the shown month and opened day after sessions changed elsewhere"""
+        self.show_month()
+        self.open_day(self.selected_day)
+    
+    def show_month(self):
+        """Label the day cells with this month's session counts"""
+        self.month_label.configure(text=f"{calendar.month_name[self.month]} {self.year}")
+        counts = self.calendar.month_counts(self.role, self.user_id, self.year, self.month)
+        
+        weeks = calendar.Calendar().monthdatescalendar(self.year, self.month)
+        days = [day for week in weeks for day in week]
+        # Pad short months with the following days so the grid keeps its size
+        while len(days) < len(self.day_buttons):
+            days.append(days[-1] + timedelta(days=1))
+        
+        today = date.today()
+        for day_button, day in zip(self.day_buttons, days):
+            if day.month != self.month:
+                day_button.configure(text=str(day.day), state="disabled", fg_color="transparent", border_width=0)
+                continue
+            
+            day_counts = counts.get(day, {})
+            active = sum(day_counts.values()) - day_counts.get('cancelled', 0)
+            text = f"{day.day}\n{active} session{'s' if active != 1 else ''}" if active else str(day.day)
+            day_button.configure(
+                text=text,
+                state="normal",
+                fg_color=("#3B8ED0", "#1F6AA5") if active else ("gray75", "gray30"),
+                border_width=2 if day == today else 0,
+                border_color=("gray10", "gray90"),
+                command=lambda d=day: self.open_day(d)
+            )
+    
+    def open_day(self, day):
+        """Load and list the sessions of one day"""
+        self.selected_day = day
+        self.day_title.configure(text=day.strftime('Sessions on %A, %B %d, %Y'))
+        day_start = datetime.combine(day, datetime.min.time())
+        if self.role == 'trainer':
+            sessions = Session.between(self.user_id, day_start, day_start + timedelta(days=1))
+        else:
+            sessions = Session.between(None, day_start, day_start + timedelta(days=1), member_id=self.user_id)
+        self.day_cards.show(sessions)
\ No newline at end of file
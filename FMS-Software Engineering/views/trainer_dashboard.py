@@ -7,6 +7,18 @@ from models.workout import Workout, Exercise
 from models.session import Session
 from models.notification import Notification
 from services.pdf_service import PDFService
+from services.availability_service import AvailabilityService
+from services.change_monitor import ChangeMonitor
+from services.session_calendar import SessionCalendar
+from services.task_runner import TaskRunner
+from services.name_search import NameSearch
+from views.autocomplete_entry import AutocompleteEntry
+from views.progress_history import ProgressHistory
+from views.card_pool import CardPool, repack
+from views.cards import SessionCard, NotificationCard, WorkoutExerciseCard
+from views.section_cache import SectionCache, load_async
+from views.session_calendar_view import SessionCalendarView
+from views.action_button import ActionButton
 import json
 
 class TrainerDashboard:
@@ -16,6 +28,8 @@ class TrainerDashboard:
         self.logout_callback = logout_callback
         self.user = User.get_by_id(user_data['id'])
         self.trainer_profile = TrainerProfile.get_by_user_id(user_data['id'])
+        self.section_task = None
+        self.session_members = {}
         
         self.setup_ui()
         self.load_dashboard_data()
@@ -39,9 +53,13 @@ class TrainerDashboard:
         # Content area
         self.content_frame = ctk.CTkFrame(self.main_frame)
         self.content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        self.sections = SectionCache(self.content_frame, view="trainer")
         
         # Show dashboard by default
         self.show_dashboard()
+        
+        # Keep the open section current with changes made from other terminals
+        self.setup_change_monitor()
     
     def setup_header(self):
         """Setup header with trainer info and notifications"""
@@ -62,19 +80,18 @@ class TrainerDashboard:
         button_frame.pack(side="right", padx=20, pady=20)
         
         # Notifications button
-        self.notifications_count = len(Notification.get_by_user_id(self.user.id, unread_only=True))
-        notif_text = f"Notifications ({self.notifications_count})" if self.notifications_count > 0 else "Notifications"
-        
-        self.notifications_button = ctk.CTkButton(
+        self.notifications_count = None
+        self.notifications_button = ActionButton(
             button_frame,
-            text=notif_text,
+            text="Notifications",
             width=120,
             command=self.show_notifications
         )
         self.notifications_button.pack(side="left", padx=(0, 10))
+        self.refresh_notification_badge()
         
         # Theme toggle
-        self.theme_button = ctk.CTkButton(
+        self.theme_button = ActionButton(
             button_frame,
             text="🌙",
             width=40,
@@ -83,7 +100,7 @@ class TrainerDashboard:
         self.theme_button.pack(side="left", padx=(0, 10))
         
         # Logout button
-        logout_button = ctk.CTkButton(
+        logout_button = ActionButton(
             button_frame,
             text="Logout",
             width=80,
@@ -104,6 +121,7 @@ class TrainerDashboard:
             ("🏠 Dashboard", self.show_dashboard),
             ("👥 My Clients", self.show_clients),
             ("📅 Sessions", self.show_sessions),
+            ("📆 Calendar", self.show_calendar),
             ("💪 Create Workout", self.show_create_workout),
             ("📊 Client Progress", self.show_client_progress),
             ("📋 Reports", self.show_reports),
@@ -112,7 +130,7 @@ class TrainerDashboard:
         ]
         
         for text, command in nav_buttons:
-            button = ctk.CTkButton(
+            button = ActionButton(
                 sidebar_frame,
                 text=text,
                 width=180,
@@ -122,31 +140,60 @@ class TrainerDashboard:
             )
             button.pack(padx=10, pady=5)
     
-    def clear_content(self):
-        """Clear content frame"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def clear_content(self, section=None):
+        """Clear content frame before showing a section"""
+        # Results still loading for the previous section are no longer wanted
+        if self.section_task is not None:
+            self.section_task.cancel()
+            self.section_task = None
+        
+        # Cached sections are only hidden; anything else is destroyed
+        self.sections.clear(section)
     
     def show_dashboard(self):
         """Show trainer dashboard overview"""
-        self.clear_content()
-        
+        self.clear_content('dashboard')
+        self.sections.show('dashboard', self.build_dashboard)
+    
+    def build_dashboard(self, frame):
+        """Build the overview section"""
         # Title
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Trainer Dashboard",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=(20, 30))
         
-        # Stats cards
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        stats_frame.pack(fill="x", padx=20, pady=(0, 30))
-        
-        # Get trainer stats
+        overview_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        overview_frame.pack(fill="both", expand=True)
+        self.sections.bind(
+            overview_frame,
+            self.load_overview,
+            lambda overview: self.show_overview(overview_frame, overview),
+            key=('trainer_overview', self.user.id)
+        )
+    
+    def load_overview(self):
+        """Query the overview figures and today's schedule (worker thread)"""
         my_clients = self.get_trainer_clients()
         my_sessions = Session.get_by_trainer_id(self.user.id)
         upcoming_sessions = Session.get_upcoming_sessions(self.user.id, 'trainer')
+        
+        # Today's sessions (an indexed range scan over today's start times)
+        today = datetime.combine(datetime.now().date(), datetime.min.time())
+        today_sessions = Session.between(self.user.id, today, today + timedelta(days=1), status='scheduled')
+        return my_clients, my_sessions, upcoming_sessions, today_sessions
+    
+    def show_overview(self, parent, overview):
+        """Build the overview stats and today's schedule"""
+        my_clients, my_sessions, upcoming_sessions, today_sessions = overview
+        clients_by_id = {client.id: client for client in my_clients}
+        
+        # Stats cards
+        stats_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        stats_frame.pack(fill="x", padx=20, pady=(0, 30))
+        
         total_revenue = sum(s.price for s in my_sessions if s.price and s.status == 'completed')
         
         self.create_stat_card(stats_frame, "Total Clients", str(len(my_clients)), "👥").pack(side="left", padx=10, fill="x", expand=True)
@@ -155,7 +202,7 @@ class TrainerDashboard:
         self.create_stat_card(stats_frame, "Total Revenue", f"${total_revenue:.2f}", "💰").pack(side="left", padx=10, fill="x", expand=True)
         
         # Today's schedule
-        schedule_frame = ctk.CTkFrame(self.content_frame)
+        schedule_frame = ctk.CTkFrame(parent)
         schedule_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         schedule_title = ctk.CTkLabel(
@@ -165,16 +212,12 @@ class TrainerDashboard:
         )
         schedule_title.pack(pady=20)
         
-        # Today's sessions
-        today = datetime.now().date()
-        today_sessions = [s for s in upcoming_sessions if s.session_date and s.session_date.startswith(today.strftime('%Y-%m-%d'))]
-        
         if today_sessions:
             for session in today_sessions:
                 session_frame = ctk.CTkFrame(schedule_frame)
                 session_frame.pack(fill="x", padx=20, pady=5)
                 
-                member = User.get_by_id(session.member_id)
+                member = clients_by_id.get(session.member_id)
                 
                 session_info = ctk.CTkLabel(
                     session_frame,
@@ -183,7 +226,7 @@ class TrainerDashboard:
                 )
                 session_info.pack(side="left", padx=20, pady=15)
                 
-                complete_button = ctk.CTkButton(
+                complete_button = ActionButton(
                     session_frame,
                     text="Mark Complete",
                     width=120,
@@ -224,10 +267,13 @@ class TrainerDashboard:
     
     def show_clients(self):
         """Show trainer's clients"""
-        self.clear_content()
-        
+        self.clear_content('clients')
+        self.sections.show('clients', self.build_clients)
+    
+    def build_clients(self, frame):
+        """Build the clients section"""
         # Title and add client button
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -238,11 +284,18 @@ class TrainerDashboard:
         title_label.pack(side="left")
         
         # Clients list
-        clients_frame = ctk.CTkScrollableFrame(self.content_frame)
+        clients_frame = ctk.CTkScrollableFrame(frame)
         clients_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        clients = self.get_trainer_clients()
-        
+        self.sections.bind(
+            clients_frame,
+            self.get_trainer_clients,
+            lambda clients: self.show_client_list(clients_frame, clients),
+            key=('trainer_clients', self.user.id)
+        )
+    
+    def show_client_list(self, clients_frame, clients):
+        """List the trainer's clients"""
         if clients:
             for client in clients:
                 client_card = ctk.CTkFrame(clients_frame)
@@ -281,7 +334,7 @@ class TrainerDashboard:
                 button_frame = ctk.CTkFrame(client_card, fg_color="transparent")
                 button_frame.pack(fill="x", padx=20, pady=(0, 15))
                 
-                view_progress_button = ctk.CTkButton(
+                view_progress_button = ActionButton(
                     button_frame,
                     text="View Progress",
                     width=120,
@@ -289,7 +342,7 @@ class TrainerDashboard:
                 )
                 view_progress_button.pack(side="left", padx=(0, 10))
                 
-                create_workout_button = ctk.CTkButton(
+                create_workout_button = ActionButton(
                     button_frame,
                     text="Create Workout",
                     width=120,
@@ -307,10 +360,13 @@ class TrainerDashboard:
     
     def show_sessions(self):
         """Show trainer's sessions"""
-        self.clear_content()
-        
+        self.clear_content('sessions')
+        self.sections.show('sessions', self.build_sessions)
+    
+    def build_sessions(self, frame):
+        """Build the sessions section"""
         # Title and session management
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(frame, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=20)
         
         title_label = ctk.CTkLabel(
@@ -321,124 +377,117 @@ class TrainerDashboard:
         title_label.pack(side="left")
         
         # Sessions list
-        sessions_frame = ctk.CTkScrollableFrame(self.content_frame)
+        sessions_frame = ctk.CTkScrollableFrame(frame)
         sessions_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        sessions = Session.get_by_trainer_id(self.user.id)
-        
-        if sessions:
-            # Group by status
-            upcoming = [s for s in sessions if s.status == 'scheduled']
-            completed = [s for s in sessions if s.status == 'completed']
-            
-            # Show upcoming sessions first
-            if upcoming:
-                upcoming_label = ctk.CTkLabel(
-                    sessions_frame,
-                    text="Upcoming Sessions",
-                    font=ctk.CTkFont(size=18, weight="bold")
-                )
-                upcoming_label.pack(anchor="w", pady=(20, 10))
-                
-                for session in upcoming:
-                    self.create_session_card(sessions_frame, session, is_trainer=True)
-            
-            # Show completed sessions
-            if completed:
-                completed_label = ctk.CTkLabel(
-                    sessions_frame,
-                    text="Recent Completed Sessions",
-                    font=ctk.CTkFont(size=18, weight="bold")
-                )
-                completed_label.pack(anchor="w", pady=(20, 10))
-                
-                for session in completed[:10]:  # Show last 10 completed
-                    self.create_session_card(sessions_frame, session, is_trainer=True)
-        else:
-            no_sessions_label = ctk.CTkLabel(
-                sessions_frame,
-                text="No training sessions yet.",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            )
-            no_sessions_label.pack(pady=50)
-    
-    def create_session_card(self, parent, session, is_trainer=False):
-        """Create a session card widget"""
-        card = ctk.CTkFrame(parent)
-        card.pack(fill="x", pady=5, padx=10)
-        
-        # Session info
-        info_frame = ctk.CTkFrame(card, fg_color="transparent")
-        info_frame.pack(fill="x", padx=20, pady=15)
-        
-        # Status indicator
-        status_colors = {
-            'scheduled': 'green',
-            'completed': 'blue',
-            'cancelled': 'red'
-        }
-        
-        status_label = ctk.CTkLabel(
-            info_frame,
-            text=f"● {session.status.title()}",
-            text_color=status_colors.get(session.status, 'gray')
+        # Upcoming sessions first, then recent completed ones; their cards are reused across reloads
+        upcoming_frame = ctk.CTkFrame(sessions_frame, fg_color="transparent")
+        upcoming_label = ctk.CTkLabel(
+            upcoming_frame,
+            text="Upcoming Sessions",
+            font=ctk.CTkFont(size=18, weight="bold")
         )
-        status_label.pack(side="left")
+        upcoming_label.pack(anchor="w", pady=(20, 10))
+        self.upcoming_cards = CardPool(upcoming_frame, self.new_session_card)
         
-        # Get member info
-        member = User.get_by_id(session.member_id)
-        client_name = member.full_name if member else "Unknown Client"
+        completed_frame = ctk.CTkFrame(sessions_frame, fg_color="transparent")
+        completed_label = ctk.CTkLabel(
+            completed_frame,
+            text="Recent Completed Sessions",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        completed_label.pack(anchor="w", pady=(20, 10))
+        self.completed_cards = CardPool(completed_frame, self.new_session_card)
         
-        # Session info
-        session_info = f"{client_name} - {session.session_type or 'Training Session'}"
-        if session.session_date:
-            session_info += f" - {session.session_date}"
+        self.no_sessions_label = ctk.CTkLabel(
+            sessions_frame,
+            text="No training sessions yet.",
+            font=ctk.CTkFont(size=16),
+            text_color="gray"
+        )
+        self.session_groups = [
+            (upcoming_frame, {"fill": "x"}),
+            (completed_frame, {"fill": "x"}),
+            (self.no_sessions_label, {"pady": 50})
+        ]
         
-        info_label = ctk.CTkLabel(
-            info_frame,
-            text=session_info,
-            font=ctk.CTkFont(size=14)
+        self.session_cards = {}
+        self.sections.bind(
+            sessions_frame,
+            self.load_sessions,
+            lambda result: self.show_session_list(*result),
+            key=('trainer_sessions', self.user.id),
+            clear=False
         )
-        info_label.pack(side="left", padx=(20, 0))
-        
-        # Price
-        if session.price:
-            price_label = ctk.CTkLabel(
-                info_frame,
-                text=f"${session.price:.2f}",
-                font=ctk.CTkFont(weight="bold")
-            )
-            price_label.pack(side="right")
+    
+    def load_sessions(self):
+        """Query the trainer's sessions and their members (worker thread)"""
+        sessions = Session.get_by_trainer_id(self.user.id)
+        members = {}
+        for member_id in set(s.member_id for s in sessions if s.member_id):
+            members[member_id] = User.get_by_id(member_id)
+        return sessions, members
+    
+    def show_session_list(self, sessions, members):
+        """List sessions grouped by status"""
+        self.session_members = members
+        
+        # Group by status
+        upcoming = [s for s in sessions if s.status == 'scheduled']
+        completed = [s for s in sessions if s.status == 'completed']
+        
+        self.upcoming_cards.show(upcoming)
+        self.completed_cards.show(completed[:10])  # Show last 10 completed
+        
+        # Cards the change monitor patches in place
+        self.session_cards = {**self.upcoming_cards.cards, **self.completed_cards.cards}
+        
+        shown = []
+        if upcoming:
+            shown.append(self.upcoming_cards.parent)
+        if completed:
+            shown.append(self.completed_cards.parent)
+        if not sessions:
+            shown.append(self.no_sessions_label)
+        repack(self.session_groups, shown)
+    
+    def show_calendar(self):
+        """Show sessions on a month calendar"""
+        self.clear_content('calendar')
+        self.sections.show('calendar', self.build_calendar)
+    
+    def build_calendar(self, frame):
+        """Build the calendar section"""
+        title_label = ctk.CTkLabel(
+            frame,
+            text="Session Calendar",
+            font=ctk.CTkFont(size=24, weight="bold")
+        )
+        title_label.pack(anchor="w", padx=20, pady=20)
         
-        # Action buttons for trainer
-        if is_trainer and session.status == 'scheduled':
-            button_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            button_frame.pack(side="right", padx=(0, 20))
-            
-            complete_button = ctk.CTkButton(
-                button_frame,
-                text="Complete",
-                width=80,
-                fg_color="green",
-                hover_color="dark green",
-                command=lambda s=session: self.complete_session(s)
-            )
-            complete_button.pack(side="left", padx=(0, 5))
-            
-            cancel_button = ctk.CTkButton(
-                button_frame,
-                text="Cancel",
-                width=80,
-                fg_color="red",
-                hover_color="dark red",
-                command=lambda s=session: self.cancel_session(s)
-            )
-            cancel_button.pack(side="left")
+        self.calendar_view = SessionCalendarView(frame, self.user.id, 'trainer', self.new_session_card)
+        self.sections.on_show(self.calendar_view.refresh)
+    
+    def new_session_card(self, parent):
+        """Create a reusable session card"""
+        return SessionCard(
+            parent,
+            on_cancel=self.cancel_session,
+            on_complete=self.complete_session,
+            client_name=self.client_name
+        )
+    
+    def client_name(self, session):
+        """Get the client name shown on a session card"""
+        # Members are preloaded when listing many sessions
+        member = self.session_members.get(session.member_id)
+        if member is None:
+            member = User.get_by_id(session.member_id)
+        return member.full_name if member else "Unknown Client"
     
     def show_create_workout(self):
         """Show workout creation interface"""
-        self.clear_content()
+        self.clear_content('create_workout')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -455,13 +504,11 @@ class TrainerDashboard:
         client_label = ctk.CTkLabel(form_frame, text="Select Client")
         client_label.pack(anchor="w", padx=20, pady=(20, 5))
         
-        clients = self.get_trainer_clients()
-        client_names = [f"{client.full_name} (ID: {client.id})" for client in clients]
-        
-        self.client_menu = ctk.CTkOptionMenu(
+        self.client_menu = AutocompleteEntry(
             form_frame,
-            values=client_names if client_names else ["No clients available"],
-            width=400
+            search=self.search_members,
+            width=400,
+            placeholder_text="Start typing a client's name..."
         )
         self.client_menu.pack(padx=20, pady=(0, 15))
         
@@ -494,11 +541,16 @@ class TrainerDashboard:
         # Exercise list frame
         self.exercise_list_frame = ctk.CTkScrollableFrame(form_frame, height=200)
         self.exercise_list_frame.pack(fill="x", padx=20, pady=(0, 15))
+        self.exercise_rows = CardPool(
+            self.exercise_list_frame,
+            lambda parent: WorkoutExerciseCard(parent, on_remove=self.remove_exercise),
+            by_position=True
+        )
         
         self.selected_exercises = []
         
         # Add exercise button
-        add_exercise_button = ctk.CTkButton(
+        add_exercise_button = ActionButton(
             form_frame,
             text="+ Add Exercise",
             command=self.add_exercise_to_workout
@@ -506,7 +558,7 @@ class TrainerDashboard:
         add_exercise_button.pack(pady=10)
         
         # Save workout button
-        save_workout_button = ctk.CTkButton(
+        save_workout_button = ActionButton(
             form_frame,
             text="Save Workout Plan",
             width=200,
@@ -516,49 +568,68 @@ class TrainerDashboard:
     
     def show_client_progress(self):
         """Show client progress tracking"""
-        self.clear_content()
-        
+        self.clear_content('client_progress')
+        self.sections.show('client_progress', self.build_client_progress)
+    
+    def build_client_progress(self, frame):
+        """Build the client progress section"""
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Client Progress Tracking",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=20)
         
         # Client selection
-        client_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        client_frame = ctk.CTkFrame(frame, fg_color="transparent")
         client_frame.pack(fill="x", padx=20, pady=(0, 20))
         
         client_label = ctk.CTkLabel(client_frame, text="Select Client:")
         client_label.pack(side="left", padx=(0, 10))
         
-        clients = self.get_trainer_clients()
-        client_names = [f"{client.full_name} (ID: {client.id})" for client in clients]
-        
+        self.progress_clients = None  # Menu entry -> client, once loaded
         self.progress_client_menu = ctk.CTkOptionMenu(
             client_frame,
-            values=client_names if client_names else ["No clients available"],
+            values=["Loading clients..."],
             width=300,
+            state="disabled",
             command=self.load_client_progress
         )
         self.progress_client_menu.pack(side="left")
         
         # Progress display area
-        self.progress_display_frame = ctk.CTkFrame(self.content_frame)
+        self.progress_display_frame = ctk.CTkFrame(frame)
         self.progress_display_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        # Initial message
-        initial_label = ctk.CTkLabel(
+        self.sections.bind(
             self.progress_display_frame,
-            text="Select a client to view their progress",
-            font=ctk.CTkFont(size=16),
-            text_color="gray"
+            self.get_trainer_clients,
+            self.show_progress_clients,
+            key=('trainer_clients', self.user.id),
+            clear=False
         )
-        initial_label.pack(expand=True, pady=50)
+    
+    def show_progress_clients(self, clients):
+        """Offer the trainer's clients in the progress menu"""
+        first_load = self.progress_clients is None
+        self.progress_clients = {f"{client.full_name} (ID: {client.id})": client for client in clients}
+        client_names = list(self.progress_clients) or ["No clients available"]
+        self.progress_client_menu.configure(values=client_names, state="normal")
+        if self.progress_client_menu.get() not in client_names:
+            self.progress_client_menu.set(client_names[0])
+        
+        if first_load:
+            initial_label = ctk.CTkLabel(
+                self.progress_display_frame,
+                text="Select a client to view their progress",
+                font=ctk.CTkFont(size=16),
+                text_color="gray"
+            )
+            initial_label.pack(expand=True, pady=50)
     
     def show_reports(self):
         """Show trainer reports"""
-        self.clear_content()
+        self.clear_content('reports')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -575,7 +646,7 @@ class TrainerDashboard:
         button_frame = ctk.CTkFrame(reports_frame, fg_color="transparent")
         button_frame.pack(pady=30)
         
-        client_report_button = ctk.CTkButton(
+        client_report_button = ActionButton(
             button_frame,
             text="📄 Generate Client Report",
             width=200,
@@ -584,7 +655,7 @@ class TrainerDashboard:
         )
         client_report_button.pack(pady=10)
         
-        session_report_button = ctk.CTkButton(
+        session_report_button = ActionButton(
             button_frame,
             text="📊 Generate Session Report",
             width=200,
@@ -593,7 +664,7 @@ class TrainerDashboard:
         )
         session_report_button.pack(pady=10)
         
-        revenue_report_button = ctk.CTkButton(
+        revenue_report_button = ActionButton(
             button_frame,
             text="💰 Generate Revenue Report",
             width=200,
@@ -604,7 +675,7 @@ class TrainerDashboard:
     
     def show_profile(self):
         """Show trainer profile management"""
-        self.clear_content()
+        self.clear_content('profile')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -697,7 +768,7 @@ class TrainerDashboard:
         self.bio_textbox.pack(side="left", fill="x", expand=True)
         
         # Save button
-        save_button = ctk.CTkButton(
+        save_button = ActionButton(
             profile_frame,
             text="Save Profile",
             command=self.save_trainer_profile
@@ -706,76 +777,92 @@ class TrainerDashboard:
     
     def show_notifications(self):
         """Show notifications"""
-        self.clear_content()
-        
+        self.clear_content('notifications')
+        self.sections.show('notifications', self.build_notifications)
+    
+    def build_notifications(self, frame):
+        """Build the notifications section"""
         title_label = ctk.CTkLabel(
-            self.content_frame,
+            frame,
             text="Notifications",
             font=ctk.CTkFont(size=24, weight="bold")
         )
         title_label.pack(pady=20)
         
-        # Mark all as read button
-        mark_read_button = ctk.CTkButton(
-            self.content_frame,
+        # Mark all as read and archive search
+        actions_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        actions_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        mark_read_button = ActionButton(
+            actions_frame,
             text="Mark All as Read",
             command=self.mark_all_notifications_read
         )
-        mark_read_button.pack(pady=(0, 20))
+        mark_read_button.pack(side="left")
+        
+        archive_entry = ctk.CTkEntry(actions_frame, placeholder_text="Search older notifications...", width=250)
+        archive_button = ActionButton(
+            actions_frame,
+            text="Search Archive",
+            width=120,
+            command=lambda: self.show_archived_notifications(archive_entry.get())
+        )
+        archive_button.pack(side="right")
+        archive_entry.pack(side="right", padx=(0, 10))
+        archive_entry.bind("<Return>", lambda event: self.show_archived_notifications(archive_entry.get()))
         
         # Notifications list
-        notifications_frame = ctk.CTkScrollableFrame(self.content_frame)
+        notifications_frame = ctk.CTkScrollableFrame(frame)
         notifications_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        notifications = Notification.get_by_user_id(self.user.id)
+        self.notification_cards = CardPool(notifications_frame, NotificationCard, empty_text="No notifications yet.")
+        self.sections.bind(
+            notifications_frame,
+            lambda: Notification.get_by_user_id(self.user.id),
+            self.notification_cards.show,
+            key=('notifications', self.user.id),
+            clear=False
+        )
+    
+    def show_archived_notifications(self, query):
+        """Show archived notifications matching a search"""
+        self.clear_content('archived_notifications')
         
-        if notifications:
-            for notification in notifications:
-                notif_card = ctk.CTkFrame(notifications_frame)
-                notif_card.pack(fill="x", pady=5, padx=10)
-                
-                # Notification header
-                header_frame = ctk.CTkFrame(notif_card, fg_color="transparent")
-                header_frame.pack(fill="x", padx=20, pady=15)
-                
-                title_text = notification.title
-                if not notification.is_read:
-                    title_text = "🔵 " + title_text
-                
-                notif_title = ctk.CTkLabel(
-                    header_frame,
-                    text=title_text,
-                    font=ctk.CTkFont(size=14, weight="bold")
-                )
-                notif_title.pack(side="left")
-                
-                notif_date = ctk.CTkLabel(
-                    header_frame,
-                    text=notification.created_at[:10] if notification.created_at else "",
-                    text_color="gray"
-                )
-                notif_date.pack(side="right")
-                
-                # Notification message
-                message_label = ctk.CTkLabel(
-                    notif_card,
-                    text=notification.message,
-                    wraplength=600,
-                    justify="left"
-                )
-                message_label.pack(anchor="w", padx=20, pady=(0, 15))
-        else:
-            no_notif_label = ctk.CTkLabel(
-                notifications_frame,
-                text="No notifications yet.",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            )
-            no_notif_label.pack(pady=50)
+        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=20, pady=20)
+        
+        title_label = ctk.CTkLabel(
+            header_frame,
+            text="Archived Notifications",
+            font=ctk.CTkFont(size=24, weight="bold")
+        )
+        title_label.pack(side="left")
+        
+        back_button = ActionButton(
+            header_frame,
+            text="← Back",
+            width=80,
+            command=self.show_notifications
+        )
+        back_button.pack(side="right")
+        
+        results_frame = ctk.CTkScrollableFrame(self.content_frame)
+        results_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        self.section_task = load_async(
+            results_frame,
+            lambda: Notification.search_archive(self.user.id, query),
+            lambda notifications: self.show_archive_results(results_frame, notifications)
+        )
+    
+    def show_archive_results(self, results_frame, notifications):
+        """List archived notifications found by a search"""
+        archive_cards = CardPool(results_frame, NotificationCard, empty_text="No archived notifications found.")
+        archive_cards.show(notifications)
     
     def show_settings(self):
         """Show settings"""
-        self.clear_content()
+        self.clear_content('settings')
         
         title_label = ctk.CTkLabel(
             self.content_frame,
@@ -816,16 +903,7 @@ class TrainerDashboard:
     def get_trainer_clients(self):
         """Get clients assigned to this trainer (simplified - in real app would have proper assignment logic)"""
         # For demo purposes, return recent session members
-        sessions = Session.get_by_trainer_id(self.user.id)
-        member_ids = list(set([s.member_id for s in sessions if s.member_id]))
-        
-        clients = []
-        for member_id in member_ids:
-            member = User.get_by_id(member_id)
-            if member:
-                clients.append(member)
-        
-        return clients
+        return User.get_by_ids(Session.member_ids_for_trainer(self.user.id))
     
     def complete_session(self, session):
         """Mark session as completed"""
@@ -864,42 +942,30 @@ class TrainerDashboard:
     
     def refresh_exercise_list(self):
         """Refresh the exercise list display"""
-        # Clear current display
-        for widget in self.exercise_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Display selected exercises
-        for i, exercise in enumerate(self.selected_exercises):
-            exercise_frame = ctk.CTkFrame(self.exercise_list_frame)
-            exercise_frame.pack(fill="x", pady=2)
-            
-            exercise_label = ctk.CTkLabel(
-                exercise_frame,
-                text=f"{exercise['name']} - Sets: {exercise['sets']}, Reps: {exercise['reps']}",
-                font=ctk.CTkFont(size=12)
-            )
-            exercise_label.pack(side="left", padx=10, pady=5)
-            
-            remove_button = ctk.CTkButton(
-                exercise_frame,
-                text="Remove",
-                width=60,
-                height=25,
-                command=lambda idx=i: self.remove_exercise(idx)
-            )
-            remove_button.pack(side="right", padx=10, pady=5)
+        # Rows are matched by position, so adding or removing one only relabels the rows after it
+        self.exercise_rows.show(self.selected_exercises)
     
-    def remove_exercise(self, index):
+    def remove_exercise(self, exercise):
         """Remove exercise from workout plan"""
-        if 0 <= index < len(self.selected_exercises):
-            self.selected_exercises.pop(index)
-            self.refresh_exercise_list()
+        for index, selected in enumerate(self.selected_exercises):
+            if selected is exercise:
+                self.selected_exercises.pop(index)
+                self.refresh_exercise_list()
+                return
+    
+    def search_members(self, query, limit):
+        """Get fuzzy name matches among this trainer's clients for the client picker"""
+        client_ids = Session.member_ids_for_trainer(self.user.id)
+        return [
+            (member_id, f"{full_name} (ID: {member_id})")
+            for member_id, full_name in NameSearch.search_users(query, limit, user_type='member', user_ids=client_ids)
+        ]
     
     def save_workout_plan(self):
         """Save the workout plan"""
         # Get client ID
         client_selection = self.client_menu.get()
-        if client_selection == "No clients available":
+        if not client_selection.strip():
             messagebox.showerror("Error", "No client selected")
             return
         
@@ -909,6 +975,11 @@ class TrainerDashboard:
             messagebox.showerror("Error", "Please select a valid client")
             return
         
+        # The picker only offers clients, but the entry text can be typed freely
+        if client_id not in Session.member_ids_for_trainer(self.user.id):
+            messagebox.showerror("Error", "Please select one of your clients")
+            return
+        
         workout_name = self.workout_name_entry.get().strip()
         if not workout_name:
             messagebox.showerror("Error", "Please enter a workout name")
@@ -970,7 +1041,8 @@ class TrainerDashboard:
         for widget in self.progress_display_frame.winfo_children():
             widget.destroy()
         
-        if client_selection == "No clients available":
+        client = self.progress_clients.get(client_selection) if self.progress_clients else None
+        if client is None:
             no_data_label = ctk.CTkLabel(
                 self.progress_display_frame,
                 text="No clients available",
@@ -980,53 +1052,34 @@ class TrainerDashboard:
             no_data_label.pack(expand=True, pady=50)
             return
         
-        try:
-            client_id = int(client_selection.split("ID: ")[1].split(")")[0])
-            client = User.get_by_id(client_id)
-            
-            if not client:
-                return
-            
-            # Display client info
-            client_info_frame = ctk.CTkFrame(self.progress_display_frame)
-            client_info_frame.pack(fill="x", padx=20, pady=20)
-            
-            client_title = ctk.CTkLabel(
-                client_info_frame,
-                text=f"Progress for {client.full_name}",
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            client_title.pack(pady=15)
-            
-            # Progress placeholder (would integrate with progress_records table in full implementation)
-            progress_info = ctk.CTkLabel(
-                self.progress_display_frame,
-                text="Progress tracking data would be displayed here\nwith charts and measurements over time.",
-                font=ctk.CTkFont(size=14),
-                text_color="gray"
-            )
-            progress_info.pack(expand=True, pady=20)
-            
-        except (IndexError, ValueError):
-            error_label = ctk.CTkLabel(
-                self.progress_display_frame,
-                text="Error loading client data",
-                font=ctk.CTkFont(size=16),
-                text_color="red"
-            )
-            error_label.pack(expand=True, pady=50)
+        # Display client info
+        client_info_frame = ctk.CTkFrame(self.progress_display_frame)
+        client_info_frame.pack(fill="x", padx=20, pady=20)
+        
+        client_title = ctk.CTkLabel(
+            client_info_frame,
+            text=f"Progress for {client.full_name}",
+            font=ctk.CTkFont(size=18, weight="bold")
+        )
+        client_title.pack(pady=15)
+        
+        # Recorded progress with photos, loaded on a worker
+        ProgressHistory(self.progress_display_frame, client.id)
     
     def generate_client_report(self):
         """Generate client report PDF"""
-        try:
+        def build_pdf():
             clients = self.get_trainer_clients()
             sessions = Session.get_by_trainer_id(self.user.id)
-            
-            pdf_service = PDFService()
-            filename = pdf_service.export_trainer_report_pdf(self.user, clients, sessions)
-            messagebox.showinfo("Success", f"Client report generated: {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
+            return PDFService().export_trainer_report_pdf(self.user, clients, sessions)
+        
+        TaskRunner.instance().submit(
+            self.main_frame,
+            build_pdf,
+            on_done=lambda filename: messagebox.showinfo("Success", f"Client report generated: {filename}"),
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to generate report: {str(e)}"),
+            key=('client_report', self.user.id)
+        )
     
     def generate_session_report(self):
         """Generate session report"""
@@ -1034,13 +1087,21 @@ class TrainerDashboard:
     
     def generate_revenue_report(self):
         """Generate revenue report"""
-        sessions = Session.get_by_trainer_id(self.user.id)
-        total_revenue = sum(s.price for s in sessions if s.price and s.status == 'completed')
-        completed_sessions = len([s for s in sessions if s.status == 'completed'])
+        def show_report(sessions):
+            total_revenue = sum(s.price for s in sessions if s.price and s.status == 'completed')
+            completed_sessions = len([s for s in sessions if s.status == 'completed'])
+            
+            messagebox.showinfo(
+                "Revenue Report",
+                f"Total Completed Sessions: {completed_sessions}\nTotal Revenue: ${total_revenue:.2f}\nAverage per Session: ${total_revenue/completed_sessions if completed_sessions > 0 else 0:.2f}"
+            )
         
-        messagebox.showinfo(
-            "Revenue Report",
-            f"Total Completed Sessions: {completed_sessions}\nTotal Revenue: ${total_revenue:.2f}\nAverage per Session: ${total_revenue/completed_sessions if completed_sessions > 0 else 0:.2f}"
+        TaskRunner.instance().submit(
+            self.main_frame,
+            Session.get_by_trainer_id,
+            self.user.id,
+            on_done=show_report,
+            key=('trainer_revenue', self.user.id)
         )
     
     def save_trainer_profile(self):
@@ -1076,14 +1137,63 @@ class TrainerDashboard:
     def mark_all_notifications_read(self):
         """Mark all notifications as read"""
         Notification.mark_all_as_read(self.user.id)
-        self.notifications_count = 0
-        self.notifications_button.configure(text="Notifications")
+        self.update_notification_badge(0)
         self.show_notifications()  # Refresh view
     
+    def refresh_notification_badge(self):
+        """Update the unread count on the notifications button"""
+        self.update_notification_badge(Notification.unread_count(self.user.id))
+    
+    def update_notification_badge(self, count):
+        # Only touch the widget when the count actually changed
+        if count == self.notifications_count:
+            return
+        self.notifications_count = count
+        notif_text = f"Notifications ({count})" if count > 0 else "Notifications"
+        self.notifications_button.configure(text=notif_text)
+    
+    def setup_change_monitor(self):
+        """Watch for sessions and notifications written by other terminals"""
+        self.change_monitor = ChangeMonitor(self.parent)
+        self.change_monitor.watch('sessions', 'change_seq', 'trainer_id', self.user.id, self.on_sessions_changed)
+        self.change_monitor.watch('notifications', 'id', 'user_id', self.user.id, self.on_notifications_added)
+        # Also catches notifications read elsewhere; the badge is one key lookup
+        self.change_monitor.on_change(self.refresh_notification_badge)
+        self.change_monitor.start()
+    
+    def on_sessions_changed(self, rows):
+        """Patch the open section with sessions booked or changed since the last check"""
+        sessions = [Session.from_row(row) for row in rows]
+        for session in sessions:
+            AvailabilityService.invalidate(session.session_date)
+        SessionCalendar.invalidate()
+        
+        # Hidden sections reload when they are next shown
+        section = self.sections.current
+        if section == 'calendar':
+            self.calendar_view.refresh()
+        elif section == 'sessions' and self.session_cards and all(session.id in self.session_cards for session in sessions):
+            # Status or time changes of listed sessions: reconfigure just those cards
+            for session in sessions:
+                self.session_cards[session.id].show(session)
+        elif section in ('dashboard', 'sessions'):
+            # New sessions move the lists and counts around, so reload the section
+            self.sections.refresh()
+    
+    def on_notifications_added(self, rows):
+        """Put new notifications at the top of the open notifications list"""
+        if self.sections.current != 'notifications':
+            return
+        
+        # Rows come oldest first; the cards already listed are kept as they are
+        added = [Notification.from_row(row) for row in reversed(rows)]
+        self.notification_cards.show(added + self.notification_cards.items())
+    
     def load_dashboard_data(self):
         """Load dashboard data"""
         pass
     
     def destroy(self):
         """Clean up the dashboard"""
+        self.change_monitor.stop()
         self.main_frame.destroy()
\ No newline at end of file